@@ -11,9 +11,12 @@ Extended to support:
 """
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Tuple
 from dataclasses import dataclass, field
 
 from langchain_community.document_loaders import (
@@ -30,6 +33,7 @@ from tqdm import tqdm
 from config.settings import get_settings
 from core.logger import get_logger
 from core.exceptions import DocumentLoadError
+from ingestion.metadata_cache import DocumentMetadataCache
 
 # Import knowledge classification components
 try:
@@ -42,6 +46,18 @@ except ImportError:
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_knowledge_components() -> Tuple["KnowledgeClassifier", "DecisionParser"]:
+    """
+    Get the classifier and decision parser shared by all loaders in this process.
+    
+    Both are stateless after construction, so building them (and compiling
+    their regex patterns) once lets every DocumentLoader, e.g. one per
+    backend ingestion request, reuse the same instances.
+    """
+    return KnowledgeClassifier(), DecisionParser()
+
+
 @dataclass
 class LoaderConfig:
     """Configuration for a document loader."""
@@ -94,12 +110,27 @@ class DocumentLoader:
         ),
     ]
     
+    # Loader dispatch for single-file loads, keyed by file extension
+    _EXT_DISPATCH: Dict[str, type] = {
+        ".pdf": PyPDFLoader,
+        ".txt": TextLoader,
+        ".md": TextLoader,
+        ".csv": CSVLoader,
+    }
+    
+    # Globs of the form "**/*.ext" are served from a single directory walk
+    _EXTENSION_GLOB = re.compile(r"^\*\*/\*(\.[^*?\[\]/]+)$")
+    
+    # Number of files parsed concurrently
+    MAX_LOAD_WORKERS = 4
+    
     def __init__(
         self,
         data_dir: Optional[str] = None,
         custom_loaders: Optional[List[LoaderConfig]] = None,
         show_progress: bool = True,
         enable_knowledge_classification: bool = True,
+        metadata_cache_path: Optional[str] = None,
     ):
         """
         Initialize the document loader.
@@ -109,6 +140,9 @@ class DocumentLoader:
             custom_loaders: Additional loader configurations to use.
             show_progress: Whether to show progress bar during loading.
             enable_knowledge_classification: Whether to classify documents by knowledge type.
+            metadata_cache_path: Optional SQLite file used to cache enriched documents
+                                 per source file, so unchanged files are not
+                                 re-classified on re-ingest.
         """
         self.settings = get_settings()
         self.data_dir = Path(data_dir or self.settings.DATA_DIR)
@@ -123,13 +157,17 @@ class DocumentLoader:
         
         # Initialize classifiers if enabled
         if self.enable_knowledge_classification:
-            self._knowledge_classifier = KnowledgeClassifier()
-            self._decision_parser = DecisionParser()
+            self._knowledge_classifier, self._decision_parser = _get_knowledge_components()
             logger.info("Knowledge classification enabled for document loading")
         else:
             self._knowledge_classifier = None
             self._decision_parser = None
         
+        # Optional cache of enriched documents keyed by (path, mtime, size)
+        self._metadata_cache = (
+            DocumentMetadataCache(metadata_cache_path) if metadata_cache_path else None
+        )
+        
         # Combine default and custom loaders
         self.loaders = self.DEFAULT_LOADERS.copy()
         if custom_loaders:
@@ -150,13 +188,13 @@ class DocumentLoader:
                 f"Path is not a directory: {self.data_dir}",
                 details={"path": str(self.data_dir)}
             )
-        
-        # Check if directory has any files
-        file_count = sum(1 for _ in self.data_dir.rglob("*") if _.is_file())
-        if file_count == 0:
-            logger.warning(f"Data directory is empty: {self.data_dir}")
     
-    def _extract_metadata(self, doc: Document, source_type: str) -> Dict[str, Any]:
+    def _extract_metadata(
+        self,
+        doc: Document,
+        source_type: str,
+        ingestion_timestamp: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Extract and enrich metadata from a document.
         
@@ -166,28 +204,33 @@ class DocumentLoader:
         Args:
             doc: The document to extract metadata from.
             source_type: Type of the source file.
+            ingestion_timestamp: Shared timestamp for a batch of documents.
+                                 Defaults to the current time.
             
         Returns:
             Enriched metadata dictionary including knowledge_type and decision metadata.
         """
         source_path = Path(doc.metadata.get("source", ""))
+        file_name = source_path.name
+        source_str = str(source_path)
         
         metadata = {
             **doc.metadata,
             "source_type": source_type,
-            "file_name": source_path.name if source_path else "",
-            "file_extension": source_path.suffix if source_path else "",
-            "ingestion_timestamp": datetime.now().isoformat(),
+            "file_name": file_name,
+            "file_extension": source_path.suffix,
+            "ingestion_timestamp": ingestion_timestamp or datetime.now().isoformat(),
         }
         
-        # Extract file stats if available
-        if source_path and source_path.exists():
+        # Extract file stats if available (single stat() instead of exists() + stat())
+        try:
             stat = source_path.stat()
-            metadata.update({
-                "file_size_bytes": stat.st_size,
-                "file_modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "file_created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-            })
+        except OSError:
+            stat = None
+        if stat is not None:
+            metadata["file_size_bytes"] = stat.st_size
+            metadata["file_modified"] = datetime.fromtimestamp(stat.st_mtime).isoformat()
+            metadata["file_created"] = datetime.fromtimestamp(stat.st_ctime).isoformat()
         
         # Extract directory structure as potential category
         if source_path:
@@ -198,12 +241,13 @@ class DocumentLoader:
                 metadata["department"] = parts[0] if parts else "general"
         
         # === KNOWLEDGE CLASSIFICATION (Feature 1 & 2) ===
-        if self.enable_knowledge_classification and self._knowledge_classifier:
+        classifier = self._knowledge_classifier
+        if classifier is not None:
             try:
                 # Classify the document
-                classification = self._knowledge_classifier.classify(
-                    filename=source_path.name if source_path else None,
-                    filepath=str(source_path) if source_path else None,
+                classification = classifier.classify(
+                    filename=file_name or None,
+                    filepath=source_str or None,
                     content=doc.page_content,
                 )
                 
@@ -211,23 +255,24 @@ class DocumentLoader:
                 metadata.update(classification.to_metadata())
                 
                 # If it's a decision document, extract decision metadata
-                if classification.knowledge_type.value == "decision" and self._decision_parser:
-                    decision_meta = self._decision_parser.parse(
+                parser = self._decision_parser
+                if classification.knowledge_type.value == "decision" and parser is not None:
+                    decision_meta = parser.parse(
                         content=doc.page_content,
-                        filename=source_path.name if source_path else None,
-                        filepath=str(source_path) if source_path else None,
+                        filename=file_name or None,
+                        filepath=source_str or None,
                     )
                     
                     # Add decision metadata
                     metadata.update(decision_meta.to_metadata())
                     
                     logger.debug(
-                        f"Decision metadata extracted from {source_path.name}: "
+                        f"Decision metadata extracted from {file_name}: "
                         f"confidence={decision_meta.extraction_confidence:.2f}"
                     )
                 
                 logger.debug(
-                    f"Classified '{source_path.name}' as {classification.knowledge_type.value} "
+                    f"Classified '{file_name}' as {classification.knowledge_type.value} "
                     f"(confidence: {classification.confidence:.2f})"
                 )
                 
@@ -243,6 +288,175 @@ class DocumentLoader:
         
         return metadata
     
+    def _enrich_documents(self, docs: List[Document], source_type: str) -> List[Document]:
+        """
+        Enrich loaded documents with metadata, reusing cached results when possible.
+        
+        Documents are grouped by source file; when a metadata cache is configured
+        and the file's (mtime, size) is unchanged, the cached enriched documents
+        are returned instead of re-running metadata extraction.
+        
+        Args:
+            docs: Documents as returned by a loader.
+            source_type: Type of the source files.
+            
+        Returns:
+            List of enriched documents.
+        """
+        extract_metadata = self._extract_metadata
+        ingestion_timestamp = datetime.now().isoformat()
+        cache = self._metadata_cache
+        
+        if cache is None:
+            for doc in docs:
+                doc.metadata = extract_metadata(doc, source_type, ingestion_timestamp)
+            return docs
+        
+        # Group pages by source file so cache entries cover whole files
+        docs_by_source: Dict[str, List[Document]] = {}
+        for doc in docs:
+            docs_by_source.setdefault(doc.metadata.get("source", ""), []).append(doc)
+        
+        enriched: List[Document] = []
+        for source, file_docs in docs_by_source.items():
+            try:
+                stat = os.stat(source)
+            except OSError:
+                stat = None
+            
+            if stat is not None:
+                cached = cache.get(source, stat.st_mtime, stat.st_size)
+                if cached is not None:
+                    enriched.extend(cached)
+                    continue
+            
+            enriched.extend(
+                self._enrich_file_documents(
+                    file_docs, source, stat, source_type, ingestion_timestamp
+                )
+            )
+        
+        return enriched
+    
+    def _enrich_file_documents(
+        self,
+        file_docs: List[Document],
+        source: str,
+        stat: Optional[os.stat_result],
+        source_type: str,
+        ingestion_timestamp: str,
+    ) -> List[Document]:
+        """Enrich the documents of one source file and store them in the cache."""
+        extract_metadata = self._extract_metadata
+        for doc in file_docs:
+            doc.metadata = extract_metadata(doc, source_type, ingestion_timestamp)
+        
+        if self._metadata_cache is not None and stat is not None:
+            self._metadata_cache.put(source, stat.st_mtime, stat.st_size, file_docs)
+        
+        return file_docs
+    
+    def _scan_data_directory(self) -> Dict[str, List[Tuple[str, os.stat_result]]]:
+        """
+        Walk the data directory once and bucket files by extension.
+        
+        Hidden files and directories are skipped, and symlinked directories
+        are not followed, matching DirectoryLoader.
+        
+        Returns:
+            Mapping of file extension to (path, stat) pairs.
+        """
+        files_by_extension: Dict[str, List[Tuple[str, os.stat_result]]] = {}
+        pending = [str(self.data_dir)]
+        
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith("."):
+                            continue
+                        # rglob does not descend into symlinked directories
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            extension = os.path.splitext(entry.name)[1]
+                            files_by_extension.setdefault(extension, []).append(
+                                (entry.path, entry.stat())
+                            )
+            except OSError as e:
+                logger.warning(f"Failed to scan directory {directory}: {e}")
+        
+        return files_by_extension
+    
+    def _load_files(
+        self,
+        loader_config: LoaderConfig,
+        files: List[Tuple[str, os.stat_result]],
+    ) -> List[Document]:
+        """
+        Load a pre-scanned list of files with a specific loader configuration.
+        
+        Files with an up-to-date metadata cache entry are not parsed at all;
+        the remaining files are parsed concurrently.
+        
+        Args:
+            loader_config: Configuration for the loader to use.
+            files: (path, stat) pairs of the files to load.
+            
+        Returns:
+            List of loaded and enriched documents.
+        """
+        cache = self._metadata_cache
+        documents: List[Document] = []
+        to_load: List[Tuple[str, os.stat_result]] = []
+        
+        for path, stat in files:
+            if cache is not None:
+                cached = cache.get(path, stat.st_mtime, stat.st_size)
+                if cached is not None:
+                    documents.extend(cached)
+                    continue
+            to_load.append((path, stat))
+        
+        if not to_load:
+            return documents
+        
+        loader_class = loader_config.loader_class
+        loader_kwargs = loader_config.loader_kwargs
+        
+        def load_file(path: str) -> List[Document]:
+            try:
+                return loader_class(path, **loader_kwargs).load()
+            except Exception as e:
+                logger.warning(f"Failed to load {path}: {e}")
+                return []
+        
+        ingestion_timestamp = datetime.now().isoformat()
+        
+        # Per-file progress only counts; the per-pattern bar carries the postfix
+        file_progress = tqdm(
+            total=len(to_load),
+            desc=f"Parsing {loader_config.glob_pattern}",
+            leave=False,
+            disable=not self.show_progress,
+            mininterval=0.5,
+            miniters=max(1, len(to_load) // 200),
+            smoothing=0,
+        )
+        
+        with file_progress, ThreadPoolExecutor(max_workers=self.MAX_LOAD_WORKERS) as executor:
+            loaded = executor.map(load_file, [path for path, _ in to_load])
+            for (path, stat), file_docs in zip(to_load, loaded):
+                documents.extend(
+                    self._enrich_file_documents(
+                        file_docs, path, stat, loader_config.source_type, ingestion_timestamp
+                    )
+                )
+                file_progress.update(1)
+        
+        return documents
+    
     def _load_with_loader(self, loader_config: LoaderConfig) -> List[Document]:
         """
         Load documents using a specific loader configuration.
@@ -267,10 +481,7 @@ class DocumentLoader:
             docs = directory_loader.load()
             
             # Enrich metadata for each document
-            for doc in docs:
-                doc.metadata = self._extract_metadata(doc, loader_config.source_type)
-            
-            return docs
+            return self._enrich_documents(docs, loader_config.source_type)
             
         except Exception as e:
             logger.warning(
@@ -293,6 +504,11 @@ class DocumentLoader:
         
         all_documents: List[Document] = []
         
+        # Walk the tree once and dispatch files to loaders by extension
+        files_by_extension = self._scan_data_directory()
+        if not files_by_extension:
+            logger.warning(f"Data directory is empty: {self.data_dir}")
+        
         # Iterate through loaders with progress tracking
         loader_iterator = tqdm(
             self.loaders,
@@ -302,7 +518,15 @@ class DocumentLoader:
         
         for loader_config in loader_iterator:
             loader_iterator.set_postfix(pattern=loader_config.glob_pattern)
-            docs = self._load_with_loader(loader_config)
+            
+            extension_match = self._EXTENSION_GLOB.match(loader_config.glob_pattern)
+            if extension_match:
+                docs = self._load_files(
+                    loader_config, files_by_extension.get(extension_match.group(1), [])
+                )
+            else:
+                # Arbitrary glob patterns still go through DirectoryLoader
+                docs = self._load_with_loader(loader_config)
             
             if docs:
                 logger.info(
@@ -344,35 +568,27 @@ class DocumentLoader:
         Returns:
             List of documents from the file.
         """
-        path = Path(file_path)
-        if not path.exists():
+        if not os.path.exists(file_path):
             raise DocumentLoadError(f"File not found: {file_path}")
         
-        # Find appropriate loader
-        extension = path.suffix.lower()
-        loader_map = {
-            ".pdf": PyPDFLoader,
-            ".txt": TextLoader,
-            ".md": TextLoader,
-            ".csv": CSVLoader,
-        }
+        # Find appropriate loader (only lowercase when the exact suffix is unknown)
+        extension = os.path.splitext(file_path)[1]
+        if extension not in self._EXT_DISPATCH:
+            extension = extension.lower()
         
-        loader_class = loader_map.get(extension)
+        loader_class = self._EXT_DISPATCH.get(extension)
         if not loader_class:
             raise DocumentLoadError(
                 f"Unsupported file type: {extension}",
-                details={"supported": list(loader_map.keys())}
+                details={"supported": list(self._EXT_DISPATCH)}
             )
         
         try:
-            loader = loader_class(str(path))
+            loader = loader_class(str(file_path))
             docs = loader.load()
             
             # Enrich metadata
-            for doc in docs:
-                doc.metadata = self._extract_metadata(doc, extension[1:])
-            
-            return docs
+            return self._enrich_documents(docs, extension[1:])
             
         except Exception as e:
             raise DocumentLoadError(
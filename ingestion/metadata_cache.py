@@ -0,0 +1,113 @@
+"""
+Document Metadata Cache for AI Knowledge Continuity System.
+
+This module persists the enriched documents produced for each source file,
+keyed by (path, mtime, size), so that re-running ingestion only re-parses
+and re-classifies files that were added or changed since the last run.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+from langchain_core.documents import Document
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DocumentMetadataCache:
+    """
+    SQLite-backed cache of enriched documents per source file.
+
+    A cache entry is only reused when both the modification time and the
+    size of the file match the values recorded when it was stored, so any
+    edit to a file invalidates its entry.
+
+    Example:
+        >>> cache = DocumentMetadataCache("data/.kcs_cache/meta.sqlite")
+        >>> docs = cache.get(path, mtime, size)
+        >>> if docs is None:
+        ...     docs = load_and_enrich(path)
+        ...     cache.put(path, mtime, size, docs)
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            db_path: Path to the SQLite database file.
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Loaders may run on worker threads; serialize access to the connection
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            "path TEXT PRIMARY KEY, mtime REAL, size INTEGER, docs TEXT)"
+        )
+        self._conn.commit()
+
+        logger.info(f"DocumentMetadataCache initialized: {self.db_path}")
+
+    def get(self, path: str, mtime: float, size: int) -> Optional[List[Document]]:
+        """
+        Get the cached documents for a file if it is unchanged.
+
+        Args:
+            path: Source file path.
+            mtime: Current modification time of the file.
+            size: Current size of the file in bytes.
+
+        Returns:
+            List of cached documents, or None on a cache miss.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime, size, docs FROM documents WHERE path = ?", (path,)
+            ).fetchone()
+
+        if row is None or row[0] != mtime or row[1] != size:
+            return None
+
+        try:
+            return [
+                Document(page_content=content, metadata=metadata)
+                for content, metadata in json.loads(row[2])
+            ]
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Discarding corrupt cache entry for {path}: {e}")
+            return None
+
+    def put(self, path: str, mtime: float, size: int, documents: List[Document]) -> None:
+        """
+        Store the enriched documents for a file.
+
+        Args:
+            path: Source file path.
+            mtime: Modification time of the file.
+            size: Size of the file in bytes.
+            documents: Enriched documents produced from the file.
+        """
+        payload = json.dumps(
+            [[doc.page_content, doc.metadata] for doc in documents],
+            default=str,
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents (path, mtime, size, docs) VALUES (?, ?, ?, ?)",
+                (path, mtime, size, payload),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
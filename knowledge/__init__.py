@@ -14,6 +14,7 @@ from knowledge.decision_parser import (
     DecisionMetadata,
     DecisionParser,
     parse_decision_document,
+    parse_decision_documents,
 )
 from knowledge.gap_detector import (
     GapDetectionResult,
@@ -34,6 +35,7 @@ __all__ = [
     "DecisionMetadata",
     "DecisionParser",
     "parse_decision_document",
+    "parse_decision_documents",
     # Gap Detection
     "GapDetectionResult",
     "KnowledgeGapDetector",
@@ -15,8 +15,10 @@ The parser uses deterministic pattern matching to extract:
 """
 
 import re
+import string
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -24,8 +26,29 @@ from core.logger import get_logger
 
 logger = get_logger(__name__)
 
+_ASCII_LOWERCASE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
 
-@dataclass
+# Fields the parser can extract, in extraction order. Bit i of
+# DecisionMetadata.extracted_mask is set when EXTRACTED_FIELDS[i] was found.
+EXTRACTED_FIELDS = [
+    "decision_id",
+    "decision_title",
+    "author",
+    "date",
+    "context",
+    "decision_statement",
+    "rationale",
+    "alternatives",
+    "tradeoffs",
+    "outcome",
+    "pros",
+    "cons",
+    "status",
+]
+FIELD_BITS = {name: 1 << i for i, name in enumerate(EXTRACTED_FIELDS)}
+
+
+@dataclass(slots=True)
 class DecisionMetadata:
     """
     Structured metadata for an organizational decision.
@@ -62,33 +85,38 @@ class DecisionMetadata:
     
     # Extraction confidence
     extraction_confidence: float = 0.0
-    extracted_fields: List[str] = field(default_factory=list)
+    extracted_mask: int = 0  # Bitmask over EXTRACTED_FIELDS
+    
+    @property
+    def extracted_fields(self) -> List[str]:
+        """Names of the extracted fields, in extraction order."""
+        return [
+            name for i, name in enumerate(EXTRACTED_FIELDS)
+            if self.extracted_mask >> i & 1
+        ]
     
     def to_metadata(self) -> Dict[str, Any]:
-        """Convert to metadata dictionary for document enrichment."""
-        metadata = {
-            "decision_id": self.decision_id,
-            "decision_title": self.decision_title,
-            "decision_author": self.author,
-            "decision_date": self.date,
-            "decision_status": self.status,
-            "has_alternatives": len(self.alternatives) > 0,
-            "has_tradeoffs": len(self.tradeoffs) > 0,
-            "decision_extraction_confidence": self.extraction_confidence,
-        }
+        """
+        Convert to metadata dictionary for document enrichment.
         
-        # Include lists only if non-empty
-        if self.alternatives:
-            metadata["decision_alternatives"] = self.alternatives
-        if self.tradeoffs:
-            metadata["decision_tradeoffs"] = self.tradeoffs
-        if self.stakeholders:
-            metadata["decision_stakeholders"] = self.stakeholders
-        if self.pros:
-            metadata["decision_pros"] = self.pros
-        if self.cons:
-            metadata["decision_cons"] = self.cons
-            
+        Fields that were not extracted (None or empty lists) are omitted.
+        """
+        fields = (
+            ("decision_id", self.decision_id),
+            ("decision_title", self.decision_title),
+            ("decision_author", self.author),
+            ("decision_date", self.date),
+            ("decision_status", self.status),
+            ("decision_alternatives", self.alternatives),
+            ("decision_tradeoffs", self.tradeoffs),
+            ("decision_stakeholders", self.stakeholders),
+            ("decision_pros", self.pros),
+            ("decision_cons", self.cons),
+        )
+        metadata = {key: value for key, value in fields if value}
+        metadata["has_alternatives"] = bool(self.alternatives)
+        metadata["has_tradeoffs"] = bool(self.tradeoffs)
+        metadata["decision_extraction_confidence"] = self.extraction_confidence
         return metadata
     
     def get_summary(self) -> str:
@@ -137,52 +165,79 @@ class DecisionParser:
     
     # Patterns for extracting decision ID from filename or content
     DECISION_ID_PATTERNS = [
-        r"ADR[_\-\s]?(\d+)",  # ADR-001, ADR_001, ADR 001
-        r"RFC[_\-\s]?(\d+)",  # RFC-001
-        r"Decision[_\-\s]?(\d+)",  # Decision-001
+        r"adr[_\-\s]?(\d+)",  # ADR-001, ADR_001, ADR 001
+        r"rfc[_\-\s]?(\d+)",  # RFC-001
+        r"decision[_\-\s]?(\d+)",  # Decision-001
         r"#\s*(\d+)",  # #001
     ]
+    ID_MARKERS = ["adr", "rfc", "decision", "#"]  # Literal each pattern starts with
     
     # Patterns for extracting decision title
     TITLE_PATTERNS = [
-        r"#\s*(?:ADR|RFC|Decision)[_\-\s]?\d*[:\s]+(.+?)(?:\n|$)",  # # ADR-001: Title
-        r"##?\s*(?:Decision|Title|Subject)[:\s]+(.+?)(?:\n|$)",  # ## Decision: Title
+        r"#\s*(?:adr|rfc|decision)[_\-\s]?\d*[:\s]+(.+?)(?:\n|$)",  # # ADR-001: Title
+        r"##?\s*(?:decision|title|subject)[:\s]+(.+?)(?:\n|$)",  # ## Decision: Title
         r"^#\s+(.+?)(?:\n|$)",  # # Title (first h1)
-        r"(?:Decision|Title)[:\s]+(.+?)(?:\n|$)",  # Decision: Title
+        r"(?:decision|title)[:\s]+(.+?)(?:\n|$)",  # Decision: Title
     ]
     
     # Patterns for extracting author
     AUTHOR_PATTERNS = [
-        r"(?:Author|Written by|By|Created by|Owner)[:\s]+([^\n]+)",
-        r"(?:Submitted by|Proposed by|Authored by)[:\s]+([^\n]+)",
-        r"(?:Author|By)\s*:\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",  # Name pattern
+        r"(?:author|written by|by|created by|owner)[:\s]+([^\n]+)",
+        r"(?:submitted by|proposed by|authored by)[:\s]+([^\n]+)",
+        r"(?:author|by)\s*:\s*([a-z][a-z]+(?:\s+[a-z][a-z]+)*)",  # Name pattern
     ]
     
     # Patterns for extracting date
     DATE_PATTERNS = [
-        r"(?:Date|Created|Written|Last updated)[:\s]+(\d{4}-\d{2}-\d{2})",  # ISO format
-        r"(?:Date|Created)[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",  # Various formats
+        r"(?:date|created|written|last updated)[:\s]+(\d{4}-\d{2}-\d{2})",  # ISO format
+        r"(?:date|created)[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",  # Various formats
         r"(\d{4}-\d{2}-\d{2})",  # ISO date anywhere
-        r"((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4})",  # Month DD, YYYY
-        r"(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})",  # DD Month YYYY
+        r"((?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{1,2},?\s+\d{4})",  # Month DD, YYYY
+        r"(\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{4})",  # DD Month YYYY
     ]
     
-    # Section headers for ADR-style documents
-    SECTION_PATTERNS = {
-        "context": r"##?\s*(?:Context|Background|Problem|Situation)[:\s]*\n([\s\S]*?)(?=##?\s|\Z)",
-        "decision": r"##?\s*(?:Decision|Solution|Approach|Resolution)[:\s]*\n([\s\S]*?)(?=##?\s|\Z)",
-        "rationale": r"##?\s*(?:Rationale|Reasoning|Justification|Why)[:\s]*\n([\s\S]*?)(?=##?\s|\Z)",
-        "alternatives": r"##?\s*(?:Alternatives?|Options?|Considered)[:\s]*\n([\s\S]*?)(?=##?\s|\Z)",
-        "tradeoffs": r"##?\s*(?:Trade[_\-\s]?offs?|Consequences|Implications)[:\s]*\n([\s\S]*?)(?=##?\s|\Z)",
-        "outcome": r"##?\s*(?:Outcome|Result|Status|Conclusion)[:\s]*\n([\s\S]*?)(?=##?\s|\Z)",
+    # Date formats tried by _parse_date, grouped by the shape of the string
+    ISO_DATE_PATTERN = r"\d{4}-\d{2}-\d{2}"
+    SLASH_DATE_FORMATS = ["%d/%m/%Y", "%m/%d/%Y"]
+    DASH_DATE_FORMATS = ["%Y-%m-%d", "%d-%m-%Y"]
+    MONTH_NAME_DAY_FORMATS = ["%B %d, %Y", "%b %d, %Y"]
+    DAY_MONTH_NAME_FORMATS = ["%d %B %Y", "%d %b %Y"]
+    
+    # Markdown header line; the text after the hashes is the header title
+    HEADER_PATTERN = r"^[ \t]*#+[ \t]+([^\n]*)"
+    
+    # Only this many leading characters are scanned for section headers,
+    # unless no decision section is found there
+    SECTION_SCAN_LIMIT = 65536
+    
+    # Section header titles for ADR-style documents
+    SECTION_HEADERS = {
+        "context": r"context|background|problem|situation",
+        "decision": r"decision|solution|approach|resolution",
+        "rationale": r"rationale|reasoning|justification|why",
+        "alternatives": r"alternatives?|options?|considered",
+        "tradeoffs": r"trade[_\-\s]?offs?|consequences|implications",
+        "outcome": r"outcome|result|status|conclusion",
     }
     
+    # Explicit pros/cons sections: each list starts after its label and
+    # runs until the first terminator (the opposite label or a header)
+    PROS_PATTERN = r"(?:pros|benefits|advantages|strengths)[:\s]*\n"
+    PROS_END_PATTERN = r"cons|drawbacks|disadvantages|weaknesses|##?\s"
+    CONS_PATTERN = r"(?:cons|drawbacks|disadvantages|weaknesses)[:\s]*\n"
+    CONS_END_PATTERN = r"pros|benefits|advantages|##?\s"
+    
+    # Cleanup patterns for extracted titles and authors
+    TITLE_PREFIX_PATTERN = r"^(?:ADR|RFC|Decision)[_\-\s]?\d*[:\s]*"
+    AUTHOR_SUFFIX_PATTERN = r"\s*\(.*?\)\s*$"  # Remove (email) etc.
+    
     # Patterns for extracting lists of alternatives
-    LIST_ITEM_PATTERNS = [
-        r"[-*]\s+(.+?)(?:\n|$)",  # Bullet points
-        r"\d+[.)]\s+(.+?)(?:\n|$)",  # Numbered lists
-        r"Option\s*\d*[:\s]+(.+?)(?:\n|$)",  # Option 1: ...
-    ]
+    LIST_ITEM_PATTERN = (
+        r"(?:[-*]\s+"  # Bullet points
+        r"|\d+[.)]\s+"  # Numbered lists
+        r"|Option\s*\d*[:\s]+"  # Option 1: ...
+        r")(.+)"
+    )
     
     # Status keywords
     STATUS_KEYWORDS = {
@@ -192,18 +247,93 @@ class DecisionParser:
         "rejected": ["rejected", "declined", "not adopted"],
     }
     
-    def __init__(self):
+    # Confidence weight per extracted field; higher for core decision fields
+    CONFIDENCE_WEIGHTS = {
+        "decision_id": 0.1,
+        "decision_title": 0.15,
+        "author": 0.1,
+        "date": 0.1,
+        "context": 0.1,
+        "decision_statement": 0.15,
+        "rationale": 0.15,
+        "alternatives": 0.05,
+        "tradeoffs": 0.05,
+        "outcome": 0.05,
+    }
+    CONFIDENCE_TOTAL_WEIGHT = sum(CONFIDENCE_WEIGHTS.values())
+    
+    # Phrases suggesting a document records a decision
+    DECISION_INDICATORS = [
+        "## decision",
+        "## rationale",
+        "### context",
+        "trade-off",
+        "tradeoff",
+        "alternative",
+        "we decided",
+        "the decision",
+        "was selected",
+        "was chosen",
+    ]
+    
+    def __init__(self) -> None:
         """Initialize the decision parser."""
-        # Compile patterns for efficiency
-        self._id_patterns = [re.compile(p, re.IGNORECASE) for p in self.DECISION_ID_PATTERNS]
-        self._title_patterns = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in self.TITLE_PATTERNS]
-        self._author_patterns = [re.compile(p, re.IGNORECASE) for p in self.AUTHOR_PATTERNS]
-        self._date_patterns = [re.compile(p, re.IGNORECASE) for p in self.DATE_PATTERNS]
-        self._section_patterns = {
-            k: re.compile(v, re.IGNORECASE | re.MULTILINE)
-            for k, v in self.SECTION_PATTERNS.items()
+        # Content patterns are lowercase and run case-sensitively against
+        # lowercased content; values are sliced from the original text.
+        self._id_patterns: List["re.Pattern[str]"] = [
+            re.compile(p) for p in self.DECISION_ID_PATTERNS
+        ]
+        self._title_patterns: List["re.Pattern[str]"] = [
+            re.compile(p, re.MULTILINE) for p in self.TITLE_PATTERNS
+        ]
+        self._author_patterns: List["re.Pattern[str]"] = [
+            re.compile(p) for p in self.AUTHOR_PATTERNS
+        ]
+        self._date_patterns: List["re.Pattern[str]"] = [
+            re.compile(p) for p in self.DATE_PATTERNS
+        ]
+        self._iso_date_pattern: "re.Pattern[str]" = re.compile(self.ISO_DATE_PATTERN)
+        self._header_pattern: "re.Pattern[str]" = re.compile(self.HEADER_PATTERN, re.MULTILINE)
+        self._section_header_pattern: "re.Pattern[str]" = re.compile(
+            "|".join(f"(?P<{name}>{titles})" for name, titles in self.SECTION_HEADERS.items())
+        )
+        self._list_pattern: "re.Pattern[str]" = re.compile(self.LIST_ITEM_PATTERN)
+        # Pros and cons labels are found in one scan; the lookahead keeps the
+        # matches zero-width so overlapping labels (e.g. the "advantages" in
+        # "disadvantages") are still seen
+        self._list_label_pattern: "re.Pattern[str]" = re.compile(
+            rf"(?=(?P<pros>{self.PROS_PATTERN})|(?P<cons>{self.CONS_PATTERN}))"
+        )
+        self._list_end_patterns: Dict[str, "re.Pattern[str]"] = {
+            "pros": re.compile(self.PROS_END_PATTERN),
+            "cons": re.compile(self.CONS_END_PATTERN),
         }
-        self._list_patterns = [re.compile(p, re.MULTILINE) for p in self.LIST_ITEM_PATTERNS]
+        # Cleanup patterns only run on short extracted values, so they keep
+        # matching the original casing
+        self._title_prefix_pattern: "re.Pattern[str]" = re.compile(
+            self.TITLE_PREFIX_PATTERN, re.IGNORECASE
+        )
+        self._author_suffix_pattern: "re.Pattern[str]" = re.compile(self.AUTHOR_SUFFIX_PATTERN)
+        self._indicator_pattern: "re.Pattern[str]" = re.compile(
+            "|".join(map(re.escape, self.DECISION_INDICATORS))
+        )
+        
+        # One alternation over every status keyword; each keyword maps to its
+        # (priority, status) so the first status in STATUS_KEYWORDS order wins
+        self._status_keywords: Dict[str, Tuple[int, str]] = {}
+        for status, keywords in self.STATUS_KEYWORDS.items():
+            for keyword in keywords:
+                self._status_keywords[keyword] = (len(self._status_keywords), status)
+        keyword_alternation = "|".join(map(re.escape, self._status_keywords))
+        self._status_pattern: "re.Pattern[str]" = re.compile(
+            rf"(?:status|state)[:\s]*({keyword_alternation})"
+            rf"|(?:is|was|been)\s+({keyword_alternation})"
+        )
+        
+        # Confidence weight of each bit in an extracted-fields mask
+        self._field_weights: List[float] = [
+            self.CONFIDENCE_WEIGHTS.get(name, 0.02) for name in EXTRACTED_FIELDS
+        ]
         
         logger.info("DecisionParser initialized")
     
@@ -225,158 +355,283 @@ class DecisionParser:
             DecisionMetadata with extracted information.
         """
         metadata = DecisionMetadata()
-        extracted_fields: List[str] = []
+        bits = FIELD_BITS
+        extracted_mask = 0
+        content_lower = self._lowercase(content)
         
         # Extract decision ID (from filename or content)
-        decision_id = self._extract_id(content, filename)
+        decision_id = self._extract_id(content_lower, filename)
         if decision_id:
             metadata.decision_id = decision_id
-            extracted_fields.append("decision_id")
+            extracted_mask |= bits["decision_id"]
         
         # Extract title
-        title = self._extract_title(content)
+        title = self._extract_title(content, content_lower)
         if title:
             metadata.decision_title = title.strip()
-            extracted_fields.append("decision_title")
+            extracted_mask |= bits["decision_title"]
         
         # Extract author
-        author = self._extract_author(content)
+        author = self._extract_author(content, content_lower)
         if author:
             metadata.author = author.strip()
-            extracted_fields.append("author")
+            extracted_mask |= bits["author"]
         
         # Extract date
-        date_str, date_parsed = self._extract_date(content)
+        date_str, date_parsed = self._extract_date(content, content_lower)
         if date_str:
             metadata.date = date_str
             metadata.date_parsed = date_parsed
-            extracted_fields.append("date")
+            extracted_mask |= bits["date"]
         
         # Extract sections
-        for section_name, pattern in self._section_patterns.items():
-            match = pattern.search(content)
-            if match:
-                section_content = match.group(1).strip()
+        sections = self._split_sections(content, content_lower)
+        for section_name in self.SECTION_HEADERS:
+            section_content = sections.get(section_name)
+            if section_content is not None:
                 if section_name == "context":
                     metadata.context = section_content[:1000]  # Limit length
-                    extracted_fields.append("context")
+                    extracted_mask |= bits["context"]
                 elif section_name == "decision":
                     metadata.decision_statement = section_content[:1000]
-                    extracted_fields.append("decision_statement")
+                    extracted_mask |= bits["decision_statement"]
                 elif section_name == "rationale":
                     metadata.rationale = section_content[:1000]
-                    extracted_fields.append("rationale")
+                    extracted_mask |= bits["rationale"]
                 elif section_name == "alternatives":
                     alternatives = self._extract_list_items(section_content)
                     if alternatives:
                         metadata.alternatives = alternatives
-                        extracted_fields.append("alternatives")
+                        extracted_mask |= bits["alternatives"]
                 elif section_name == "tradeoffs":
                     tradeoffs = self._extract_list_items(section_content)
                     if tradeoffs:
                         metadata.tradeoffs = tradeoffs
-                        extracted_fields.append("tradeoffs")
+                        extracted_mask |= bits["tradeoffs"]
                 elif section_name == "outcome":
                     metadata.outcome = section_content[:500]
-                    extracted_fields.append("outcome")
+                    extracted_mask |= bits["outcome"]
         
         # Extract pros and cons
-        pros, cons = self._extract_pros_cons(content)
+        pros, cons = self._extract_pros_cons(content, content_lower)
         if pros:
             metadata.pros = pros
-            extracted_fields.append("pros")
+            extracted_mask |= bits["pros"]
         if cons:
             metadata.cons = cons
-            extracted_fields.append("cons")
+            extracted_mask |= bits["cons"]
         
         # Detect status
-        status = self._detect_status(content)
+        status = self._detect_status(content_lower)
         if status:
             metadata.status = status
-            extracted_fields.append("status")
+            extracted_mask |= bits["status"]
         
         # Calculate extraction confidence
-        metadata.extracted_fields = extracted_fields
-        metadata.extraction_confidence = self._calculate_confidence(extracted_fields)
+        metadata.extracted_mask = extracted_mask
+        metadata.extraction_confidence = self._calculate_confidence(extracted_mask)
         
+        # Lazy %-formatting: parse runs once per document and debug logging
+        # is usually disabled
         logger.debug(
-            f"Extracted {len(extracted_fields)} fields from decision document, "
-            f"confidence: {metadata.extraction_confidence:.2f}"
+            "Extracted %d fields from decision document, confidence: %.2f",
+            extracted_mask.bit_count(),
+            metadata.extraction_confidence,
         )
         
         return metadata
     
-    def _extract_id(
+    @staticmethod
+    def _lowercase(text: str) -> str:
+        """
+        Lowercase text while keeping every character at the same offset.
+        
+        Match spans found in the lowercased text are used to slice the
+        original, so fall back to ASCII-only lowercasing in the rare case
+        where Unicode lowercasing changes the string length.
+        """
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            lowered = text.translate(_ASCII_LOWERCASE)
+        return lowered
+    
+    @staticmethod
+    def _search_by_priority(
+        patterns: List["re.Pattern[str]"],
+        text: str,
+        transform: Optional[Callable[[str], Optional[str]]] = None,
+        original: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Find the value captured by the highest-priority matching pattern.
+        
+        Each pattern's first match is tried in priority order, falling
+        through when ``transform`` rejects a value (returns None). When
+        ``original`` is given, ``text`` is its lowercased form and the value
+        is sliced from ``original`` to preserve its casing.
+        """
+        for pattern in patterns:
+            match = pattern.search(text)
+            if match is None:
+                continue
+            
+            if original is not None:
+                value = original[match.start(1):match.end(1)]
+            else:
+                value = match.group(1)
+            if transform is not None:
+                value = transform(value)
+            if value is not None:
+                return value
+        
+        return None
+    
+    def _split_sections(self, content: str, content_lower: str) -> Dict[str, str]:
+        """
+        Split content into known sections by header offsets.
+        
+        A section runs from the end of its header line to the start of the
+        next header line. When a section appears more than once, the first
+        occurrence wins.
+        
+        Decision documents declare their sections near the top, so only the
+        first SECTION_SCAN_LIMIT characters are scanned for headers. The rest
+        of a long document is only scanned if no decision section was found.
+        """
+        sections: Dict[str, str] = {}
+        head_end = min(len(content_lower), self.SECTION_SCAN_LIMIT)
+        self._collect_sections(content, content_lower, 0, head_end, sections)
+        
+        if head_end < len(content_lower) and "decision" not in sections:
+            self._collect_sections(content, content_lower, head_end, len(content_lower), sections)
+        
+        return sections
+    
+    def _collect_sections(
         self,
         content: str,
+        content_lower: str,
+        start: int,
+        end: int,
+        sections: Dict[str, str],
+    ) -> None:
+        """Add the known sections whose headers lie in content[start:end]."""
+        pending = None  # (section name, body start) awaiting the next header
+        
+        for header in self._header_pattern.finditer(content_lower, start, end):
+            if pending is not None:
+                name, body_start = pending
+                sections[name] = content[body_start:header.start()].strip()
+                pending = None
+            
+            title = header.group(1).rstrip(": \t\r")
+            match = self._section_header_pattern.fullmatch(title)
+            if match is None or match.lastgroup in sections:
+                continue
+            pending = (match.lastgroup, header.end())
+        
+        if pending is not None:
+            # The last section runs to the next header, even past the scanned range
+            name, body_start = pending
+            next_header = self._header_pattern.search(content_lower, body_start)
+            body_end = next_header.start() if next_header else len(content)
+            sections[name] = content[body_start:body_end].strip()
+    
+    def _extract_id(
+        self,
+        content_lower: str,
         filename: Optional[str] = None,
     ) -> Optional[str]:
-        """Extract decision ID from filename or content."""
+        """Extract decision ID from filename or lowercased content."""
         # Try filename first
         if filename:
-            for pattern in self._id_patterns:
-                match = pattern.search(filename)
-                if match:
-                    return f"ADR-{match.group(1).zfill(3)}"
+            number = self._find_id_number(self._lowercase(filename))
+            if number:
+                return f"ADR-{number.zfill(3)}"
         
         # Try content
-        for pattern in self._id_patterns:
-            match = pattern.search(content)
-            if match:
-                return f"ADR-{match.group(1).zfill(3)}"
+        number = self._find_id_number(content_lower)
+        if number:
+            return f"ADR-{number.zfill(3)}"
         
         return None
     
-    def _extract_title(self, content: str) -> Optional[str]:
+    def _find_id_number(self, text_lower: str) -> Optional[str]:
+        """Find the decision number in lowercased text, if any."""
+        # Every ID pattern starts with one of these literals; substring checks
+        # are far cheaper than running the patterns over text without them
+        if not any(marker in text_lower for marker in self.ID_MARKERS):
+            return None
+        return self._search_by_priority(self._id_patterns, text_lower)
+    
+    def _extract_title(self, content: str, content_lower: str) -> Optional[str]:
         """Extract decision title from content."""
-        for pattern in self._title_patterns:
-            match = pattern.search(content)
-            if match:
-                title = match.group(1).strip()
-                # Clean up common prefixes
-                title = re.sub(r"^(?:ADR|RFC|Decision)[_\-\s]?\d*[:\s]*", "", title, flags=re.IGNORECASE)
-                if len(title) > 5:  # Minimum meaningful title length
-                    return title
+        return self._search_by_priority(
+            self._title_patterns, content_lower, self._clean_title, content
+        )
+    
+    def _clean_title(self, title: str) -> Optional[str]:
+        """Clean a candidate title, returning None if it is too short."""
+        title = title.strip()
+        # Clean up common prefixes
+        title = self._title_prefix_pattern.sub("", title)
+        if len(title) > 5:  # Minimum meaningful title length
+            return title
         return None
     
-    def _extract_author(self, content: str) -> Optional[str]:
+    def _extract_author(self, content: str, content_lower: str) -> Optional[str]:
         """Extract author from content."""
-        for pattern in self._author_patterns:
-            match = pattern.search(content)
-            if match:
-                author = match.group(1).strip()
-                # Clean up common suffixes
-                author = re.sub(r"\s*\(.*?\)\s*$", "", author)  # Remove (email) etc.
-                author = author.strip(".,;:")
-                if len(author) > 2 and len(author) < 100:  # Sanity check
-                    return author
+        return self._search_by_priority(
+            self._author_patterns, content_lower, self._clean_author, content
+        )
+    
+    def _clean_author(self, author: str) -> Optional[str]:
+        """Clean a candidate author, returning None if it fails sanity checks."""
+        author = author.strip()
+        # Clean up common suffixes
+        author = self._author_suffix_pattern.sub("", author)
+        author = author.strip(".,;:")
+        if len(author) > 2 and len(author) < 100:  # Sanity check
+            return author
         return None
     
-    def _extract_date(self, content: str) -> Tuple[Optional[str], Optional[datetime]]:
+    def _extract_date(
+        self,
+        content: str,
+        content_lower: str,
+    ) -> Tuple[Optional[str], Optional[datetime]]:
         """Extract and parse date from content."""
-        for pattern in self._date_patterns:
-            match = pattern.search(content)
-            if match:
-                date_str = match.group(1).strip()
-                
-                # Try to parse the date
-                date_parsed = self._parse_date(date_str)
-                return date_str, date_parsed
+        date_str = self._search_by_priority(
+            self._date_patterns, content_lower, original=content
+        )
+        if date_str:
+            date_str = date_str.strip()
+            
+            # Try to parse the date
+            date_parsed = self._parse_date(date_str)
+            return date_str, date_parsed
         
         return None, None
     
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse a date string into datetime."""
-        formats = [
-            "%Y-%m-%d",
-            "%d/%m/%Y",
-            "%m/%d/%Y",
-            "%d-%m-%Y",
-            "%B %d, %Y",
-            "%b %d, %Y",
-            "%d %B %Y",
-            "%d %b %Y",
-        ]
+        # ISO dates (the common case) need no format guessing
+        if self._iso_date_pattern.fullmatch(date_str):
+            try:
+                return datetime.fromisoformat(date_str)
+            except ValueError:
+                return None
+        
+        # Otherwise only try the formats that fit the string's shape
+        if "/" in date_str:
+            formats = self.SLASH_DATE_FORMATS
+        elif any(c.isalpha() for c in date_str):
+            if date_str.lstrip()[:1].isdigit():
+                formats = self.DAY_MONTH_NAME_FORMATS
+            else:
+                formats = self.MONTH_NAME_DAY_FORMATS
+        else:
+            formats = self.DASH_DATE_FORMATS
         
         for fmt in formats:
             try:
@@ -387,90 +642,82 @@ class DecisionParser:
         return None
     
     def _extract_list_items(self, content: str) -> List[str]:
-        """Extract list items from content."""
+        """Extract up to 10 unique list items from content, in document order."""
         items = []
-        for pattern in self._list_patterns:
-            matches = pattern.findall(content)
-            for match in matches:
-                item = match.strip()
-                if len(item) > 3 and len(item) < 500:  # Sanity check
-                    items.append(item)
-        
-        # Deduplicate while preserving order
         seen = set()
-        unique_items = []
-        for item in items:
-            if item.lower() not in seen:
-                seen.add(item.lower())
-                unique_items.append(item)
+        for match in self._list_pattern.finditer(content):
+            item = match.group(1).strip()
+            if len(item) <= 3 or len(item) >= 500:  # Sanity check
+                continue
+            
+            key = item.casefold()
+            if key not in seen:
+                seen.add(key)
+                items.append(item)
+                if len(items) == 10:  # Limit to 10 items
+                    break
         
-        return unique_items[:10]  # Limit to 10 items
+        return items
     
-    def _extract_pros_cons(self, content: str) -> Tuple[List[str], List[str]]:
+    def _extract_pros_cons(
+        self,
+        content: str,
+        content_lower: str,
+    ) -> Tuple[List[str], List[str]]:
         """Extract pros and cons from content."""
-        pros = []
-        cons = []
-        
-        # Look for explicit pros/cons sections
-        pros_pattern = re.compile(
-            r"(?:Pros|Benefits|Advantages|Strengths)[:\s]*\n([\s\S]*?)(?=(?:Cons|Drawbacks|Disadvantages|Weaknesses)|##?\s|\Z)",
-            re.IGNORECASE
-        )
-        cons_pattern = re.compile(
-            r"(?:Cons|Drawbacks|Disadvantages|Weaknesses)[:\s]*\n([\s\S]*?)(?=(?:Pros|Benefits|Advantages)|##?\s|\Z)",
-            re.IGNORECASE
-        )
-        
-        pros_match = pros_pattern.search(content)
-        if pros_match:
-            pros = self._extract_list_items(pros_match.group(1))
-        
-        cons_match = cons_pattern.search(content)
-        if cons_match:
-            cons = self._extract_list_items(cons_match.group(1))
-        
-        return pros, cons
-    
-    def _detect_status(self, content: str) -> Optional[str]:
-        """Detect decision status from content."""
-        content_lower = content.lower()
-        
-        for status, keywords in self.STATUS_KEYWORDS.items():
-            for keyword in keywords:
-                # Look for status in explicit sections
-                if re.search(rf"(?:status|state)[:\s]*{keyword}", content_lower):
-                    return status
-                # Look for status declarations
-                if re.search(rf"(?:is|was|been)\s+{keyword}", content_lower):
-                    return status
+        # Find where the first pros and first cons lists start
+        list_starts: Dict[str, int] = {}
+        for match in self._list_label_pattern.finditer(content_lower):
+            label = match.lastgroup
+            if label not in list_starts:
+                list_starts[label] = match.end(label)
+                if len(list_starts) == 2:
+                    break
+        
+        # Each list runs until the first terminator after its label
+        lists: Dict[str, List[str]] = {"pros": [], "cons": []}
+        for label, start in list_starts.items():
+            end = self._list_end_patterns[label].search(content_lower, start)
+            stop = end.start() if end else len(content)
+            lists[label] = self._extract_list_items(content[start:stop])
+        
+        return lists["pros"], lists["cons"]
+    
+    def _detect_status(self, content_lower: str) -> Optional[str]:
+        """Detect decision status from lowercased content."""
+        best_rank = None
+        best_status = None
+        
+        for match in self._status_pattern.finditer(content_lower):
+            # Explicit "status: x" declarations outrank "is/was/been x" phrasing
+            keyword, template = match.group(1), 0
+            if keyword is None:
+                keyword, template = match.group(2), 1
+            
+            priority, status = self._status_keywords[keyword]
+            rank = 2 * priority + template
+            if best_rank is None or rank < best_rank:
+                best_rank, best_status = rank, status
+                if rank == 0:
+                    break
         
-        return None
+        return best_status
     
-    def _calculate_confidence(self, extracted_fields: List[str]) -> float:
+    def _calculate_confidence(self, extracted_mask: int) -> float:
         """
         Calculate confidence score based on extracted fields.
         
         Higher weight for core decision fields.
         """
-        weights = {
-            "decision_id": 0.1,
-            "decision_title": 0.15,
-            "author": 0.1,
-            "date": 0.1,
-            "context": 0.1,
-            "decision_statement": 0.15,
-            "rationale": 0.15,
-            "alternatives": 0.05,
-            "tradeoffs": 0.05,
-            "outcome": 0.05,
-        }
+        weights = self._field_weights
+        extracted_weight = 0.0
+        mask = extracted_mask
+        while mask:
+            lowest_bit = mask & -mask
+            extracted_weight += weights[lowest_bit.bit_length() - 1]
+            mask ^= lowest_bit
         
-        total_weight = sum(weights.values())
-        extracted_weight = sum(
-            weights.get(field, 0.02) for field in extracted_fields
-        )
-        
-        return min(1.0, extracted_weight / total_weight)
+        return min(1.0, extracted_weight / self.CONFIDENCE_TOTAL_WEIGHT)
     
     def is_decision_document(
         self,
@@ -493,23 +740,26 @@ class DecisionParser:
             if any(kw in filename_lower for kw in ["adr", "decision", "rfc", "rationale"]):
                 return True
         
-        # Check for decision-related sections
-        content_lower = content.lower()
-        decision_indicators = [
-            "## decision",
-            "## rationale",
-            "### context",
-            "trade-off",
-            "tradeoff",
-            "alternative",
-            "we decided",
-            "the decision",
-            "was selected",
-            "was chosen",
-        ]
-        
-        indicator_count = sum(1 for ind in decision_indicators if ind in content_lower)
-        return indicator_count >= 2
+        # Check for decision-related sections in a single pass, stopping as
+        # soon as two distinct indicators have been seen
+        seen = set()
+        for match in self._indicator_pattern.finditer(self._lowercase(content)):
+            seen.add(match.group())
+            if len(seen) >= 2:
+                return True
+        return False
+
+
+# Default parser instance shared by the convenience function
+_default_parser: Optional[DecisionParser] = None
+
+
+def _get_default_parser() -> DecisionParser:
+    """Get the default parser instance, compiling its patterns only once."""
+    global _default_parser
+    if _default_parser is None:
+        _default_parser = DecisionParser()
+    return _default_parser
 
 
 # Module-level convenience function
@@ -531,5 +781,43 @@ def parse_decision_document(
     Returns:
         DecisionMetadata with extracted information.
     """
-    parser = DecisionParser()
+    parser = _get_default_parser()
     return parser.parse(content=content, filename=filename, filepath=filepath)
+
+
+def _parse_in_worker(document: Tuple[str, Optional[str]]) -> DecisionMetadata:
+    """Parse one (content, filename) pair with the worker's default parser."""
+    content, filename = document
+    return _get_default_parser().parse(content=content, filename=filename)
+
+
+def parse_decision_documents(
+    documents: Iterable[Tuple[str, Optional[str]]],
+    max_workers: Optional[int] = None,
+    chunksize: int = 32,
+) -> List[DecisionMetadata]:
+    """
+    Parse many documents and extract decision metadata, in parallel.
+    
+    Parsing is CPU-bound regex work that holds the GIL, so batches larger
+    than one chunk are spread over worker processes, each building its
+    default parser once. Smaller batches are parsed in-process.
+    
+    Args:
+        documents: (content, filename) pairs to parse.
+        max_workers: Maximum number of worker processes (default: CPU count).
+        chunksize: Number of documents sent to a worker at a time.
+        
+    Returns:
+        DecisionMetadata for each document, in input order.
+    """
+    documents = list(documents)
+    
+    if max_workers == 1 or len(documents) <= chunksize:
+        return [_parse_in_worker(document) for document in documents]
+    
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_get_default_parser,
+    ) as executor:
+        return list(executor.map(_parse_in_worker, documents, chunksize=chunksize))
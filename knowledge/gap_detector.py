@@ -13,12 +13,22 @@ Key capabilities:
 - Knowledge gap logging for organizational learning
 """
 
+import atexit
 import os
 import json
-from datetime import datetime
+import mmap
+import queue
+import struct
+import sys
+import threading
+import time
+import weakref
+import zlib
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
-from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Tuple, Iterator
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 from langchain_core.documents import Document
@@ -26,18 +36,226 @@ from langchain_core.documents import Document
 from config.settings import get_settings
 from core.logger import get_logger
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
 logger = get_logger(__name__)
 
 
+def _dump_line(entry: Dict[str, Any]) -> bytes:
+    """Serialize a log entry as one UTF-8 JSONL line."""
+    if HAVE_ORJSON:
+        return orjson.dumps(entry) + b"\n"
+    return json.dumps(entry).encode("utf-8") + b"\n"
+
+
+def _load_line(line: bytes) -> Any:
+    """Parse one JSONL line; raises json.JSONDecodeError if malformed."""
+    if HAVE_ORJSON:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+# Low-cardinality entry fields shared across many log lines
+_INTERNED_FIELDS = ("gap_severity", "department")
+
+
+def _load_entry(line: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Parse a log line into an entry, or None if it is not a JSON object.
+    
+    Repeated values such as the severity and department are interned so
+    large reads share one string object per distinct value.
+    """
+    try:
+        entry = _load_line(line)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(entry, dict):
+        return None
+    
+    for key in _INTERNED_FIELDS:
+        value = entry.get(key)
+        if type(value) is str:
+            entry[key] = sys.intern(value)
+    return entry
+
+
+def _iter_lines_reverse(path: Path, block_size: int = 65536) -> Iterator[bytes]:
+    """Yield the non-empty lines of a file from last to first."""
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        carry = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + carry).split(b"\n")
+            # The first piece may continue in the previous block
+            carry = lines[0]
+            for line in reversed(lines[1:]):
+                if line.strip():
+                    yield line
+        if carry.strip():
+            yield carry
+
+
+# Loggers whose queued entries are drained at interpreter exit
+_live_loggers: "weakref.WeakSet[KnowledgeGapLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_loggers() -> None:
+    """Drain every live logger's queue before the writer threads are killed."""
+    for gap_logger in list(_live_loggers):
+        try:
+            gap_logger.flush()
+        except Exception:
+            pass
+
+
 class GapSeverity(str, Enum):
-    """Severity levels for knowledge gaps."""
+    """
+    Severity levels for knowledge gaps.
+    
+    Members are strings, so they compare equal to and hash like their
+    values. ``str()`` and f-strings still render them as ``GapSeverity.X``,
+    so dicts handed to callers hold ``.value``.
+    """
     LOW = "low"       # Partial information available
     MEDIUM = "medium"  # Significant gaps in knowledge
     HIGH = "high"      # No relevant information found
     CRITICAL = "critical"  # Query about important topic with no coverage
 
 
-@dataclass
+# Gap severity for confidence below each bound, checked in order; higher
+# confidence is a LOW severity gap
+_SEVERITY_BY_CONFIDENCE = (
+    (0.3, GapSeverity.HIGH),
+    (0.5, GapSeverity.MEDIUM),
+)
+
+
+# Sidecar index record per log line: (logged_at epoch seconds, severity id,
+# department hash, byte offset of the line in the log)
+_INDEX_RECORD = struct.Struct("<IBHQ")
+
+# Stable severity ids for the index; 255 marks unknown or malformed lines
+_SEVERITY_IDS = {severity: i for i, severity in enumerate(GapSeverity)}
+_UNKNOWN_SEVERITY_ID = 255
+
+
+def _department_id(department: Optional[str]) -> int:
+    """Hash a department into the index; collisions are resolved on read."""
+    if not department:
+        return 0
+    return zlib.crc32(department.encode("utf-8")) & 0xFFFF
+
+
+def _index_key(entry: Any) -> Tuple[int, int]:
+    """Severity id and department hash indexed for a log entry."""
+    if not isinstance(entry, dict):
+        return _UNKNOWN_SEVERITY_ID, 0
+    return (
+        _SEVERITY_IDS.get(entry.get("gap_severity"), _UNKNOWN_SEVERITY_ID),
+        _department_id(entry.get("department")),
+    )
+
+
+def _index_path(log_path: Path) -> Path:
+    """Sidecar index file for a log file."""
+    return log_path.with_suffix(".idx")
+
+
+def _index_is_current(log_path: Path) -> bool:
+    """Check that a log's index has one record per line of the log."""
+    index_path = _index_path(log_path)
+    log_size = log_path.stat().st_size if log_path.exists() else 0
+    if not index_path.exists():
+        return log_size == 0
+    
+    index_size = index_path.stat().st_size
+    if index_size % _INDEX_RECORD.size:
+        return False
+    if index_size == 0:
+        return log_size == 0
+    
+    # The last record must point at the last line of the log
+    with open(index_path, "rb") as f:
+        f.seek(index_size - _INDEX_RECORD.size)
+        offset = _INDEX_RECORD.unpack(f.read(_INDEX_RECORD.size))[3]
+    if offset >= log_size:
+        return False
+    with open(log_path, "rb") as f:
+        f.seek(offset)
+        tail = f.read()
+    return tail.endswith(b"\n") and tail.count(b"\n") == 1
+
+
+def _iter_indexed_lines_reverse(
+    log_path: Path,
+    severity_id: Optional[int],
+    department_id: Optional[int],
+) -> Iterator[bytes]:
+    """Yield a log's lines whose index records match, newest first."""
+    index_path = _index_path(log_path)
+    if not index_path.exists() or index_path.stat().st_size == 0:
+        return
+    
+    with open(index_path, "rb") as index, open(log_path, "rb") as f:
+        with mmap.mmap(index.fileno(), 0, access=mmap.ACCESS_READ) as records:
+            position = len(records) - _INDEX_RECORD.size
+            while position >= 0:
+                _, record_severity, record_department, offset = (
+                    _INDEX_RECORD.unpack_from(records, position)
+                )
+                position -= _INDEX_RECORD.size
+                
+                if severity_id is not None and record_severity != severity_id:
+                    continue
+                if department_id is not None and record_department != department_id:
+                    continue
+                
+                f.seek(offset)
+                yield f.readline()
+
+
+def _count_lines(log_path: Path) -> int:
+    """Number of lines in a log, read from its index when it is current."""
+    if _index_is_current(log_path):
+        return _index_path(log_path).stat().st_size // _INDEX_RECORD.size
+    with open(log_path, "rb") as f:
+        return sum(1 for _ in f)
+
+
+def _is_plain_json_text(value: str) -> bool:
+    """Whether a string appears verbatim (unescaped) in serialized JSON."""
+    return value.isascii() and value.isprintable() and not any(
+        c in value for c in '"\\'
+    )
+
+
+def _close_files(*files) -> None:
+    """Close file handles in order (log before its index)."""
+    for f in files:
+        f.close()
+
+
+# Knowledge types whose presence among relevant documents is reported
+_COVERAGE_TYPES = frozenset({"tacit", "decision", "explicit"})
+
+
+def _coverage_type(knowledge_type: Any) -> Optional[str]:
+    """Return the knowledge type if it counts towards coverage, else None."""
+    if isinstance(knowledge_type, str) and knowledge_type in _COVERAGE_TYPES:
+        return knowledge_type
+    return None
+
+
+@dataclass(slots=True)
 class GapDetectionResult:
     """
     Result of knowledge gap detection analysis.
@@ -59,6 +277,7 @@ class GapDetectionResult:
     avg_similarity_score: float = 0.0
     max_similarity_score: float = 0.0
     min_similarity_score: float = 0.0
+    filtered_count: int = 0  # Documents below the effective similarity threshold
     
     # Knowledge type coverage
     tacit_coverage: bool = False
@@ -73,6 +292,33 @@ class GapDetectionResult:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     department: Optional[str] = None
     
+    @classmethod
+    def quick_gap(
+        cls,
+        severity: GapSeverity,
+        query: str,
+        safe_response: str,
+        reason: str = "",
+        department: Optional[str] = None,
+        confidence: float = 0.0,
+    ) -> "GapDetectionResult":
+        """
+        Build a gap result that has no retrieval statistics.
+        
+        Only the fields that differ from their defaults are passed, which
+        keeps the no-documents path cheap.
+        """
+        return cls(
+            False,
+            confidence,
+            True,
+            severity,
+            reason,
+            safe_response=safe_response,
+            query=query,
+            department=department,
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for logging and serialization."""
         return {
@@ -84,6 +330,7 @@ class GapDetectionResult:
             "num_relevant_documents": self.num_relevant_documents,
             "avg_similarity_score": self.avg_similarity_score,
             "max_similarity_score": self.max_similarity_score,
+            "filtered_count": self.filtered_count,
             "tacit_coverage": self.tacit_coverage,
             "decision_coverage": self.decision_coverage,
             "explicit_coverage": self.explicit_coverage,
@@ -91,6 +338,20 @@ class GapDetectionResult:
             "timestamp": self.timestamp,
             "department": self.department,
         }
+    
+    def to_log_entry(self) -> Dict[str, Any]:
+        """Convert to the compact entry written to the gap log."""
+        return {
+            "timestamp": self.timestamp,
+            "query": self.query,
+            "confidence_score": self.confidence_score,
+            "gap_severity": self.gap_severity.value,
+            "gap_reason": self.gap_reason,
+            "num_relevant_documents": self.num_relevant_documents,
+            "avg_similarity_score": self.avg_similarity_score,
+            "filtered_count": self.filtered_count,
+            "department": self.department,
+        }
 
 
 class KnowledgeGapDetector:
@@ -104,7 +365,8 @@ class KnowledgeGapDetector:
     Configuration:
     - confidence_threshold: Minimum confidence to proceed with generation
     - min_relevant_docs: Minimum number of relevant documents required
-    - similarity_threshold: Minimum similarity score to consider relevant
+    - similarity_threshold: Minimum similarity score to consider relevant;
+      lowered for short queries, which embed with less signal
     
     Example:
         >>> detector = KnowledgeGapDetector()
@@ -137,12 +399,27 @@ class KnowledgeGapDetector:
         ),
     }
     
+    # Number of distinct evaluations kept in the per-detector cache
+    EVALUATION_CACHE_SIZE = 1024
+    
+    # Adaptive similarity threshold: queries shorter than SHORT_QUERY_TOKENS
+    # lower the threshold by THRESHOLD_STEP per missing token, down to
+    # MIN_SIMILARITY_THRESHOLD
+    SHORT_QUERY_TOKENS = 5
+    THRESHOLD_STEP = 0.05
+    MIN_SIMILARITY_THRESHOLD = 0.2
+    
+    # Score spread below which a retrieval is left unnormalized
+    MIN_SCORE_RANGE = 1e-6
+    
     def __init__(
         self,
         confidence_threshold: Optional[float] = None,
         min_relevant_docs: int = 2,
         similarity_threshold: Optional[float] = None,
         gap_logger: Optional['KnowledgeGapLogger'] = None,
+        adaptive_threshold: bool = True,
+        normalize_scores: bool = False,
     ):
         """
         Initialize the knowledge gap detector.
@@ -154,6 +431,12 @@ class KnowledgeGapDetector:
             similarity_threshold: Minimum similarity for relevance.
                                 Defaults to settings.RETRIEVER_SCORE_THRESHOLD.
             gap_logger: Optional gap logger instance for persistent logging.
+            adaptive_threshold: Lower the similarity threshold for short
+                                queries instead of applying it as-is.
+            normalize_scores: Min-max normalize each retrieval's scores before
+                              applying the similarity threshold and computing
+                              confidence, for retrievers whose scores are not
+                              on a 0-1 similarity scale.
         """
         self.settings = get_settings()
         
@@ -163,15 +446,23 @@ class KnowledgeGapDetector:
         )
         self.min_relevant_docs = min_relevant_docs
         self.similarity_threshold = similarity_threshold or self.settings.RETRIEVER_SCORE_THRESHOLD
+        self.adaptive_threshold = adaptive_threshold
+        self.normalize_scores = normalize_scores
         
         # Initialize gap logger
         self.gap_logger = gap_logger or KnowledgeGapLogger()
         
+        # Memoized analyses keyed on query and retrieval signature
+        self._eval_cache: "OrderedDict[tuple, GapDetectionResult]" = OrderedDict()
+        self._eval_cache_lock = threading.Lock()
+        
         logger.info(
             f"KnowledgeGapDetector initialized: "
             f"confidence_threshold={self.confidence_threshold}, "
             f"min_docs={self.min_relevant_docs}, "
-            f"similarity_threshold={self.similarity_threshold}"
+            f"similarity_threshold={self.similarity_threshold}, "
+            f"adaptive_threshold={self.adaptive_threshold}, "
+            f"normalize_scores={self.normalize_scores}"
         )
     
     def evaluate(
@@ -186,6 +477,8 @@ class KnowledgeGapDetector:
         
         This method analyzes the retrieved documents and their similarity
         scores to determine if sufficient knowledge exists to answer the query.
+        Repeated evaluations of the same query and retrieval are answered
+        from an LRU cache; detected gaps are still logged every time.
         
         Args:
             query: The user's question.
@@ -208,39 +501,123 @@ class KnowledgeGapDetector:
                 self.gap_logger.log(result)
             return result
         
-        # Calculate similarity statistics
-        scores = [score for _, score in documents_with_scores]
-        avg_score = sum(scores) / len(scores)
-        max_score = max(scores)
-        min_score = min(scores)
-        
-        # Count relevant documents (above threshold)
-        relevant_docs = [
-            (doc, score) for doc, score in documents_with_scores
-            if score >= self.similarity_threshold
-        ]
-        num_relevant = len(relevant_docs)
-        
-        # Analyze knowledge type coverage
-        tacit_coverage = any(
-            doc.metadata.get("knowledge_type") == "tacit"
-            for doc, _ in relevant_docs
+        # The analysis only depends on each document's score and knowledge
+        # type, so identical retrievals are served from the cache
+        signature = tuple(
+            (score, _coverage_type(doc.metadata.get("knowledge_type")))
+            for doc, score in documents_with_scores
         )
-        decision_coverage = any(
-            doc.metadata.get("knowledge_type") == "decision"
-            for doc, _ in relevant_docs
+        options = (
+            self.similarity_threshold,
+            self.confidence_threshold,
+            self.min_relevant_docs,
+            self.adaptive_threshold,
+            self.normalize_scores,
         )
-        explicit_coverage = any(
-            doc.metadata.get("knowledge_type") == "explicit"
-            for doc, _ in relevant_docs
+        cached = self._evaluate_cached(query, department, signature, options)
+        
+        # Hand out a fresh copy so callers never share the cached result
+        result = replace(cached, timestamp=datetime.now().isoformat())
+        
+        if log_gap and result.gap_detected:
+            self.gap_logger.log(result)
+        
+        logger.debug(
+            f"Gap detection for '{query[:50]}...': "
+            f"sufficient={result.has_sufficient_knowledge}, "
+            f"confidence={result.confidence_score:.2f}"
         )
         
+        return result
+    
+    def _evaluate_cached(
+        self,
+        query: str,
+        department: Optional[str],
+        signature: Tuple[Tuple[float, Optional[str]], ...],
+        options: Tuple[float, float, int, bool, bool],
+    ) -> GapDetectionResult:
+        """Analyze a retrieval, reusing the result for inputs seen before."""
+        key = (query, department, signature, options)
+        
+        with self._eval_cache_lock:
+            cached = self._eval_cache.get(key)
+            if cached is not None:
+                self._eval_cache.move_to_end(key)
+                return cached
+        
+        result = self._evaluate_uncached(query, department, signature, options)
+        
+        with self._eval_cache_lock:
+            self._eval_cache[key] = result
+            if len(self._eval_cache) > self.EVALUATION_CACHE_SIZE:
+                self._eval_cache.popitem(last=False)
+        
+        return result
+    
+    def _evaluate_uncached(
+        self,
+        query: str,
+        department: Optional[str],
+        signature: Tuple[Tuple[float, Optional[str]], ...],
+        options: Tuple[float, float, int, bool, bool],
+    ) -> GapDetectionResult:
+        """
+        Analyze (score, coverage type) pairs for a query.
+        
+        ``options`` is only part of the cache key, so changing the
+        detector's thresholds or flags never serves stale results.
+        """
+        threshold = self._effective_similarity_threshold(query)
+        relevance_threshold = threshold
+        
+        # With normalization the threshold applies to min-max scaled scores;
+        # mapping it back onto the raw scale keeps the pass below unchanged
+        score_range = 0.0
+        if self.normalize_scores:
+            low = min(score for score, _ in signature)
+            score_range = max(score for score, _ in signature) - low
+            if score_range > self.MIN_SCORE_RANGE:
+                relevance_threshold = low + threshold * score_range
+        normalized = score_range > self.MIN_SCORE_RANGE
+        
+        # Calculate similarity statistics, count relevant documents (above
+        # threshold) and their knowledge type coverage in a single pass
+        total_score = 0.0
+        max_score = min_score = signature[0][0]
+        num_relevant = 0
+        covered_types = set()
+        for score, knowledge_type in signature:
+            total_score += score
+            if score > max_score:
+                max_score = score
+            elif score < min_score:
+                min_score = score
+            
+            if score >= relevance_threshold:
+                num_relevant += 1
+                if knowledge_type is not None:
+                    covered_types.add(knowledge_type)
+        
+        avg_score = total_score / len(signature)
+        filtered_count = len(signature) - num_relevant
+        tacit_coverage = "tacit" in covered_types
+        decision_coverage = "decision" in covered_types
+        explicit_coverage = "explicit" in covered_types
+        
+        # Decisions use normalized statistics; the result keeps raw ones
+        if normalized:
+            avg_factor = (avg_score - min_score) / score_range
+            max_factor = 1.0
+        else:
+            avg_factor, max_factor = avg_score, max_score
+        
         # Calculate confidence score
         confidence = self._calculate_confidence(
             num_relevant=num_relevant,
-            avg_score=avg_score,
-            max_score=max_score,
-            total_docs=len(documents_with_scores),
+            avg_score=avg_factor,
+            max_score=max_factor,
+            total_docs=len(signature),
         )
         
         # Determine if knowledge is sufficient
@@ -248,7 +625,7 @@ class KnowledgeGapDetector:
         
         # Create result
         if has_sufficient:
-            result = GapDetectionResult(
+            return GapDetectionResult(
                 has_sufficient_knowledge=True,
                 confidence_score=confidence,
                 gap_detected=False,
@@ -256,6 +633,7 @@ class KnowledgeGapDetector:
                 avg_similarity_score=avg_score,
                 max_similarity_score=max_score,
                 min_similarity_score=min_score,
+                filtered_count=filtered_count,
                 tacit_coverage=tacit_coverage,
                 decision_coverage=decision_coverage,
                 explicit_coverage=explicit_coverage,
@@ -267,16 +645,17 @@ class KnowledgeGapDetector:
             severity = self._determine_severity(
                 confidence=confidence,
                 num_relevant=num_relevant,
-                max_score=max_score,
+                max_score=max_factor,
             )
             
             reason = self._generate_gap_reason(
                 confidence=confidence,
                 num_relevant=num_relevant,
-                max_score=max_score,
+                max_score=max_factor,
+                similarity_threshold=threshold,
             )
             
-            result = GapDetectionResult(
+            return GapDetectionResult(
                 has_sufficient_knowledge=False,
                 confidence_score=confidence,
                 gap_detected=True,
@@ -286,6 +665,7 @@ class KnowledgeGapDetector:
                 avg_similarity_score=avg_score,
                 max_similarity_score=max_score,
                 min_similarity_score=min_score,
+                filtered_count=filtered_count,
                 tacit_coverage=tacit_coverage,
                 decision_coverage=decision_coverage,
                 explicit_coverage=explicit_coverage,
@@ -293,16 +673,53 @@ class KnowledgeGapDetector:
                 query=query,
                 department=department,
             )
+    
+    def evaluate_batch(
+        self,
+        queries: List[str],
+        results: List[List[Tuple[Document, float]]],
+        department: Optional[str] = None,
+        log_gap: bool = True,
+    ) -> List[GapDetectionResult]:
+        """
+        Evaluate retrieval results for several queries at once.
+        
+        Args:
+            queries: The user questions.
+            results: Retrieved (document, similarity_score) tuples for each
+                     query, in the same order as ``queries``.
+            department: Optional department context for logging.
+            log_gap: Whether to log detected gaps.
             
-            if log_gap:
-                self.gap_logger.log(result)
+        Returns:
+            One GapDetectionResult per query.
+        """
+        if len(queries) != len(results):
+            raise ValueError(
+                f"Got {len(queries)} queries but {len(results)} result lists"
+            )
         
-        logger.debug(
-            f"Gap detection for '{query[:50]}...': "
-            f"sufficient={has_sufficient}, confidence={confidence:.2f}"
-        )
+        evaluate = self.evaluate
+        return [
+            evaluate(query, documents_with_scores, department, log_gap)
+            for query, documents_with_scores in zip(queries, results)
+        ]
+    
+    def _effective_similarity_threshold(self, query: str) -> float:
+        """Similarity threshold for a query, relaxed for short queries."""
+        base = self.similarity_threshold
+        if not self.adaptive_threshold:
+            return base
         
-        return result
+        missing_tokens = max(0, self.SHORT_QUERY_TOKENS - len(query.split()))
+        if not missing_tokens:
+            return base
+        adjusted = max(
+            self.MIN_SIMILARITY_THRESHOLD,
+            base - self.THRESHOLD_STEP * missing_tokens,
+        )
+        # Never raise a threshold that is already below the floor
+        return min(base, adjusted)
     
     def _calculate_confidence(
         self,
@@ -344,24 +761,23 @@ class KnowledgeGapDetector:
         max_score: float,
     ) -> GapSeverity:
         """Determine the severity level of a knowledge gap."""
-        if num_relevant == 0 and max_score < 0.3:
-            return GapSeverity.HIGH
-        elif num_relevant == 0:
-            return GapSeverity.MEDIUM
-        elif confidence < 0.3:
-            return GapSeverity.HIGH
-        elif confidence < 0.5:
-            return GapSeverity.MEDIUM
-        else:
-            return GapSeverity.LOW
+        if num_relevant == 0:
+            return GapSeverity.HIGH if max_score < 0.3 else GapSeverity.MEDIUM
+        for upper_bound, severity in _SEVERITY_BY_CONFIDENCE:
+            if confidence < upper_bound:
+                return severity
+        return GapSeverity.LOW
     
     def _generate_gap_reason(
         self,
         confidence: float,
         num_relevant: int,
         max_score: float,
+        similarity_threshold: Optional[float] = None,
     ) -> str:
         """Generate a human-readable reason for the gap."""
+        if similarity_threshold is None:
+            similarity_threshold = self.similarity_threshold
         reasons = []
         
         if num_relevant < self.min_relevant_docs:
@@ -370,10 +786,10 @@ class KnowledgeGapDetector:
                 f"(minimum {self.min_relevant_docs} required)"
             )
         
-        if max_score < self.similarity_threshold:
+        if max_score < similarity_threshold:
             reasons.append(
                 f"Best similarity score ({max_score:.2f}) below threshold "
-                f"({self.similarity_threshold})"
+                f"({similarity_threshold:g})"
             )
         
         if confidence < self.confidence_threshold:
@@ -392,18 +808,11 @@ class KnowledgeGapDetector:
         department: Optional[str] = None,
     ) -> GapDetectionResult:
         """Create a gap result for the case of no documents."""
-        return GapDetectionResult(
-            has_sufficient_knowledge=False,
-            confidence_score=0.0,
-            gap_detected=True,
-            gap_severity=gap_severity,
-            gap_reason=reason,
-            num_relevant_documents=0,
-            avg_similarity_score=0.0,
-            max_similarity_score=0.0,
-            min_similarity_score=0.0,
-            safe_response=self.SAFE_RESPONSES[gap_severity],
+        return GapDetectionResult.quick_gap(
+            severity=gap_severity,
             query=query,
+            safe_response=self.SAFE_RESPONSES[gap_severity],
+            reason=reason,
             department=department,
         )
 
@@ -417,16 +826,46 @@ class KnowledgeGapLogger:
     - Prioritize knowledge documentation efforts
     - Track knowledge base improvement over time
     
+    Entries are serialized on the caller's thread and handed to a background
+    writer thread, which appends them in batches through a long-lived
+    buffered file handle. The handle is flushed at most every
+    ``flush_interval`` seconds, whenever the writer goes idle, and whenever
+    the log is read.
+    
+    A sidecar ``.idx`` file holds a fixed-size record (severity, department
+    hash, byte offset) per log line so filtered reads can seek straight to
+    candidate entries instead of parsing the whole log.
+    
+    Once the active log reaches ``max_bytes`` it is renamed to a
+    timestamped segment (``knowledge_gaps.<rotated-at>.jsonl``) and a new
+    active log is started. Recent-gap reads stop at the newest segments
+    they need, and retention deletes expired segments without reading them.
+    
     Example:
         >>> logger = KnowledgeGapLogger()
         >>> logger.log(gap_result)
         >>> gaps = logger.get_recent_gaps(limit=10)
     """
     
+    # Size of the in-process write buffer
+    WRITE_BUFFER_SIZE = 64 * 1024
+    
+    # Maximum number of serialized entries waiting for the writer thread
+    QUEUE_SIZE = 10_000
+    
+    # Maximum number of entries appended per write call
+    WRITE_BATCH_SIZE = 128
+    
+    # strftime format of the rotation time in segment file names
+    SEGMENT_TIME_FORMAT = "%Y%m%dT%H%M%S%f"
+    
     def __init__(
         self,
         log_dir: Optional[str] = None,
         log_filename: str = "knowledge_gaps.jsonl",
+        flush_interval: float = 1.0,
+        durable: bool = False,
+        max_bytes: int = 64 * 1024 * 1024,
     ):
         """
         Initialize the gap logger.
@@ -434,19 +873,51 @@ class KnowledgeGapLogger:
         Args:
             log_dir: Directory for gap logs. Defaults to 'logs'.
             log_filename: Name of the log file.
+            flush_interval: Maximum seconds a logged entry may sit in the
+                            write buffer before being flushed.
+            durable: If True, write, flush and fsync every entry before
+                     returning from log() instead of queueing it.
+            max_bytes: Size at which the active log is rotated into a
+                       segment, checked after every entry, so a segment
+                       exceeds it by at most its last entry. 0 disables
+                       rotation.
         """
         self.log_dir = Path(log_dir or "logs")
         self.log_file = self.log_dir / log_filename
+        self.index_file = self.log_file.with_suffix(".idx")
+        self.flush_interval = flush_interval
+        self.durable = durable
+        self.max_bytes = max_bytes
         
         # Ensure log directory exists
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
+        # Append handles for the log and its index, opened on the first
+        # logged gap
+        self._lock = threading.Lock()
+        self._file = None
+        self._index = None
+        self._offset = 0
+        self._last_flush = time.monotonic()
+        
+        # Pending entries and the writer thread draining them. The thread
+        # is started on demand and exits once the queue has been idle for
+        # flush_interval seconds.
+        self._queue: "queue.Queue[Tuple[bytes, int, int]]" = queue.Queue(
+            maxsize=self.QUEUE_SIZE
+        )
+        self._writer: Optional[threading.Thread] = None
+        _live_loggers.add(self)
+        
         logger.info(f"KnowledgeGapLogger initialized: {self.log_file}")
     
     def log(self, gap_result: GapDetectionResult) -> None:
         """
         Log a knowledge gap to persistent storage.
         
+        The entry is queued for the background writer; call flush() to
+        wait until it has reached the log file.
+        
         Args:
             gap_result: The gap detection result to log.
         """
@@ -454,20 +925,26 @@ class KnowledgeGapLogger:
             return  # Don't log non-gaps
         
         try:
-            log_entry = {
-                "timestamp": gap_result.timestamp,
-                "query": gap_result.query,
-                "confidence_score": gap_result.confidence_score,
-                "gap_severity": gap_result.gap_severity.value,
-                "gap_reason": gap_result.gap_reason,
-                "num_relevant_documents": gap_result.num_relevant_documents,
-                "avg_similarity_score": gap_result.avg_similarity_score,
-                "department": gap_result.department,
-            }
+            entry = gap_result.to_log_entry()
+            item = (_dump_line(entry), *_index_key(entry))
             
-            # Append to JSONL file
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_entry) + "\n")
+            if self.durable:
+                self._write([item])
+            else:
+                # Create the log file before returning, even though the
+                # entry itself is written by the background thread
+                if self._file is None:
+                    with self._lock:
+                        if self._file is None:
+                            self._open_locked()
+                
+                try:
+                    self._queue.put_nowait(item)
+                except queue.Full:
+                    # Writer is falling behind; append on the caller's thread
+                    self._write([item])
+                else:
+                    self._ensure_writer()
             
             logger.info(
                 f"Knowledge gap logged: severity={gap_result.gap_severity.value}, "
@@ -477,6 +954,174 @@ class KnowledgeGapLogger:
         except Exception as e:
             logger.error(f"Failed to log knowledge gap: {e}")
     
+    def flush(self) -> None:
+        """Wait for queued entries and write them to the log file."""
+        self._queue.join()
+        with self._lock:
+            if self._file is not None:
+                self._flush_locked(time.monotonic())
+    
+    def close(self) -> None:
+        """Flush and close the log file; it is reopened on the next entry."""
+        self._queue.join()
+        with self._lock:
+            self._close_locked()
+    
+    def _ensure_writer(self) -> None:
+        """Start the writer thread if it is not running."""
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._drain,
+                    name=f"KnowledgeGapLogger-{self.log_file.name}",
+                    daemon=True,
+                )
+                self._writer.start()
+    
+    def _drain(self) -> None:
+        """Writer thread: append queued entries in batches until idle."""
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                with self._lock:
+                    # log() enqueues before checking _writer, so an entry
+                    # queued after this check will start a new thread
+                    if self._queue.empty():
+                        self._writer = None
+                        if self._file is not None:
+                            self._flush_locked(time.monotonic())
+                        return
+                continue
+            
+            batch = [item]
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self._write(batch)
+            except Exception as e:
+                logger.error(f"Failed to write knowledge gaps: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def _write(self, items: List[Tuple[bytes, int, int]]) -> None:
+        """
+        Append serialized entries, flushing if the interval has elapsed.
+        
+        The size limit is checked after every entry, so a batch that
+        reaches ``max_bytes`` is split across the rotated and new logs.
+        """
+        with self._lock:
+            logged_at = int(time.time()) & 0xFFFFFFFF
+            start = 0
+            while start < len(items):
+                if self._file is None:
+                    self._open_locked()
+                
+                offset = self._offset
+                end = start
+                records = []
+                while end < len(items):
+                    line, severity_id, department_id = items[end]
+                    records.append(_INDEX_RECORD.pack(
+                        logged_at, severity_id, department_id, offset
+                    ))
+                    offset += len(line)
+                    end += 1
+                    if self.max_bytes and offset >= self.max_bytes:
+                        break
+                
+                self._file.write(b"".join(item[0] for item in items[start:end]))
+                self._index.write(b"".join(records))
+                self._offset = offset
+                start = end
+                
+                now = time.monotonic()
+                if self.durable or now - self._last_flush >= self.flush_interval:
+                    self._flush_locked(now)
+                
+                if self.max_bytes and self._offset >= self.max_bytes:
+                    self._rotate_locked()
+    
+    def _rotate_locked(self) -> None:
+        """Move the active log to a segment. Caller must hold the lock."""
+        self._close_locked()
+        
+        stamp = datetime.now().strftime(self.SEGMENT_TIME_FORMAT)
+        segment = self.log_file.with_name(
+            f"{self.log_file.stem}.{stamp}{self.log_file.suffix}"
+        )
+        os.replace(self.log_file, segment)
+        if self.index_file.exists():
+            os.replace(self.index_file, _index_path(segment))
+        
+        logger.info(f"Rotated knowledge gap log to {segment.name}")
+    
+    def _segments(self) -> List[Tuple[datetime, Path]]:
+        """Rotated segments with their rotation times, oldest first."""
+        segments = []
+        pattern = f"{self.log_file.stem}.*{self.log_file.suffix}"
+        for path in self.log_dir.glob(pattern):
+            stamp = path.name[len(self.log_file.stem) + 1:-len(self.log_file.suffix)]
+            try:
+                rotated_at = datetime.strptime(stamp, self.SEGMENT_TIME_FORMAT)
+            except ValueError:
+                continue
+            segments.append((rotated_at, path))
+        segments.sort()
+        return segments
+    
+    def _open_locked(self) -> None:
+        """Open the append handles. Caller must hold the lock."""
+        if not _index_is_current(self.log_file):
+            self._rebuild_index_locked()
+        
+        self._file = open(self.log_file, "ab", buffering=self.WRITE_BUFFER_SIZE)
+        self._index = open(self.index_file, "ab")
+        self._offset = self._file.tell()
+        # Flush buffered entries when the logger is collected or at exit
+        self._finalizer = weakref.finalize(
+            self, _close_files, self._file, self._index
+        )
+    
+    def _flush_locked(self, now: float) -> None:
+        """Flush the append handles. Caller must hold the lock."""
+        # The log goes first so the index never points past its end
+        for f in (self._file, self._index):
+            f.flush()
+            if self.durable:
+                os.fsync(f.fileno())
+        self._last_flush = now
+    
+    def _close_locked(self) -> None:
+        """Close the append handles. Caller must hold the lock."""
+        if self._file is not None:
+            self._finalizer()
+            self._file = None
+            self._index = None
+    
+    def _rebuild_index_locked(self) -> None:
+        """Rewrite the index from the log. Caller must hold the lock."""
+        logged_at = int(time.time()) & 0xFFFFFFFF
+        with open(self.index_file, "wb") as index:
+            if not self.log_file.exists():
+                return
+            with open(self.log_file, "rb") as f:
+                offset = 0
+                for line in f:
+                    try:
+                        key = _index_key(_load_line(line))
+                    except json.JSONDecodeError:
+                        key = (_UNKNOWN_SEVERITY_ID, 0)
+                    index.write(_INDEX_RECORD.pack(logged_at, *key, offset))
+                    offset += len(line)
+        logger.info(f"Rebuilt knowledge gap index: {self.index_file}")
+    
     def get_recent_gaps(
         self,
         limit: int = 100,
@@ -494,113 +1139,211 @@ class KnowledgeGapLogger:
         Returns:
             List of gap log entries.
         """
-        if not self.log_file.exists():
-            return []
+        # Substrings every matching line must contain; checked on the raw
+        # bytes so non-matching lines are never parsed
+        needles = []
+        if severity:
+            needles.append(severity.encode("utf-8"))
+        if department and _is_plain_json_text(department):
+            needles.append(department.encode("utf-8"))
         
         gaps = []
+        if limit <= 0:
+            return gaps
         try:
-            with open(self.log_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line.strip())
-                        
-                        # Apply filters
-                        if severity and entry.get("gap_severity") != severity.value:
-                            continue
-                        if department and entry.get("department") != department:
-                            continue
-                        
-                        gaps.append(entry)
-                    except json.JSONDecodeError:
-                        continue
+            self.flush()
+            
+            for line in self._iter_lines_newest_first(severity, department):
+                if not all(needle in line for needle in needles):
+                    continue
+                entry = _load_entry(line)
+                if entry is None:
+                    continue
+                
+                # Apply filters
+                if severity and entry.get("gap_severity") != severity:
+                    continue
+                if department and entry.get("department") != department:
+                    continue
+                
+                gaps.append(entry)
+                if len(gaps) >= limit:
+                    break
             
-            # Return most recent first
-            gaps.reverse()
-            return gaps[:limit]
+            # Most recent first
+            return gaps
             
         except Exception as e:
             logger.error(f"Failed to read knowledge gaps: {e}")
             return []
     
+    def _iter_lines_newest_first(
+        self,
+        severity: Optional[GapSeverity],
+        department: Optional[str],
+    ) -> Iterator[bytes]:
+        """Yield candidate lines from the active log, then older segments."""
+        severity_id = _SEVERITY_IDS[severity] if severity else None
+        department_id = _department_id(department) if department else None
+        
+        paths = [self.log_file]
+        paths.extend(path for _, path in reversed(self._segments()))
+        for path in paths:
+            if not path.exists():
+                continue
+            if (severity or department) and _index_is_current(path):
+                yield from _iter_indexed_lines_reverse(path, severity_id, department_id)
+            else:
+                # Walk the log backwards so only the tail is read
+                yield from _iter_lines_reverse(path)
+    
     def get_gap_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about logged knowledge gaps.
         
+        Statistics are aggregated in a single streaming pass over the log,
+        without holding the parsed entries in memory.
+        
         Returns:
             Dictionary with gap statistics.
         """
-        gaps = self.get_recent_gaps(limit=10000)
+        severity_counts: Counter = Counter()
+        dept_counts: Counter = Counter()
+        confidence_sum = 0.0
+        total = 0
+        earliest = latest = None
         
-        if not gaps:
+        try:
+            for gap in self._iter_entries():
+                if total == 0:
+                    earliest = gap.get("timestamp")
+                latest = gap.get("timestamp")
+                total += 1
+                
+                severity_counts[gap.get("gap_severity", "unknown")] += 1
+                dept_counts[gap.get("department") or "unknown"] += 1
+                confidence_sum += gap.get("confidence_score", 0)
+        except Exception as e:
+            logger.error(f"Failed to read knowledge gaps: {e}")
             return {"total_gaps": 0}
         
-        # Count by severity
-        severity_counts = {}
-        for gap in gaps:
-            severity = gap.get("gap_severity", "unknown")
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
-        
-        # Count by department
-        dept_counts = {}
-        for gap in gaps:
-            dept = gap.get("department") or "unknown"
-            dept_counts[dept] = dept_counts.get(dept, 0) + 1
-        
-        # Calculate averages
-        avg_confidence = sum(g.get("confidence_score", 0) for g in gaps) / len(gaps)
+        if total == 0:
+            return {"total_gaps": 0}
         
         return {
-            "total_gaps": len(gaps),
-            "by_severity": severity_counts,
-            "by_department": dept_counts,
-            "avg_confidence": round(avg_confidence, 3),
-            "earliest": gaps[-1].get("timestamp") if gaps else None,
-            "latest": gaps[0].get("timestamp") if gaps else None,
+            "total_gaps": total,
+            "by_severity": dict(severity_counts),
+            "by_department": dict(dept_counts),
+            "avg_confidence": round(confidence_sum / total, 3),
+            "earliest": earliest,
+            "latest": latest,
         }
     
+    def _iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """Yield log entries oldest first, skipping malformed lines."""
+        self.flush()
+        
+        paths = [path for _, path in self._segments()]
+        paths.append(self.log_file)
+        for path in paths:
+            if not path.exists():
+                continue
+            with open(path, "rb") as f:
+                for line in f:
+                    entry = _load_entry(line)
+                    if entry is not None:
+                        yield entry
+    
     def clear_old_logs(self, days: int = 90) -> int:
         """
         Clear log entries older than specified days.
         
+        Segments rotated before the cutoff are deleted outright; only the
+        log files that straddle the cutoff are rewritten.
+        
         Args:
             days: Number of days to retain.
             
         Returns:
             Number of entries removed.
         """
-        if not self.log_file.exists():
-            return 0
+        self._queue.join()
+        with self._lock:
+            # Release the append handle so the rewrite cannot interleave
+            # with buffered entries
+            self._close_locked()
+            return self._clear_old_logs_locked(days)
+    
+    def _clear_old_logs_locked(self, days: int) -> int:
+        """Drop entries older than ``days``. Caller must hold the lock."""
+        cutoff_time = datetime.now() - timedelta(days=days)
+        # ISO 8601 timestamps sort chronologically as strings
+        cutoff = cutoff_time.isoformat()[:19]
+        removed_count = 0
         
-        cutoff = datetime.now().isoformat()[:10]  # Simplified: compare dates
-        from datetime import timedelta
-        cutoff_date = datetime.now() - timedelta(days=days)
+        try:
+            # Each segment holds entries logged after the previous rotation
+            previous_rotation = None
+            for rotated_at, segment in self._segments():
+                if rotated_at < cutoff_time:
+                    removed_count += _count_lines(segment)
+                    segment.unlink()
+                    _index_path(segment).unlink(missing_ok=True)
+                elif previous_rotation is None or previous_rotation < cutoff_time:
+                    removed_count += self._drop_old_entries(segment, cutoff)
+                previous_rotation = rotated_at
+            
+            if self.log_file.exists() and (
+                previous_rotation is None or previous_rotation < cutoff_time
+            ):
+                removed_count += self._drop_old_entries(self.log_file, cutoff)
+            
+            logger.info(f"Cleared {removed_count} old gap log entries")
+            return removed_count
+            
+        except Exception as e:
+            logger.error(f"Failed to clear old logs: {e}")
+            return removed_count
+    
+    def _drop_old_entries(self, log_path: Path, cutoff: str) -> int:
+        """Rewrite one log file without entries older than ``cutoff``."""
+        logged_at = int(time.time()) & 0xFFFFFFFF
         
-        kept_entries = []
+        # Survivors are streamed into sibling files that replace the log
+        # and its index once complete
+        index_path = _index_path(log_path)
+        tmp_log = log_path.with_suffix(".tmp")
+        tmp_index = index_path.with_suffix(".idx.tmp")
         removed_count = 0
         
         try:
-            with open(self.log_file, "r", encoding="utf-8") as f:
+            with open(log_path, "rb") as f, \
+                    open(tmp_log, "wb") as out, \
+                    open(tmp_index, "wb") as index:
+                offset = 0
                 for line in f:
                     try:
-                        entry = json.loads(line.strip())
-                        entry_date = datetime.fromisoformat(
-                            entry.get("timestamp", "2000-01-01")[:19]
-                        )
-                        
-                        if entry_date >= cutoff_date:
-                            kept_entries.append(line)
-                        else:
+                        entry = _load_line(line)
+                    except json.JSONDecodeError:
+                        entry = None
+                    
+                    if isinstance(entry, dict):
+                        timestamp = entry.get("timestamp") or ""
+                        if isinstance(timestamp, str) and timestamp[:19] < cutoff:
                             removed_count += 1
-                    except (json.JSONDecodeError, ValueError):
-                        kept_entries.append(line)  # Keep malformed entries
-            
-            # Rewrite file with kept entries
-            with open(self.log_file, "w", encoding="utf-8") as f:
-                f.writelines(kept_entries)
+                            continue
+                    # Malformed entries are kept
+                    key = _index_key(entry)
+                    
+                    out.write(line)
+                    index.write(_INDEX_RECORD.pack(logged_at, *key, offset))
+                    offset += len(line)
             
-            logger.info(f"Cleared {removed_count} old gap log entries")
+            os.replace(tmp_log, log_path)
+            os.replace(tmp_index, index_path)
             return removed_count
             
-        except Exception as e:
-            logger.error(f"Failed to clear old logs: {e}")
-            return 0
+        except Exception:
+            tmp_log.unlink(missing_ok=True)
+            tmp_index.unlink(missing_ok=True)
+            raise
@@ -9,16 +9,100 @@ This supports Feature 1: Tacit Knowledge Extraction by enabling the system
 to identify and prioritize experiential, lessons-learned content.
 """
 
+import hashlib
 import re
+import sys
+import threading
+from collections import OrderedDict
 from enum import Enum
-from pathlib import Path
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 from core.logger import get_logger
 
+try:
+    import hyperscan
+    HAVE_HYPERSCAN = True
+except ImportError:
+    HAVE_HYPERSCAN = False
+
 logger = get_logger(__name__)
 
+# Backreferences change meaning when patterns are fused into one regex
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+# Escapes that can spell a letter (\x41, \u0041, \N{...}, octal) and escapes in general
+_LETTER_ESCAPE = re.compile(r"\\[xuUN0-7]")
+_ESCAPE = re.compile(r"\\.")
+
+
+def _compile_union(
+    patterns: List[str], ignore_case: bool = True
+) -> Optional["re.Pattern[str]"]:
+    """
+    Fuse patterns into one alternation, case-insensitive by default.
+    
+    The union only tells whether any pattern matches; it cannot report every
+    pattern that does, since alternatives that match at the same position
+    shadow each other. Returns None if the patterns cannot be fused safely.
+    """
+    if any(_BACKREFERENCE.search(p) for p in patterns):
+        return None
+    try:
+        return re.compile(
+            "|".join(f"(?:{p})" for p in patterns),
+            re.IGNORECASE if ignore_case else 0,
+        )
+    except re.error:
+        return None
+
+
+def _compile_literals(literals: List[bytes]) -> Optional["hyperscan.Database"]:
+    """
+    Compile literals into one Hyperscan database, with ids in list order.
+    
+    Returns None if Hyperscan is not installed or rejects the literals (e.g.
+    an empty one), in which case callers fall back to substring search.
+    """
+    if not HAVE_HYPERSCAN or not literals:
+        return None
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=literals,
+            ids=list(range(len(literals))),
+            elements=len(literals),
+            flags=hyperscan.HS_FLAG_SINGLEMATCH,
+            literal=True,
+        )
+    except hyperscan.error as e:
+        logger.warning(f"Hyperscan rejected content keywords, using substring search: {e}")
+        return None
+    return database
+
+
+def _collect_match(match_id: int, start: int, end: int, flags: int, found: set) -> None:
+    """Hyperscan match handler: record which literal matched."""
+    found.add(match_id)
+
+
+def _indicator(kind: str, value: str) -> str:
+    """Build an indicator label, interned so every result shares one copy."""
+    return sys.intern(f"{kind}:{value}")
+
+
+def _is_lowercase_pattern(pattern: str) -> bool:
+    """
+    Whether IGNORECASE cannot change what pattern matches in lowercase ASCII.
+    
+    True for ASCII patterns with no uppercase letters outside escapes (so
+    \\S or \\D are fine) and no escapes that could spell an uppercase letter.
+    """
+    if not pattern.isascii() or _LETTER_ESCAPE.search(pattern):
+        return False
+    return not any(c.isupper() for c in _ESCAPE.sub("", pattern))
+
 
 class KnowledgeType(str, Enum):
     """
@@ -36,7 +120,7 @@ class KnowledgeType(str, Enum):
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationResult:
     """Result of knowledge classification."""
     knowledge_type: KnowledgeType
@@ -54,6 +138,14 @@ class ClassificationResult:
             "tacit_indicators": self.tacit_indicators,
             "decision_indicators": self.decision_indicators,
         }
+    
+    def copy(self) -> "ClassificationResult":
+        """Return a copy whose indicator lists are not shared."""
+        return replace(
+            self,
+            tacit_indicators=list(self.tacit_indicators),
+            decision_indicators=list(self.decision_indicators),
+        )
 
 
 class KnowledgeClassifier:
@@ -202,6 +294,49 @@ class KnowledgeClassifier:
         "specifications",
     ]
     
+    # Query patterns for questions seeking tacit knowledge (matched lowercased)
+    TACIT_QUERY_PATTERNS = [
+        r"(what|any)\s*(are\s*)?(the\s*)?(common\s*)?(mistake|pitfall|gotcha)",
+        r"(lesson|tip|trick|insight|recommendation)",
+        r"(best\s*practice|avoid|don['\"]?t)",
+        r"(what\s*(should|to)\s*avoid)",
+        r"(thing|something)\s*to\s*(watch|look)\s*(out|for)",
+        r"(advice|suggestion|recommend)",
+        r"(experience|experienc)",
+        r"what\s*(did|have)\s*(you|they|we)\s*learn",
+    ]
+    
+    # Query patterns for questions about decisions (matched lowercased)
+    DECISION_QUERY_PATTERNS = [
+        r"why\s*(did|do|was|were|is)\s*(we|they|you|it)?",
+        r"(what|why)\s*(was|is)\s*(the\s*)?(rationale|reason|decision)",
+        r"(who|when)\s*(made|decided|chose)",
+        r"(trade[- ]?off|alternative|option)\s*(consider|evaluat)",
+        r"(decid|chose|select|pick)\s*(to|between)",
+        r"(reason|rationale)\s*(for|behind)",
+        r"(how|why)\s*(come|did)\s*we\s*(decide|choose|end up)",
+        r"what\s*(led|drove)\s*(to|us)",
+    ]
+    
+    # Compiled once per class rather than looked up in re's cache per call
+    _TACIT_QUERY_RES = tuple(re.compile(p) for p in TACIT_QUERY_PATTERNS)
+    _DECISION_QUERY_RES = tuple(re.compile(p) for p in DECISION_QUERY_PATTERNS)
+    
+    # Indicator weights used when scoring a classification
+    FILENAME_PATTERN_WEIGHT = 3.0  # High confidence for filename match
+    PATH_COMPONENT_WEIGHT = 2.0    # Medium-high confidence for path match
+    CONTENT_KEYWORD_WEIGHT = 1.0   # Lower confidence for content match
+    
+    # Filename/path score lead over the other class that counts as decisive
+    DECISIVE_SCORE_MARGIN = 3.0
+    
+    # Documents longer than this (in characters) are lowercased and scanned
+    # a chunk at a time instead of copied whole
+    CONTENT_CHUNK_SIZE = 256 * 1024
+    
+    # Results remembered by classify_cached
+    CLASSIFY_CACHE_SIZE = 8192
+    
     def __init__(
         self,
         tacit_filename_patterns: Optional[List[str]] = None,
@@ -209,6 +344,7 @@ class KnowledgeClassifier:
         tacit_content_keywords: Optional[List[str]] = None,
         decision_content_keywords: Optional[List[str]] = None,
         content_keyword_threshold: int = 3,
+        skip_content_when_decisive: bool = False,
     ):
         """
         Initialize the knowledge classifier.
@@ -219,6 +355,11 @@ class KnowledgeClassifier:
             tacit_content_keywords: Additional keywords for tacit content.
             decision_content_keywords: Additional keywords for decision content.
             content_keyword_threshold: Minimum keywords to classify by content.
+            skip_content_when_decisive: Skip the content keyword scan when
+                the filename and path already give one class a decisive lead.
+                Saves a full pass over large documents at the cost of
+                content indicators (and the confidence they add) for
+                well-named files.
         """
         # Combine default and custom patterns
         self.tacit_filename_patterns = self.TACIT_FILENAME_PATTERNS.copy()
@@ -239,14 +380,65 @@ class KnowledgeClassifier:
             self.decision_content_keywords.extend(decision_content_keywords)
         
         self.content_keyword_threshold = content_keyword_threshold
+        self.skip_content_when_decisive = skip_content_when_decisive
         
-        # Compile regex patterns for efficiency
-        self._tacit_patterns = [
-            re.compile(p, re.IGNORECASE) for p in self.tacit_filename_patterns
-        ]
-        self._decision_patterns = [
-            re.compile(p, re.IGNORECASE) for p in self.decision_filename_patterns
-        ]
+        # Compile regex patterns for efficiency, each with its indicator label;
+        # the lookup tables below are tuples since they never change
+        self._tacit_patterns = tuple(
+            (re.compile(p, re.IGNORECASE), _indicator("filename_pattern", p))
+            for p in self.tacit_filename_patterns
+        )
+        self._decision_patterns = tuple(
+            (re.compile(p, re.IGNORECASE), _indicator("filename_pattern", p))
+            for p in self.decision_filename_patterns
+        )
+        self._tacit_components = tuple(
+            (c, _indicator("path_component", c)) for c in self.TACIT_PATH_COMPONENTS
+        )
+        self._decision_components = tuple(
+            (c, _indicator("path_component", c)) for c in self.DECISION_PATH_COMPONENTS
+        )
+        
+        # One-search prefilters: most filenames match no pattern at all
+        self._tacit_union = _compile_union(self.tacit_filename_patterns)
+        self._decision_union = _compile_union(self.decision_filename_patterns)
+        
+        # Case-sensitive union for lowercased ASCII filenames; IGNORECASE
+        # makes the regex engine several times slower on the no-match path
+        filename_patterns = self.tacit_filename_patterns + self.decision_filename_patterns
+        self._ascii_filename_union = None
+        if all(_is_lowercase_pattern(p) for p in filename_patterns):
+            self._ascii_filename_union = _compile_union(filename_patterns, ignore_case=False)
+        
+        # Lowercase content keywords once rather than on every scan
+        self._tacit_keywords = tuple(
+            (_indicator("content_keyword", k), k.lower()) for k in self.tacit_content_keywords
+        )
+        self._decision_keywords = tuple(
+            (_indicator("content_keyword", k), k.lower()) for k in self.decision_content_keywords
+        )
+        self._tacit_keyword_bytes = tuple((i, kl.encode("utf-8")) for i, kl in self._tacit_keywords)
+        self._decision_keyword_bytes = tuple((i, kl.encode("utf-8")) for i, kl in self._decision_keywords)
+        self._content_keywords = self._tacit_keywords + self._decision_keywords
+        self._content_keyword_bytes = self._tacit_keyword_bytes + self._decision_keyword_bytes
+        self._max_keyword_length = max(
+            (len(kl) for _, kl in self._content_keywords), default=1
+        )
+        self._min_keyword_length = min(
+            (len(kl) for _, kl in self._content_keywords), default=0
+        )
+        self._has_blank_keyword = any(not kl.strip() for _, kl in self._content_keywords)
+        
+        # Optional single-pass matcher for all content keywords, with
+        # per-thread scratch space for concurrent scans
+        self._keyword_database = _compile_literals(
+            [kl for _, kl in self._content_keyword_bytes]
+        )
+        self._scratch_local = threading.local()
+        
+        # LRU of results keyed by (filename, filepath, content digest)
+        self._result_cache: "OrderedDict[tuple, ClassificationResult]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
         
         logger.info("KnowledgeClassifier initialized")
     
@@ -272,85 +464,271 @@ class KnowledgeClassifier:
         Returns:
             ClassificationResult with knowledge type and confidence.
         """
-        # Track indicators found
+        # Track indicators found, tallying weighted scores as we go
         tacit_indicators: List[str] = []
         decision_indicators: List[str] = []
+        tacit_score = 0.0
+        decision_score = 0.0
         
         # Phase 1: Filename pattern matching
         if filename:
             filename_lower = filename.lower()
             
             # Check tacit patterns
-            for pattern in self._tacit_patterns:
-                if pattern.search(filename_lower):
-                    tacit_indicators.append(f"filename_pattern:{pattern.pattern}")
+            if self._tacit_union is None or self._tacit_union.search(filename_lower):
+                for pattern, indicator in self._tacit_patterns:
+                    if pattern.search(filename_lower):
+                        tacit_indicators.append(indicator)
+                        tacit_score += self.FILENAME_PATTERN_WEIGHT
             
             # Check decision patterns
-            for pattern in self._decision_patterns:
-                if pattern.search(filename_lower):
-                    decision_indicators.append(f"filename_pattern:{pattern.pattern}")
+            if self._decision_union is None or self._decision_union.search(filename_lower):
+                for pattern, indicator in self._decision_patterns:
+                    if pattern.search(filename_lower):
+                        decision_indicators.append(indicator)
+                        decision_score += self.FILENAME_PATTERN_WEIGHT
         
         # Phase 2: Path component matching
         if filepath:
-            path_parts = Path(filepath).parts
-            path_lower = [p.lower() for p in path_parts]
+            # Path components contain no separators, so one is found in the
+            # raw path exactly when it is found in some part, without pathlib
+            path_lower = filepath.lower()
             
-            for component in self.TACIT_PATH_COMPONENTS:
-                if any(component in p for p in path_lower):
-                    tacit_indicators.append(f"path_component:{component}")
+            for component, indicator in self._tacit_components:
+                if component in path_lower:
+                    tacit_indicators.append(indicator)
+                    tacit_score += self.PATH_COMPONENT_WEIGHT
             
-            for component in self.DECISION_PATH_COMPONENTS:
-                if any(component in p for p in path_lower):
-                    decision_indicators.append(f"path_component:{component}")
+            for component, indicator in self._decision_components:
+                if component in path_lower:
+                    decision_indicators.append(indicator)
+                    decision_score += self.PATH_COMPONENT_WEIGHT
         
         # Phase 3: Content keyword analysis
-        if content:
-            content_lower = content.lower()
+        if content and self._may_contain_keywords(content) and not (
+            self.skip_content_when_decisive
+            and self._is_decisive(tacit_score, decision_score)
+        ):
+            tacit_found, decision_found = self._scan_content(content)
             
-            for keyword in self.tacit_content_keywords:
-                if keyword.lower() in content_lower:
-                    tacit_indicators.append(f"content_keyword:{keyword}")
+            tacit_indicators.extend(tacit_found)
+            tacit_score += self.CONTENT_KEYWORD_WEIGHT * len(tacit_found)
             
-            for keyword in self.decision_content_keywords:
-                if keyword.lower() in content_lower:
-                    decision_indicators.append(f"content_keyword:{keyword}")
+            decision_indicators.extend(decision_found)
+            decision_score += self.CONTENT_KEYWORD_WEIGHT * len(decision_found)
         
         # Determine classification based on indicators
         return self._determine_classification(
             tacit_indicators=tacit_indicators,
             decision_indicators=decision_indicators,
+            tacit_score=tacit_score,
+            decision_score=decision_score,
+        )
+    
+    def classify_batch(
+        self,
+        filenames: List[Optional[str]],
+        filepaths: Optional[List[Optional[str]]] = None,
+        contents: Optional[List[Optional[str]]] = None,
+    ) -> List[ClassificationResult]:
+        """
+        Classify several documents at once.
+        
+        Documents with only a filename take the classify_filename_only fast
+        path; the rest are classified as by ``classify``.
+        
+        Args:
+            filenames: Names of the files.
+            filepaths: Full paths, in the same order as ``filenames``.
+            contents: Document contents, in the same order as ``filenames``.
+            
+        Returns:
+            One ClassificationResult per document.
+        """
+        count = len(filenames)
+        for name, values in (("filepaths", filepaths), ("contents", contents)):
+            if values is not None and len(values) != count:
+                raise ValueError(
+                    f"Got {count} filenames but {len(values)} {name}"
+                )
+        
+        filepaths = filepaths if filepaths is not None else [None] * count
+        contents = contents if contents is not None else [None] * count
+        
+        results = []
+        for filename, filepath, content in zip(filenames, filepaths, contents):
+            if filename and not filepath and not content:
+                results.append(self.classify_filename_only(filename))
+            else:
+                results.append(self.classify(filename, filepath, content))
+        return results
+    
+    def classify_filename_only(self, filename: str) -> ClassificationResult:
+        """
+        Classify a document by its filename alone.
+        
+        Equivalent to ``classify(filename=filename)``, but an ASCII name
+        matching no tacit or decision pattern (the common case) costs a single
+        case-sensitive search.
+        
+        Args:
+            filename: Name of the file.
+            
+        Returns:
+            ClassificationResult with knowledge type and confidence.
+        """
+        filename_lower = filename.lower()
+        if (
+            self._ascii_filename_union is not None
+            and filename_lower.isascii()
+            and not self._ascii_filename_union.search(filename_lower)
+        ):
+            return self._determine_classification(
+                tacit_indicators=[],
+                decision_indicators=[],
+                tacit_score=0.0,
+                decision_score=0.0,
+            )
+        return self.classify(filename=filename)
+    
+    def classify_cached(
+        self,
+        filename: Optional[str] = None,
+        filepath: Optional[str] = None,
+        content: Optional[str] = None,
+    ) -> ClassificationResult:
+        """
+        Classify a document, reusing the result for inputs seen before.
+        
+        Re-indexing runs classify mostly unchanged documents, so results are
+        kept in an LRU keyed by filename, path and a digest of the content
+        (rather than the content itself, which may be large).
+        
+        Args:
+            filename: Name of the file.
+            filepath: Full path to the file.
+            content: Document content for keyword analysis.
+            
+        Returns:
+            ClassificationResult owned by the caller.
+        """
+        digest = None
+        if content:
+            digest = hashlib.blake2b(
+                content.encode("utf-8", "surrogatepass"), digest_size=16
+            ).digest()
+        key = (filename, filepath, digest)
+        
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                return cached.copy()
+        
+        result = self.classify(filename=filename, filepath=filepath, content=content)
+        
+        with self._result_cache_lock:
+            self._result_cache[key] = result.copy()
+            if len(self._result_cache) > self.CLASSIFY_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        
+        return result
+    
+    def _may_contain_keywords(self, content: str) -> bool:
+        """Rule out content too short or blank to hold any keyword."""
+        # Lowercasing can lengthen non-ASCII text, so only ASCII is measured
+        if content.isascii() and len(content) < self._min_keyword_length:
+            return False
+        return self._has_blank_keyword or not content.isspace()
+    
+    def _scan_content(self, content: str) -> Tuple[List[str], List[str]]:
+        """
+        Find the tacit and decision content keywords present in a document.
+        
+        The document is lowercased CONTENT_CHUNK_SIZE characters at a time,
+        so a large one is never copied whole. Chunks overlap by the longest
+        keyword less one character, so no occurrence is split between them,
+        and keywords already found are not searched for again. With
+        Hyperscan installed, each chunk is matched against every keyword in
+        a single pass.
+        
+        Returns:
+            Tuple of (tacit indicators, decision indicators), in keyword order.
+        """
+        ascii_only = content.isascii()
+        # ASCII lowercases identically as bytes, at one byte per char
+        keywords = self._content_keyword_bytes if ascii_only else self._content_keywords
+        database = self._keyword_database
+        scratch = self._thread_scratch() if database is not None else None
+        
+        found: set = set()
+        step = self.CONTENT_CHUNK_SIZE
+        overlap = self._max_keyword_length - 1
+        
+        for start in range(0, len(content), step):
+            chunk = content[start:start + step + overlap]
+            chunk_lower = chunk.encode("ascii").lower() if ascii_only else chunk.lower()
+            
+            if database is not None:
+                # Valid UTF-8 keywords occur in UTF-8 bytes exactly where
+                # they occur in the text, so byte matching finds the same set
+                if not ascii_only:
+                    chunk_lower = chunk_lower.encode("utf-8", "surrogatepass")
+                database.scan(
+                    chunk_lower,
+                    match_event_handler=_collect_match,
+                    context=found,
+                    scratch=scratch,
+                )
+            else:
+                for index, (_, keyword_lower) in enumerate(keywords):
+                    if index not in found and keyword_lower in chunk_lower:
+                        found.add(index)
+            
+            if len(found) == len(keywords):
+                break
+        
+        # Ids follow keyword order, tacit keywords first
+        split = len(self._tacit_keywords)
+        ordered = sorted(found)
+        return (
+            [keywords[index][0] for index in ordered if index < split],
+            [keywords[index][0] for index in ordered if index >= split],
+        )
+    
+    def _thread_scratch(self) -> "hyperscan.Scratch":
+        """This thread's Hyperscan scratch space; scans cannot share one."""
+        scratch = getattr(self._scratch_local, "scratch", None)
+        if scratch is None:
+            scratch = hyperscan.Scratch(self._keyword_database)
+            self._scratch_local.scratch = scratch
+        return scratch
+    
+    def _is_decisive(self, tacit_score: float, decision_score: float) -> bool:
+        """Whether filename/path scores already settle the classification."""
+        return (
+            max(tacit_score, decision_score) >= self.FILENAME_PATTERN_WEIGHT
+            and abs(tacit_score - decision_score) >= self.DECISIVE_SCORE_MARGIN
         )
     
     def _determine_classification(
         self,
         tacit_indicators: List[str],
         decision_indicators: List[str],
+        tacit_score: float,
+        decision_score: float,
     ) -> ClassificationResult:
         """
         Determine the final classification based on collected indicators.
         
-        Priority:
-        1. Filename/path indicators (weight: 3x)
-        2. Content indicators (weight: 1x)
+        Scores are tallied by ``classify`` while indicators are collected:
+        1. Filename indicators (weight: 3x)
+        2. Path indicators (weight: 2x)
+        3. Content indicators (weight: 1x)
         
         Returns:
             ClassificationResult with the determined type.
         """
-        # Calculate weighted scores
-        def calculate_score(indicators: List[str]) -> float:
-            score = 0.0
-            for indicator in indicators:
-                if indicator.startswith("filename_pattern:"):
-                    score += 3.0  # High confidence for filename match
-                elif indicator.startswith("path_component:"):
-                    score += 2.0  # Medium-high confidence for path match
-                elif indicator.startswith("content_keyword:"):
-                    score += 1.0  # Lower confidence for content match
-            return score
-        
-        tacit_score = calculate_score(tacit_indicators)
-        decision_score = calculate_score(decision_indicators)
-        
         # Determine knowledge type
         if tacit_score >= 3.0 and tacit_score > decision_score:
             knowledge_type = KnowledgeType.TACIT
@@ -390,24 +768,7 @@ class KnowledgeClassifier:
         Returns:
             Tuple of (is_tacit_query, matched_indicators).
         """
-        tacit_query_patterns = [
-            r"(what|any)\s*(are\s*)?(the\s*)?(common\s*)?(mistake|pitfall|gotcha)",
-            r"(lesson|tip|trick|insight|recommendation)",
-            r"(best\s*practice|avoid|don['\"]?t)",
-            r"(what\s*(should|to)\s*avoid)",
-            r"(thing|something)\s*to\s*(watch|look)\s*(out|for)",
-            r"(advice|suggestion|recommend)",
-            r"(experience|experienc)",
-            r"what\s*(did|have)\s*(you|they|we)\s*learn",
-        ]
-        
-        query_lower = query.lower()
-        matched = []
-        
-        for pattern in tacit_query_patterns:
-            if re.search(pattern, query_lower):
-                matched.append(pattern)
-        
+        matched = self._match_query(self._TACIT_QUERY_RES, query.lower())
         return len(matched) > 0, matched
     
     def is_decision_query(self, query: str) -> Tuple[bool, List[str]]:
@@ -426,25 +787,45 @@ class KnowledgeClassifier:
         Returns:
             Tuple of (is_decision_query, matched_indicators).
         """
-        decision_query_patterns = [
-            r"why\s*(did|do|was|were|is)\s*(we|they|you|it)?",
-            r"(what|why)\s*(was|is)\s*(the\s*)?(rationale|reason|decision)",
-            r"(who|when)\s*(made|decided|chose)",
-            r"(trade[- ]?off|alternative|option)\s*(consider|evaluat)",
-            r"(decid|chose|select|pick)\s*(to|between)",
-            r"(reason|rationale)\s*(for|behind)",
-            r"(how|why)\s*(come|did)\s*we\s*(decide|choose|end up)",
-            r"what\s*(led|drove)\s*(to|us)",
-        ]
-        
-        query_lower = query.lower()
-        matched = []
+        matched = self._match_query(self._DECISION_QUERY_RES, query.lower())
+        return len(matched) > 0, matched
+    
+    def classify_query(self, query: str) -> Tuple[bool, List[str], bool, List[str]]:
+        """
+        Check a query for both tacit and decision intent in one call.
         
-        for pattern in decision_query_patterns:
-            if re.search(pattern, query_lower):
-                matched.append(pattern)
+        Equivalent to calling ``is_tacit_query`` and ``is_decision_query``,
+        but the query is lowercased once.
         
-        return len(matched) > 0, matched
+        Args:
+            query: The user's query string.
+            
+        Returns:
+            Tuple of (is_tacit_query, tacit_indicators,
+            is_decision_query, decision_indicators).
+        """
+        query_lower = query.lower()
+        tacit = self._match_query(self._TACIT_QUERY_RES, query_lower)
+        decision = self._match_query(self._DECISION_QUERY_RES, query_lower)
+        return len(tacit) > 0, tacit, len(decision) > 0, decision
+    
+    @staticmethod
+    def _match_query(
+        patterns: Tuple["re.Pattern[str]", ...], query_lower: str
+    ) -> List[str]:
+        """Return the patterns matching a lowercased query, in order."""
+        return [pattern.pattern for pattern in patterns if pattern.search(query_lower)]
+
+
+@lru_cache(maxsize=1)
+def _default_classifier() -> KnowledgeClassifier:
+    """
+    Get the classifier shared by classify_document calls.
+    
+    The classifier is stateless after construction, so its compiled patterns
+    can be reused rather than rebuilt for every document.
+    """
+    return KnowledgeClassifier()
 
 
 # Module-level convenience function
@@ -467,5 +848,5 @@ def classify_document(
     Returns:
         ClassificationResult with knowledge type and confidence.
     """
-    classifier = KnowledgeClassifier()
+    classifier = _default_classifier()
     return classifier.classify(filename=filename, filepath=filepath, content=content)
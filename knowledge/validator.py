@@ -12,9 +12,10 @@ The validator acts as a guardrail to:
 4. Provide explainable validation results
 """
 
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 from langchain_core.documents import Document
 
@@ -33,7 +34,7 @@ class ValidationStatus(str, Enum):
     FAILED_MISMATCH = "failed_mismatch"  # Knowledge type mismatch
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """
     Result of knowledge validation before generation.
@@ -74,8 +75,8 @@ class ValidationResult:
         return {
             "status": self.status.value,
             "can_proceed": self.can_proceed,
-            "confidence_score": self.confidence_score,
-            "relevance_score": self.relevance_score,
+            "confidence_score": round(self.confidence_score, 3),
+            "relevance_score": round(self.relevance_score, 3),
             "query_type": self.query_type,
             "knowledge_types_found": self.knowledge_types_found,
             "has_tacit_match": self.has_tacit_match,
@@ -86,6 +87,73 @@ class ValidationResult:
         }
 
 
+# Safe responses for a query whose knowledge type was not retrieved
+_MISMATCH_RESPONSES: Dict[str, str] = {
+    "tacit": (
+        "I found some documentation related to your question, but the "
+        "organizational knowledge base doesn't contain lessons learned, "
+        "best practices, or experiential insights on this topic. "
+        "Consider reaching out to team members with direct experience."
+    ),
+    "decision": (
+        "I couldn't find documented decision records or rationale for this topic. "
+        "While some related documentation exists, the specific reasoning behind "
+        "this decision is not captured in the knowledge base. "
+        "Consider consulting with the original decision makers."
+    ),
+}
+_DEFAULT_MISMATCH_RESPONSE = "Knowledge type mismatch detected."
+
+
+@lru_cache(maxsize=64)
+def _guidance_text(
+    query_type: str,
+    has_tacit: bool,
+    has_decision: bool,
+    low_confidence: bool,
+) -> str:
+    """
+    Build LLM response guidance.
+    
+    The text depends only on these few flags, so it is built once per
+    combination rather than for every validated query.
+    """
+    guidance_parts = []
+    
+    if query_type == "tacit":
+        if has_tacit:
+            guidance_parts.append(
+                "Prioritize insights from lessons learned and experiential knowledge. "
+                "Emphasize practical recommendations and things to avoid."
+            )
+        else:
+            guidance_parts.append(
+                "The user is asking for tacit knowledge, but only explicit documentation "
+                "was found. Acknowledge this limitation in your response."
+            )
+    
+    elif query_type == "decision":
+        if has_decision:
+            guidance_parts.append(
+                "Focus on explaining the rationale behind decisions. "
+                "Include who made the decision, when, what alternatives were considered, "
+                "and what trade-offs were accepted."
+            )
+        else:
+            guidance_parts.append(
+                "The user is asking about decision rationale, but no decision records "
+                "were found. Indicate that the specific decision context is not documented."
+            )
+    
+    if low_confidence:
+        guidance_parts.append(
+            "Retrieved knowledge has moderate confidence. "
+            "Be explicit about what is known vs. uncertain."
+        )
+    
+    return " ".join(guidance_parts) if guidance_parts else "Proceed with standard response."
+
+
 class KnowledgeValidator:
     """
     Validates retrieved knowledge before LLM generation.
@@ -157,11 +225,80 @@ class KnowledgeValidator:
             log_gap=True,
         )
         
+        return self._build_result(query, documents_with_scores, gap_result)
+    
+    def validate_batch(
+        self,
+        queries: List[str],
+        results: List[List[Tuple[Document, float]]],
+        department: Optional[str] = None,
+    ) -> List[ValidationResult]:
+        """
+        Validate retrieved knowledge for several queries at once.
+        
+        Gap detection for the whole batch goes through the gap detector's
+        batch path; each query is then validated as by ``validate``, with
+        repeated questions analyzed only once.
+        
+        Args:
+            queries: The user questions.
+            results: Retrieved documents with scores for each query, in the
+                     same order as ``queries``.
+            department: Optional department context.
+            
+        Returns:
+            One ValidationResult per query.
+        """
+        gap_results = self.gap_detector.evaluate_batch(
+            queries=queries,
+            results=results,
+            department=department,
+            log_gap=True,
+        )
+        
+        query_analyses: Dict[str, Tuple[str, List[str]]] = {}
+        return [
+            self._build_result(query, documents_with_scores, gap_result, query_analyses)
+            for query, documents_with_scores, gap_result
+            in zip(queries, results, gap_results)
+        ]
+    
+    def _build_result(
+        self,
+        query: str,
+        documents_with_scores: List[Tuple[Document, float]],
+        gap_result: GapDetectionResult,
+        query_analyses: Optional[Dict[str, Tuple[str, List[str]]]] = None,
+    ) -> ValidationResult:
+        """
+        Run validation steps 2-7 on top of a gap detection result.
+        
+        ``query_analyses`` memoizes step 2 by query text across a batch.
+        """
+        # A serious gap fails validation whatever else is found, and callers
+        # answer with the safe response alone, so skip the remaining steps
+        if self._is_hard_gap(gap_result):
+            return ValidationResult(
+                status=ValidationStatus.FAILED_GAP,
+                can_proceed=False,
+                confidence_score=gap_result.confidence_score,
+                relevance_score=gap_result.confidence_score,
+                gap_result=gap_result,
+                safe_response=gap_result.safe_response,
+            )
+        
         # Step 2: Analyze query type
-        query_type, query_indicators = self._analyze_query_type(query)
+        if query_analyses is None:
+            query_type, query_indicators = self._analyze_query_type(query)
+        else:
+            if query not in query_analyses:
+                query_analyses[query] = self._analyze_query_type(query)
+            query_type, query_indicators = query_analyses[query]
+            # Results must not share the indicator list
+            query_indicators = list(query_indicators)
         
-        # Step 3: Analyze knowledge coverage
-        knowledge_types = self._get_knowledge_types(documents_with_scores)
+        # Step 3: Analyze knowledge coverage and primary sources for attribution
+        knowledge_types, primary_sources = self._scan_documents(documents_with_scores)
         has_tacit = "tacit" in knowledge_types
         has_decision = "decision" in knowledge_types
         
@@ -187,15 +324,8 @@ class KnowledgeValidator:
             gap_result=gap_result,
         )
         
-        # Step 7: Get primary sources for attribution
-        primary_sources = self._get_primary_sources(documents_with_scores)
-        
-        # Step 8: Determine final status
-        if gap_result.gap_detected and gap_result.gap_severity in [GapSeverity.HIGH, GapSeverity.CRITICAL]:
-            status = ValidationStatus.FAILED_GAP
-            can_proceed = False
-            safe_response = gap_result.safe_response
-        elif type_mismatch and self.strict_mode:
+        # Step 7: Determine final status
+        if type_mismatch and self.strict_mode:
             status = ValidationStatus.FAILED_MISMATCH
             can_proceed = False
             safe_response = self._generate_mismatch_response(query_type)
@@ -224,7 +354,7 @@ class KnowledgeValidator:
             gap_result=gap_result,
             query_type=query_type,
             query_indicators=query_indicators,
-            knowledge_types_found=knowledge_types,
+            knowledge_types_found=sorted(knowledge_types),
             has_tacit_match=has_tacit and query_type == "tacit",
             has_decision_match=has_decision and query_type == "decision",
             response_guidance=guidance,
@@ -233,6 +363,14 @@ class KnowledgeValidator:
             primary_sources=primary_sources,
         )
     
+    @staticmethod
+    def _is_hard_gap(gap_result: GapDetectionResult) -> bool:
+        """Whether a gap is severe enough to fail validation outright."""
+        return gap_result.gap_detected and gap_result.gap_severity in (
+            GapSeverity.HIGH,
+            GapSeverity.CRITICAL,
+        )
+    
     def _analyze_query_type(self, query: str) -> Tuple[str, List[str]]:
         """
         Analyze the query to determine what type of knowledge is needed.
@@ -240,11 +378,10 @@ class KnowledgeValidator:
         Returns:
             Tuple of (query_type, matched_indicators).
         """
-        # Check for tacit query
-        is_tacit, tacit_indicators = self.classifier.is_tacit_query(query)
-        
-        # Check for decision query
-        is_decision, decision_indicators = self.classifier.is_decision_query(query)
+        # Check for tacit and decision queries in one pass
+        is_tacit, tacit_indicators, is_decision, decision_indicators = (
+            self.classifier.classify_query(query)
+        )
         
         # Determine primary query type
         if is_tacit and not is_decision:
@@ -260,16 +397,28 @@ class KnowledgeValidator:
         else:
             return "general", []
     
-    def _get_knowledge_types(
+    def _scan_documents(
         self,
         documents_with_scores: List[Tuple[Document, float]],
-    ) -> List[str]:
-        """Get unique knowledge types from retrieved documents."""
+        source_limit: int = 3,
+    ) -> Tuple[Set[str], List[str]]:
+        """
+        Collect knowledge types and primary sources in one pass.
+        
+        Returns:
+            Tuple of (set of knowledge types, unique sources of the top
+            ``source_limit`` documents for attribution).
+        """
         types = set()
-        for doc, _ in documents_with_scores:
-            kt = doc.metadata.get("knowledge_type", "explicit")
-            types.add(kt)
-        return list(types)
+        sources = []
+        for i, (doc, _) in enumerate(documents_with_scores):
+            metadata = doc.metadata
+            types.add(metadata.get("knowledge_type", "explicit"))
+            if i < source_limit:
+                source = metadata.get("source", metadata.get("file_name", "Unknown"))
+                if source not in sources:
+                    sources.append(source)
+        return types, sources
     
     def _check_type_mismatch(
         self,
@@ -287,44 +436,16 @@ class KnowledgeValidator:
     def _generate_guidance(
         self,
         query_type: str,
-        knowledge_types: List[str],
+        knowledge_types: Set[str],
         gap_result: GapDetectionResult,
     ) -> str:
         """Generate guidance for the LLM response."""
-        guidance_parts = []
-        
-        if query_type == "tacit":
-            if "tacit" in knowledge_types:
-                guidance_parts.append(
-                    "Prioritize insights from lessons learned and experiential knowledge. "
-                    "Emphasize practical recommendations and things to avoid."
-                )
-            else:
-                guidance_parts.append(
-                    "The user is asking for tacit knowledge, but only explicit documentation "
-                    "was found. Acknowledge this limitation in your response."
-                )
-        
-        elif query_type == "decision":
-            if "decision" in knowledge_types:
-                guidance_parts.append(
-                    "Focus on explaining the rationale behind decisions. "
-                    "Include who made the decision, when, what alternatives were considered, "
-                    "and what trade-offs were accepted."
-                )
-            else:
-                guidance_parts.append(
-                    "The user is asking about decision rationale, but no decision records "
-                    "were found. Indicate that the specific decision context is not documented."
-                )
-        
-        if gap_result.confidence_score < 0.7:
-            guidance_parts.append(
-                "Retrieved knowledge has moderate confidence. "
-                "Be explicit about what is known vs. uncertain."
-            )
-        
-        return " ".join(guidance_parts) if guidance_parts else "Proceed with standard response."
+        return _guidance_text(
+            query_type=query_type,
+            has_tacit="tacit" in knowledge_types,
+            has_decision="decision" in knowledge_types,
+            low_confidence=gap_result.confidence_score < 0.7,
+        )
     
     def _collect_warnings(
         self,
@@ -350,19 +471,6 @@ class KnowledgeValidator:
         
         return warnings
     
-    def _get_primary_sources(
-        self,
-        documents_with_scores: List[Tuple[Document, float]],
-        limit: int = 3,
-    ) -> List[str]:
-        """Get primary source attributions from top documents."""
-        sources = []
-        for doc, score in documents_with_scores[:limit]:
-            source = doc.metadata.get("source", doc.metadata.get("file_name", "Unknown"))
-            if source not in sources:
-                sources.append(source)
-        return sources
-    
     def _calculate_relevance(
         self,
         query_type: str,
@@ -370,41 +478,28 @@ class KnowledgeValidator:
         has_decision: bool,
         gap_result: GapDetectionResult,
     ) -> float:
-        """Calculate relevance score based on knowledge type match."""
-        base_score = gap_result.confidence_score
+        """
+        Calculate relevance score based on knowledge type match.
         
-        # Boost for matching knowledge type
-        if query_type == "tacit" and has_tacit:
-            base_score = min(1.0, base_score * 1.2)
-        elif query_type == "decision" and has_decision:
-            base_score = min(1.0, base_score * 1.2)
+        The score is kept unrounded; ``ValidationResult.to_dict`` rounds it.
+        """
+        base_score = gap_result.confidence_score
         
-        # Penalty for mismatch
-        if query_type == "tacit" and not has_tacit:
-            base_score *= 0.8
-        elif query_type == "decision" and not has_decision:
-            base_score *= 0.8
+        if query_type == "tacit":
+            type_matched = has_tacit
+        elif query_type == "decision":
+            type_matched = has_decision
+        else:
+            return base_score
         
-        return round(base_score, 3)
+        # Boost for matching knowledge type, penalty for mismatch
+        if type_matched:
+            return min(1.0, base_score * 1.2)
+        return base_score * 0.8
     
     def _generate_mismatch_response(self, query_type: str) -> str:
         """Generate response for knowledge type mismatch."""
-        if query_type == "tacit":
-            return (
-                "I found some documentation related to your question, but the "
-                "organizational knowledge base doesn't contain lessons learned, "
-                "best practices, or experiential insights on this topic. "
-                "Consider reaching out to team members with direct experience."
-            )
-        elif query_type == "decision":
-            return (
-                "I couldn't find documented decision records or rationale for this topic. "
-                "While some related documentation exists, the specific reasoning behind "
-                "this decision is not captured in the knowledge base. "
-                "Consider consulting with the original decision makers."
-            )
-        else:
-            return "Knowledge type mismatch detected."
+        return _MISMATCH_RESPONSES.get(query_type, _DEFAULT_MISMATCH_RESPONSE)
     
     def validate_for_generation(
         self,
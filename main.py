@@ -13,27 +13,32 @@ Usage:
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 # Ensure project root is in path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from config.settings import get_settings, Settings
 from core.logger import setup_logger, get_logger
-from core.exceptions import KnowledgeSystemError
 
+if TYPE_CHECKING:
+    from config.settings import Settings
 
-def setup_environment() -> Settings:
+
+def setup_environment() -> "Settings":
     """Initialize the application environment."""
+    # Imported here so --help does not load settings (and pydantic)
+    from config.settings import get_settings
+    
     settings = get_settings()
     setup_logger(level=settings.LOG_LEVEL)
     return settings
 
 
-def run_ingestion(settings: Settings) -> bool:
+def run_ingestion(settings: "Settings") -> bool:
     """
     Run the document ingestion pipeline.
     
@@ -89,7 +94,7 @@ def run_ingestion(settings: Settings) -> bool:
         return False
 
 
-def run_query(query: str, settings: Settings) -> Optional[str]:
+def run_query(query: str, settings: "Settings") -> Optional[str]:
     """
     Run a single query against the knowledge base.
     
@@ -137,8 +142,8 @@ def run_query(query: str, settings: Settings) -> Optional[str]:
         return None
 
 
-def run_ui(settings: Settings):
-    """Launch the Streamlit UI."""
+def run_ui():
+    """Launch the Streamlit UI; Streamlit loads its own settings."""
     logger = get_logger(__name__)
     logger.info("Launching Streamlit UI...")
     
@@ -150,7 +155,28 @@ def run_ui(settings: Settings):
     ])
 
 
-def check_status(settings: Settings):
+def _count_files(root: Path) -> int:
+    """Count files under a directory, like ``rglob`` without a stat per entry."""
+    count = 0
+    pending = [str(root)]
+    
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # rglob does not descend into symlinked directories
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        count += 1
+        except OSError:
+            continue
+    
+    return count
+
+
+def check_status(settings: "Settings"):
     """Check and display system status."""
     logger = get_logger(__name__)
     
@@ -169,7 +195,7 @@ def check_status(settings: Settings):
     print("\n📁 Data Directory:")
     data_path = Path(settings.DATA_DIR)
     if data_path.exists():
-        file_count = sum(1 for _ in data_path.rglob("*") if _.is_file())
+        file_count = _count_files(data_path)
         print(f"  ✓ Exists ({file_count} files)")
     else:
         print("  ✗ Not found")
@@ -243,24 +269,22 @@ Examples:
     
     args = parser.parse_args()
     
-    # Setup environment
-    settings = setup_environment()
-    logger = get_logger(__name__)
-    
-    # Handle commands
+    # Handle commands, setting up the environment only for those that use it
     if args.ingest:
-        success = run_ingestion(settings)
+        success = run_ingestion(setup_environment())
         sys.exit(0 if success else 1)
     
     elif args.query:
-        result = run_query(args.query, settings)
+        result = run_query(args.query, setup_environment())
         sys.exit(0 if result else 1)
     
     elif args.ui:
-        run_ui(settings)
+        # Configures logging and validates settings before Streamlit starts
+        setup_environment()
+        run_ui()
     
     elif args.status:
-        check_status(settings)
+        check_status(setup_environment())
     
     else:
         # Default: show help
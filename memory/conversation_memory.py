@@ -5,103 +5,258 @@ This module provides conversation memory management for maintaining
 context across multiple interactions in a session.
 """
 
-from typing import List, Dict, Any, Optional
-from collections import defaultdict
+from typing import List, Dict, Any, Optional, Deque, Tuple, Callable, Sequence
+from array import array
+from collections import defaultdict, deque
+from contextlib import nullcontext
+from itertools import islice
 from datetime import datetime
 from dataclasses import dataclass, field
+import atexit
 import json
+import math
+import operator
+import os
+import tempfile
+import threading
+import time
+import weakref
 from pathlib import Path
 
+from langchain_core.embeddings import Embeddings
 from langchain_core.messages import HumanMessage, AIMessage
 
 from config.settings import get_settings
 from core.logger import get_logger
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
 logger = get_logger(__name__)
 
 
-@dataclass
+def _dump_record(record: Dict[str, Any]) -> bytes:
+    """Serialize a persistence record as one compact UTF-8 JSONL line."""
+    if HAVE_ORJSON:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _load_record(data: bytes) -> Any:
+    """Parse one JSON document; raises json.JSONDecodeError if malformed."""
+    if HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """Format an epoch timestamp as a local ISO 8601 string."""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def _parse_timestamp(value: Any) -> float:
+    """Parse a stored ISO 8601 or epoch timestamp, defaulting to now."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            pass
+    return time.time()
+
+
+# Embedding of a turn or query: int8 components and their Euclidean norm
+QuantizedVector = Tuple[array, float]
+
+
+def _quantize(vector: Sequence[float]) -> QuantizedVector:
+    """Scale an embedding into int8 so its largest component is +/-127."""
+    peak = max((abs(x) for x in vector), default=0.0)
+    scale = 127 / peak if peak else 0.0
+    quantized = array("b", [round(x * scale) for x in vector])
+    return quantized, math.sqrt(sum(x * x for x in quantized))
+
+
+def _cosine(a: QuantizedVector, b: QuantizedVector) -> float:
+    """Cosine similarity of two quantized embeddings."""
+    if not a[1] or not b[1]:
+        return 0.0
+    return sum(map(operator.mul, a[0], b[0])) / (a[1] * b[1])
+
+
+@dataclass(slots=True)
 class ConversationTurn:
-    """Represents a single conversation turn."""
+    """
+    Represents a single conversation turn.
+    
+    The timestamp is stored as epoch seconds and formatted as ISO 8601 the
+    first time the turn is serialized. The embedding used for retrieval is
+    kept in memory only.
+    """
     human_message: str
     ai_message: str
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: float = field(default_factory=time.time)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _timestamp_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _embedding: Optional[QuantizedVector] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def text(self) -> str:
+        """Text of the exchange, as embedded for retrieval."""
+        return f"{self.human_message}\n{self.ai_message}"
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
+        timestamp_iso = self._timestamp_iso
+        if timestamp_iso is None:
+            timestamp_iso = self._timestamp_iso = _format_timestamp(self.timestamp)
         return {
             "human": self.human_message,
             "ai": self.ai_message,
-            "timestamp": self.timestamp,
+            "timestamp": timestamp_iso,
             "metadata": self.metadata,
         }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ConversationTurn":
         """Create from dictionary."""
-        return cls(
+        stored = data.get("timestamp")
+        turn = cls(
             human_message=data.get("human", ""),
             ai_message=data.get("ai", ""),
-            timestamp=data.get("timestamp", datetime.now().isoformat()),
+            timestamp=_parse_timestamp(stored),
             metadata=data.get("metadata", {}),
         )
+        # Serialize the stored string back unchanged
+        if isinstance(stored, str):
+            turn._timestamp_iso = stored
+        return turn
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationSession:
-    """Represents a conversation session."""
+    """
+    Represents a conversation session.
+    
+    Turns are kept in a deque bounded by ``max_turns``, so adding a turn to
+    a full session evicts the oldest one. Rendered histories are cached per
+    ``max_turns`` until the turns change, and each turn's prompt text is
+    rendered once when it is added. ``summary`` optionally condenses turns
+    that have been evicted.
+    """
     session_id: str
-    turns: List[ConversationTurn] = field(default_factory=list)
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    last_active: str = field(default_factory=lambda: datetime.now().isoformat())
+    turns: Deque[ConversationTurn] = field(default_factory=deque)
+    created_at: float = field(default_factory=time.time)
+    last_active: float = field(default_factory=time.time)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    max_turns: Optional[int] = None
+    summary: str = ""
+    _history_cache: Dict[Optional[int], List[Dict[str, Any]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _formatted_turns: Deque[str] = field(
+        default_factory=deque, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        """Bound the turns deque by max_turns and render existing turns."""
+        maxlen = self.max_turns or None
+        if not (isinstance(self.turns, deque) and self.turns.maxlen == maxlen):
+            self.turns = deque(self.turns, maxlen=maxlen)
+        self._formatted_turns = deque(
+            (self._format_turn(turn) for turn in self.turns), maxlen=maxlen
+        )
+    
+    @staticmethod
+    def _format_turn(turn: ConversationTurn) -> str:
+        """Render a turn as prompt text."""
+        return f"Human: {turn.human_message}\nAssistant: {turn.ai_message}"
     
     def add_turn(self, human_message: str, ai_message: str, **metadata) -> None:
         """Add a conversation turn."""
-        turn = ConversationTurn(
+        self.append_turn(ConversationTurn(
             human_message=human_message,
             ai_message=ai_message,
             metadata=metadata,
-        )
+        ))
+    
+    def append_turn(self, turn: ConversationTurn) -> None:
+        """Append an existing turn, e.g. one restored from disk."""
         self.turns.append(turn)
-        self.last_active = datetime.now().isoformat()
+        self._formatted_turns.append(self._format_turn(turn))
+        self.last_active = turn.timestamp
+        self._history_cache.clear()
     
     def get_history(self, max_turns: Optional[int] = None) -> List[Dict[str, str]]:
         """Get conversation history."""
-        turns = self.turns
-        if max_turns:
-            turns = turns[-max_turns:]
-        return [turn.to_dict() for turn in turns]
+        history = self._history_cache.get(max_turns)
+        if history is None:
+            turns = self.turns
+            if max_turns and len(turns) > max_turns:
+                turns = islice(turns, len(turns) - max_turns, None)
+            history = self._history_cache[max_turns] = [turn.to_dict() for turn in turns]
+        # Callers may modify the list they get back
+        return list(history)
+    
+    def format_history(self, max_turns: Optional[int] = None) -> str:
+        """
+        Get conversation history as "Human: ..." / "Assistant: ..." lines,
+        preceded by the summary of earlier turns if there is one.
+        """
+        formatted = self._formatted_turns
+        if max_turns and len(formatted) > max_turns:
+            formatted = islice(formatted, len(formatted) - max_turns, None)
+        history = "\n".join(formatted)
+        if not self.summary:
+            return history
+        summary = f"Summary of earlier conversation: {self.summary}"
+        return f"{summary}\n{history}" if history else summary
+    
+    def is_full(self) -> bool:
+        """Whether adding a turn will evict the oldest one."""
+        return self.turns.maxlen is not None and len(self.turns) == self.turns.maxlen
     
     def clear(self) -> None:
         """Clear conversation history."""
-        self.turns = []
+        self.summary = ""
+        self.turns.clear()
+        self._formatted_turns.clear()
+        self._history_cache.clear()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             "session_id": self.session_id,
             "turns": [turn.to_dict() for turn in self.turns],
-            "created_at": self.created_at,
-            "last_active": self.last_active,
+            "created_at": _format_timestamp(self.created_at),
+            "last_active": _format_timestamp(self.last_active),
             "metadata": self.metadata,
+            "summary": self.summary,
         }
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ConversationSession":
-        """Create from dictionary."""
-        session = cls(
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        max_turns: Optional[int] = None,
+    ) -> "ConversationSession":
+        """Create from dictionary, keeping at most ``max_turns`` turns."""
+        return cls(
             session_id=data.get("session_id", "default"),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            last_active=data.get("last_active", datetime.now().isoformat()),
+            turns=deque(
+                (ConversationTurn.from_dict(turn) for turn in data.get("turns", [])),
+                maxlen=max_turns or None,
+            ),
+            created_at=_parse_timestamp(data.get("created_at")),
+            last_active=_parse_timestamp(data.get("last_active")),
             metadata=data.get("metadata", {}),
+            max_turns=max_turns,
+            summary=data.get("summary", ""),
         )
-        session.turns = [
-            ConversationTurn.from_dict(turn)
-            for turn in data.get("turns", [])
-        ]
-        return session
 
 
 class ConversationMemoryManager:
@@ -115,16 +270,51 @@ class ConversationMemoryManager:
     - LangChain memory integration
     - Session management
     
+    Persistence is an append-only JSONL log: each exchange appends one
+    ``{"sid", "turn"}`` line, and clearing or deleting a session appends a
+    ``{"sid", "op"}`` tombstone. Sessions are rebuilt by replaying the log,
+    which is compacted once it holds ``COMPACT_FACTOR`` times more records
+    than the live state; compaction runs on a background thread so the
+    caller that crosses the threshold does not wait for the rewrite.
+    Appends are buffered and flushed at most ``flush_interval`` seconds
+    later, on close and at exit, unless ``durable`` asks for each one to be
+    written and fsynced immediately.
+    
+    The manager is safe to share between threads. Each session has its own
+    lock, so exchanges in different sessions do not contend; the session
+    tables are copied on write under a lock held only to create or delete a
+    session, so lookups and listings read them without locking; and the
+    persistence log has a lock held for each mutation it records, so the
+    log order always matches the in-memory order. Locks are taken in that
+    order: table, session, log.
+    
     Example:
         >>> manager = ConversationMemoryManager()
         >>> manager.add_exchange("session1", "Hello", "Hi there!")
         >>> history = manager.get_history("session1")
     """
     
+    # Compact the persistence log once it has this many times more records
+    # than the sessions it describes...
+    COMPACT_FACTOR = 10
+    
+    # ...and at least this many records in total
+    COMPACT_MIN_RECORDS = 1000
+    
+    # Size of the in-process write buffer for the persistence log
+    WRITE_BUFFER_SIZE = 64 * 1024
+    
+    # Number of turns returned by relevance-based history reads by default
+    RELEVANT_HISTORY_TURNS = 3
+    
     def __init__(
         self,
         max_turns: Optional[int] = None,
         persist_path: Optional[str] = None,
+        summarizer: Optional[Callable[[List[ConversationTurn], str], str]] = None,
+        flush_interval: float = 0.2,
+        durable: bool = False,
+        embeddings: Optional[Embeddings] = None,
     ):
         """
         Initialize the conversation memory manager.
@@ -132,26 +322,99 @@ class ConversationMemoryManager:
         Args:
             max_turns: Maximum conversation turns to remember per session.
             persist_path: Path to persist conversation history.
+            summarizer: Optional callable merging evicted turns into the
+                        session's running summary; called as
+                        ``summarizer(evicted_turns, previous_summary)`` and
+                        returning the new summary (typically an LLM call).
+                        Without it, evicted turns are simply dropped.
+            flush_interval: Maximum seconds a persisted change may sit in
+                            the write buffer before being flushed.
+            durable: If True, write and fsync every persisted change before
+                     returning instead of buffering it.
+            embeddings: Optional embedding model enabling relevance-based
+                        history reads (get_relevant_history). Each turn is
+                        embedded once, when added or first needed.
         """
         self.settings = get_settings()
         self.max_turns = max_turns or self.settings.MAX_CONVERSATION_HISTORY
         self.persist_path = Path(persist_path) if persist_path else None
+        self.summarizer = summarizer
+        self.flush_interval = flush_interval
+        self.durable = durable
+        self.embeddings = embeddings
         
-        # Session storage
+        # Session storage and per-session locks
         self._sessions: Dict[str, ConversationSession] = {}
+        self._session_locks: Dict[str, threading.Lock] = {}
+        self._dict_lock = threading.RLock()
+        
+        # Append handle for the persistence log (opened on the first write),
+        # the number of records it holds and the timer that flushes it
+        self._persist_lock = threading.Lock()
+        self._persist_file = None
+        self._flush_timer: Optional[threading.Timer] = None
+        self._log_records = 0
+        self._compact_at = self.COMPACT_MIN_RECORDS
+        
+        # Background compaction thread, and the records appended while it
+        # runs (None when no compaction is in progress)
+        self._compactor: Optional[threading.Thread] = None
+        self._compaction_tail: Optional[List[bytes]] = None
         
         # Load persisted sessions if available
         if self.persist_path:
-            self._load_sessions()
+            with self._persist_lock:
+                self._load_sessions()
+            self._session_locks = {
+                session_id: threading.Lock() for session_id in self._sessions
+            }
+            _live_managers.add(self)
         
         logger.info(f"ConversationMemoryManager initialized (max_turns={self.max_turns})")
     
-    def _get_or_create_session(self, session_id: str) -> ConversationSession:
-        """Get existing session or create a new one."""
-        if session_id not in self._sessions:
-            self._sessions[session_id] = ConversationSession(session_id=session_id)
-            logger.debug(f"Created new session: {session_id}")
-        return self._sessions[session_id]
+    def _get_or_create_session(
+        self,
+        session_id: str,
+    ) -> Tuple[ConversationSession, threading.Lock]:
+        """
+        Get existing session and its lock or create a new one.
+        
+        Callers must check that the session is still current once they hold
+        its lock, as it may have been deleted in between.
+        """
+        session, session_lock = self._get_session(session_id)
+        if session is not None:
+            return session, session_lock
+        
+        with self._dict_lock:
+            if session_id not in self._sessions:
+                session = ConversationSession(session_id=session_id, max_turns=self.max_turns)
+                # Log the session before publishing it, so no lock-free reader
+                # can log a turn ahead of the record that replay rebuilds it from
+                with self._persisting():
+                    if self.persist_path:
+                        self._append_records([self._session_record(session)])
+                    # Publish new tables rather than mutating the ones readers
+                    # may hold, and the lock first so every visible session has one
+                    self._session_locks = {**self._session_locks, session_id: threading.Lock()}
+                    self._sessions = {**self._sessions, session_id: session}
+                logger.debug(f"Created new session: {session_id}")
+            return self._sessions[session_id], self._session_locks[session_id]
+    
+    def _get_session(
+        self,
+        session_id: str,
+    ) -> Tuple[Optional[ConversationSession], Optional[threading.Lock]]:
+        """Get an existing session and its lock without locking, or (None, None)."""
+        session = self._sessions.get(session_id)
+        session_lock = self._session_locks.get(session_id)
+        if session is None or session_lock is None:
+            return None, None
+        return session, session_lock
+    
+    def _persisting(self):
+        """Lock to hold while mutating a session whose change is logged."""
+        return self._persist_lock if self.persist_path else nullcontext()
     
     def add_exchange(
         self,
@@ -169,19 +432,60 @@ class ConversationMemoryManager:
             ai_message: The AI's response.
             **metadata: Additional metadata for the turn.
         """
-        session = self._get_or_create_session(session_id)
-        session.add_turn(human_message, ai_message, **metadata)
-        
-        # Trim to max turns if needed
-        if self.max_turns and len(session.turns) > self.max_turns:
-            session.turns = session.turns[-self.max_turns:]
+        # Embed before taking any lock; the model may be slow or remote
+        embedding = None
+        if self.embeddings is not None:
+            embedding = self._embed([f"{human_message}\n{ai_message}"])[0]
         
-        # Persist if enabled
-        if self.persist_path:
-            self._save_sessions()
+        while True:
+            session, session_lock = self._get_or_create_session(session_id)
+            with session_lock:
+                # Start over if the session was deleted since the lookup
+                if self._sessions.get(session_id) is not session:
+                    continue
+                
+                # Fold the turn about to be evicted into the summary; this
+                # may be slow, so it runs before taking the log lock
+                summary = None
+                if self.summarizer and session.is_full():
+                    summary = self._summarize(session, [session.turns[0]])
+                
+                with self._persisting():
+                    session.add_turn(human_message, ai_message, **metadata)
+                    session.turns[-1]._embedding = embedding
+                    if summary is not None:
+                        session.summary = summary
+                    
+                    # Persist if enabled
+                    if self.persist_path:
+                        records = [{"sid": session_id, "turn": session.turns[-1].to_dict()}]
+                        if summary is not None:
+                            records.append({"sid": session_id, "summary": summary})
+                        self._append_records(records)
+            break
         
         logger.debug(f"Added exchange to session {session_id}")
     
+    def _embed(self, texts: List[str]) -> List[Optional[QuantizedVector]]:
+        """Embed and quantize texts in one batch; None for each on failure."""
+        try:
+            return [_quantize(vector) for vector in self.embeddings.embed_documents(texts)]
+        except Exception as e:
+            logger.warning(f"Failed to embed conversation turns: {e}")
+            return [None] * len(texts)
+    
+    def _summarize(
+        self,
+        session: ConversationSession,
+        evicted: List[ConversationTurn],
+    ) -> Optional[str]:
+        """Merge evicted turns into the session summary, or None on failure."""
+        try:
+            return self.summarizer(evicted, session.summary)
+        except Exception as e:
+            logger.warning(f"Failed to summarize session {session.session_id}: {e}")
+            return None
+    
     def get_history(
         self,
         session_id: str,
@@ -197,29 +501,50 @@ class ConversationMemoryManager:
         Returns:
             List of conversation turns.
         """
-        if session_id not in self._sessions:
+        session, session_lock = self._get_session(session_id)
+        if session is None:
             return []
         
-        session = self._sessions[session_id]
-        return session.get_history(max_turns or self.max_turns)
+        with session_lock:
+            return session.get_history(max_turns or self.max_turns)
     
     def clear_history(self, session_id: str) -> None:
         """Clear conversation history for a session."""
-        if session_id in self._sessions:
-            self._sessions[session_id].clear()
+        session, session_lock = self._get_session(session_id)
+        if session is None:
+            return
+        
+        with session_lock, self._persisting():
+            # Nothing to clear if the session was deleted since the lookup
+            if self._sessions.get(session_id) is not session:
+                return
             
-            if self.persist_path:
-                self._save_sessions()
+            session.clear()
             
-            logger.info(f"Cleared history for session: {session_id}")
+            if self.persist_path:
+                self._append_records([{"sid": session_id, "op": "clear"}])
+        
+        logger.info(f"Cleared history for session: {session_id}")
     
     def delete_session(self, session_id: str) -> None:
         """Delete a session completely."""
-        if session_id in self._sessions:
-            del self._sessions[session_id]
+        with self._dict_lock:
+            if session_id not in self._sessions:
+                return
             
-            if self.persist_path:
-                self._save_sessions()
+            # Wait for in-flight operations on the session; the tombstone is
+            # logged before the session id can be reused
+            with self._session_locks[session_id], self._persisting():
+                sessions = dict(self._sessions)
+                del sessions[session_id]
+                self._sessions = sessions
+                
+                session_locks = dict(self._session_locks)
+                del session_locks[session_id]
+                self._session_locks = session_locks
+                
+                if self.persist_path:
+                    self._append_records([{"sid": session_id, "op": "delete"}])
             
             logger.info(f"Deleted session: {session_id}")
     
@@ -229,17 +554,71 @@ class ConversationMemoryManager:
     
     def get_session_info(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get information about a session."""
-        if session_id not in self._sessions:
+        session = self._sessions.get(session_id)
+        if session is None:
             return None
         
-        session = self._sessions[session_id]
         return {
             "session_id": session.session_id,
             "num_turns": len(session.turns),
-            "created_at": session.created_at,
-            "last_active": session.last_active,
+            "created_at": _format_timestamp(session.created_at),
+            "last_active": _format_timestamp(session.last_active),
         }
     
+    def get_relevant_history(
+        self,
+        session_id: str,
+        query: str,
+        k: Optional[int] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Get the turns of a session most relevant to a query.
+        
+        Requires the manager to have been created with ``embeddings``.
+        Turns are ranked by cosine similarity between their int8-quantized
+        embeddings and the query's, and returned in conversation order.
+        
+        Args:
+            session_id: Session identifier.
+            query: Text to rank turns against, e.g. the user's question.
+            k: Number of turns to return (default RELEVANT_HISTORY_TURNS).
+            
+        Returns:
+            List of conversation turns.
+        """
+        if self.embeddings is None:
+            raise ValueError("get_relevant_history requires an embeddings model")
+        
+        session, session_lock = self._get_session(session_id)
+        if session is None:
+            return []
+        
+        k = k or self.RELEVANT_HISTORY_TURNS
+        query_vector = _quantize(self.embeddings.embed_query(query))
+        
+        with session_lock:
+            turns = list(session.turns)
+            missing = [turn for turn in turns if turn._embedding is None]
+        
+        if len(turns) > k:
+            # Turns restored from disk are embedded together on first use,
+            # outside the lock as the model may be slow or remote
+            if missing:
+                vectors = self._embed([turn.text for turn in missing])
+                with session_lock:
+                    for turn, vector in zip(missing, vectors):
+                        if turn._embedding is None:
+                            turn._embedding = vector
+            
+            scores = [
+                _cosine(turn._embedding, query_vector) if turn._embedding else 0.0
+                for turn in turns
+            ]
+            top = sorted(range(len(turns)), key=scores.__getitem__, reverse=True)[:k]
+            turns = [turns[i] for i in sorted(top)]
+        
+        return [turn.to_dict() for turn in turns]
+    
     def get_langchain_memory(
         self,
         session_id: str = "default",
@@ -273,71 +652,338 @@ class ConversationMemoryManager:
             max_turns: Maximum turns to include.
             
         Returns:
-            Formatted conversation string.
+            Formatted conversation string, preceded by the summary of
+            evicted turns when a summarizer is configured.
         """
-        history = self.get_history(session_id, max_turns)
-        if not history:
+        session, session_lock = self._get_session(session_id)
+        if session is None:
             return ""
         
-        formatted = []
-        for turn in history:
-            formatted.append(f"Human: {turn.get('human', '')}")
-            formatted.append(f"Assistant: {turn.get('ai', '')}")
-        
-        return "\n".join(formatted)
+        with session_lock:
+            return session.format_history(max_turns or self.max_turns)
     
-    def _save_sessions(self) -> None:
-        """Save sessions to disk."""
+    def compact(self) -> None:
+        """
+        Rewrite the persistence log from the current sessions.
+        
+        The new log is written next to the old one and swapped in atomically,
+        so a crash mid-compaction leaves the previous log intact.
+        """
         if not self.persist_path:
             return
         
+        # Let a background compaction finish rather than race its swap
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        with self._persist_lock:
+            self._compact_locked()
+    
+    def flush(self) -> None:
+        """Write buffered changes to the persistence log."""
+        with self._persist_lock:
+            self._flush_timer = None
+            if self._persist_file is not None:
+                self._persist_file.flush()
+    
+    def close(self) -> None:
+        """
+        Wait for a running compaction, then close the persistence log; it
+        is reopened on the next write.
+        """
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        with self._persist_lock:
+            self._close_locked()
+    
+    def _compact_locked(self) -> None:
+        """Rewrite the persistence log. Caller must hold the log lock."""
+        tmp_path = None
         try:
-            self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+            data, records = self._snapshot_locked()
+            self._close_locked()
+            tmp_path = self._write_snapshot(data)
+            os.replace(tmp_path, self.persist_path)
+            self._compacted_locked(records)
             
-            data = {
-                session_id: session.to_dict()
-                for session_id, session in self._sessions.items()
-            }
+        except Exception as e:
+            logger.error(f"Failed to compact sessions: {e}")
+            self._discard_snapshot(tmp_path)
+    
+    def _compact_in_background(self) -> None:
+        """
+        Compaction thread: rewrite the log without blocking writers on I/O.
+        
+        The sessions are serialized under the log lock, but the new log is
+        written outside it. Records appended meanwhile still go to the old
+        log and are also collected, then copied into the new log just
+        before it replaces the old one.
+        """
+        tmp_path = None
+        try:
+            with self._persist_lock:
+                data, _ = self._snapshot_locked()
+                self._compaction_tail = []
+            
+            tmp_path = self._write_snapshot(data)
+            
+            with self._persist_lock:
+                self._close_locked()
+                with open(tmp_path, "ab") as f:
+                    f.write(b"".join(self._compaction_tail))
+                os.replace(tmp_path, self.persist_path)
+                # The tail may repeat what the snapshot already holds, so
+                # count the live records instead
+                self._compacted_locked(self._live_records_locked())
+            
+        except Exception as e:
+            logger.error(f"Failed to compact sessions: {e}")
+            self._discard_snapshot(tmp_path)
+        finally:
+            with self._persist_lock:
+                self._compaction_tail = None
+                self._compactor = None
+    
+    def _snapshot_locked(self) -> Tuple[bytes, int]:
+        """
+        Serialize the sessions as a compacted log and count its records.
+        
+        Caller must hold the log lock: logged sessions only change under
+        it, and the session table is replaced rather than modified.
+        """
+        lines = []
+        for session_id, session in self._sessions.items():
+            lines.append(_dump_record(self._session_record(session)))
+            for turn in session.turns:
+                lines.append(_dump_record({"sid": session_id, "turn": turn.to_dict()}))
+        return b"".join(lines), len(lines)
+    
+    def _write_snapshot(self, data: bytes) -> Path:
+        """
+        Write a compacted log next to the current one and return its path.
+        
+        Each compaction gets its own temporary file, so one never swaps in
+        or appends to another's.
+        """
+        self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=self.persist_path.name + ".",
+            suffix=".tmp",
+            dir=self.persist_path.parent,
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return Path(tmp_name)
+    
+    @staticmethod
+    def _discard_snapshot(tmp_path: Optional[Path]) -> None:
+        """Remove a compacted log that was not swapped in."""
+        if tmp_path is not None:
+            try:
+                tmp_path.unlink()
+            except FileNotFoundError:
+                pass
+    
+    def _live_records_locked(self) -> int:
+        """Number of records a compacted log holds. Caller must hold the log lock."""
+        return sum(1 + len(session.turns) for session in self._sessions.values())
+    
+    def _compacted_locked(self, records: int) -> None:
+        """Reset log bookkeeping after compaction. Caller must hold the log lock."""
+        self._log_records = records
+        self._compact_at = max(self.COMPACT_MIN_RECORDS, self.COMPACT_FACTOR * records)
+        logger.debug(f"Compacted {len(self._sessions)} sessions into {self.persist_path}")
+    
+    def _close_locked(self) -> None:
+        """Close the persistence log. Caller must hold the log lock."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._persist_file is not None:
+            self._persist_file.close()
+            self._persist_file = None
+    
+    @staticmethod
+    def _session_record(session: ConversationSession) -> Dict[str, Any]:
+        """Log record that (re)creates an empty session."""
+        return {
+            "sid": session.session_id,
+            "session": {
+                "created_at": _format_timestamp(session.created_at),
+                "last_active": _format_timestamp(session.last_active),
+                "metadata": session.metadata,
+                "summary": session.summary,
+            },
+        }
+    
+    def _append_records(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Append records to the persistence log, compacting it if needed.
+        
+        Caller must hold the log lock.
+        """
+        try:
+            if self._persist_file is None:
+                self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+                # Durable logs are unbuffered, so each call is a single
+                # append of whole lines
+                self._persist_file = open(
+                    self.persist_path,
+                    "ab",
+                    buffering=0 if self.durable else self.WRITE_BUFFER_SIZE,
+                )
+                if self._persist_file.tell() and not self._ends_with_newline():
+                    # Terminate a line cut short by a crash mid-append
+                    self._persist_file.write(b"\n")
             
-            with open(self.persist_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            data = b"".join(_dump_record(r) for r in records)
+            self._persist_file.write(data)
+            self._log_records += len(records)
+            if self._compaction_tail is not None:
+                self._compaction_tail.append(data)
             
-            logger.debug(f"Saved {len(self._sessions)} sessions to {self.persist_path}")
+            if self.durable:
+                os.fsync(self._persist_file.fileno())
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
             
         except Exception as e:
             logger.error(f"Failed to save sessions: {e}")
+            return
+        
+        if self._log_records > self._compact_at:
+            self._maybe_compact()
+    
+    def _ends_with_newline(self) -> bool:
+        """Whether the persistence log ends with a complete line."""
+        with open(self.persist_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    
+    def _maybe_compact(self) -> None:
+        """
+        Compact the log if it is much larger than the live sessions.
+        
+        Caller must hold the log lock.
+        """
+        if self._compactor is not None:
+            return
+        
+        live_records = self._live_records_locked()
+        if self._log_records > self.COMPACT_FACTOR * live_records:
+            self._compactor = threading.Thread(
+                target=self._compact_in_background,
+                name=f"ConversationMemoryCompactor-{self.persist_path.name}",
+                daemon=True,
+            )
+            self._compactor.start()
+        else:
+            self._compact_at = max(self.COMPACT_MIN_RECORDS, self.COMPACT_FACTOR * live_records)
+    
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Replay one persistence log record onto the in-memory sessions."""
+        session_id = record["sid"]
+        
+        if "turn" in record:
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = ConversationSession(session_id=session_id, max_turns=self.max_turns)
+                self._sessions[session_id] = session
+            session.append_turn(ConversationTurn.from_dict(record["turn"]))
+        elif "summary" in record:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.summary = record["summary"]
+        elif "session" in record:
+            self._sessions[session_id] = ConversationSession.from_dict(
+                {"session_id": session_id, **record["session"]},
+                max_turns=self.max_turns,
+            )
+        elif record.get("op") == "clear":
+            if session_id in self._sessions:
+                self._sessions[session_id].clear()
+        elif record.get("op") == "delete":
+            self._sessions.pop(session_id, None)
     
     def _load_sessions(self) -> None:
-        """Load sessions from disk."""
+        """Load sessions by replaying the persistence log."""
         if not self.persist_path or not self.persist_path.exists():
             return
         
         try:
-            with open(self.persist_path, 'r') as f:
-                data = json.load(f)
-            
-            self._sessions = {
-                session_id: ConversationSession.from_dict(session_data)
-                for session_id, session_data in data.items()
-            }
+            with open(self.persist_path, "rb") as f:
+                # Earlier versions saved one indented JSON object of sessions
+                if f.readline().strip() == b"{":
+                    f.seek(0)
+                    self._load_legacy_sessions(_load_record(f.read()))
+                    return
+                
+                f.seek(0)
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = _load_record(line)
+                        self._apply_record(record)
+                    except (json.JSONDecodeError, KeyError, TypeError) as e:
+                        # Typically a line cut short by a crash mid-append
+                        logger.warning(f"Skipping malformed session record: {e}")
+                        continue
+                    self._log_records += 1
             
             logger.info(f"Loaded {len(self._sessions)} sessions from {self.persist_path}")
             
         except Exception as e:
             logger.error(f"Failed to load sessions: {e}")
             self._sessions = {}
+            return
+        
+        if self._log_records > self._compact_at:
+            self._maybe_compact()
+    
+    def _load_legacy_sessions(self, data: Dict[str, Any]) -> None:
+        """Load sessions from the old single-object format and convert the file."""
+        self._sessions = {
+            session_id: ConversationSession.from_dict(session_data, max_turns=self.max_turns)
+            for session_id, session_data in data.items()
+        }
+        
+        logger.info(f"Loaded {len(self._sessions)} sessions from {self.persist_path}")
+        self._compact_locked()
+
+
+# Managers with a persistence log, flushed at exit
+_live_managers: "weakref.WeakSet[ConversationMemoryManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers() -> None:
+    """Write every live manager's buffered changes before the process exits."""
+    for manager in list(_live_managers):
+        try:
+            manager.flush()
+        except Exception:
+            pass
 
 
 # Global memory manager instance
 _memory_manager: Optional[ConversationMemoryManager] = None
+_memory_manager_lock = threading.Lock()
 
 
 def get_memory_manager() -> ConversationMemoryManager:
-    """Get the global memory manager instance."""
+    """Get the global memory manager instance, creating it exactly once."""
     global _memory_manager
-    if _memory_manager is None:
-        _memory_manager = ConversationMemoryManager()
-    return _memory_manager
+    manager = _memory_manager
+    if manager is None:
+        with _memory_manager_lock:
+            manager = _memory_manager
+            if manager is None:
+                manager = _memory_manager = ConversationMemoryManager()
+    return manager
 
 
 def create_memory() -> Dict[str, List]:
@@ -5,8 +5,12 @@ This module provides support for local LLM servers that expose
 an OpenAI-compatible API endpoint (like vLLM, LocalAI, Ollama, etc.).
 """
 
+from functools import lru_cache
 from typing import Optional, Dict, Any
+
+import httpx
 from langchain_openai import ChatOpenAI
+from langchain_core.caches import InMemoryCache
 from langchain_core.language_models.base import BaseLanguageModel
 
 from config.settings import get_settings
@@ -15,6 +19,38 @@ from core.exceptions import LLMError, ConfigurationError
 
 logger = get_logger(__name__)
 
+# Connection pool shared by every provider's ChatOpenAI client
+_HTTP_POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=64)
+
+# Same defaults as the OpenAI client; per-request timeouts still apply
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.Client:
+    """
+    Get the process-wide HTTP client for OpenAI-compatible servers.
+    
+    Reusing one client keeps connections to the LLM server alive across
+    providers and LLM instances instead of reconnecting for each one.
+    """
+    return httpx.Client(limits=_HTTP_POOL_LIMITS, timeout=_HTTP_TIMEOUT)
+
+
+# Maximum number of responses kept by the shared response cache
+RESPONSE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=1)
+def _shared_response_cache() -> InMemoryCache:
+    """
+    Get the process-wide cache of LLM responses.
+    
+    Entries are keyed by prompt and model parameters, so providers with
+    different endpoints, models or settings never share responses.
+    """
+    return InMemoryCache(maxsize=RESPONSE_CACHE_SIZE)
+
 
 class CustomLLMProvider:
     """
@@ -44,6 +80,7 @@ class CustomLLMProvider:
         api_key: str = "not-needed",
         temperature: float = 0.7,
         max_tokens: int = 2048,
+        cache_responses: Optional[bool] = None,
         **kwargs
     ):
         """
@@ -55,6 +92,10 @@ class CustomLLMProvider:
             api_key: API key (set to "not-needed" for local servers without auth).
             temperature: Sampling temperature (0.0 to 1.0).
             max_tokens: Maximum tokens to generate.
+            cache_responses: Whether to answer repeated prompts from an
+                             in-memory cache. Defaults to caching only when
+                             temperature is 0, where responses are
+                             (near-)deterministic.
             **kwargs: Additional parameters to pass to ChatOpenAI.
         """
         self.base_url = base_url
@@ -62,6 +103,9 @@ class CustomLLMProvider:
         self.api_key = api_key
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache_responses = (
+            temperature == 0 if cache_responses is None else cache_responses
+        )
         self.kwargs = kwargs
         self._llm: Optional[BaseLanguageModel] = None
         
@@ -83,13 +127,16 @@ class CustomLLMProvider:
         try:
             logger.info(f"Initializing custom LLM: {self.model_name} at {self.base_url}")
             
+            kwargs = {"http_client": _shared_http_client(), **self.kwargs}
+            if self.cache_responses:
+                kwargs.setdefault("cache", _shared_response_cache())
             self._llm = ChatOpenAI(
                 base_url=self.base_url,
                 model=self.model_name,
                 api_key=self.api_key,
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
-                **self.kwargs
+                **kwargs
             )
             
             logger.info("Custom LLM initialized successfully")
@@ -340,11 +340,10 @@ class KnowledgeAwareRetriever:
         if not self._classifier:
             return "general", 0.0
         
-        # Check for tacit query indicators
-        is_tacit, tacit_indicators = self._classifier.is_tacit_query(query)
-        
-        # Check for decision query indicators
-        is_decision, decision_indicators = self._classifier.is_decision_query(query)
+        # Check for tacit and decision query indicators in one pass
+        _, tacit_indicators, _, decision_indicators = (
+            self._classifier.classify_query(query)
+        )
         
         # Determine intent
         tacit_strength = len(tacit_indicators)
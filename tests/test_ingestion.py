@@ -6,8 +6,11 @@ import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from langchain_core.documents import Document
+
 from ingestion.load_documents import DocumentLoader
 from ingestion.chunk_documents import DocumentChunker
+from ingestion.metadata_cache import DocumentMetadataCache
 from core.exceptions import DocumentLoadError, ChunkingError
 
 
@@ -52,6 +55,64 @@ class TestDocumentLoader:
         assert metadata["file_name"] == "test.txt"
         assert metadata["file_extension"] == ".txt"
         assert "ingestion_timestamp" in metadata
+    
+    def test_metadata_cache_skips_unchanged_files(self, tmp_path):
+        """Test that cached metadata is reused for unchanged files."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Test content")
+        
+        loader = DocumentLoader(
+            data_dir=str(tmp_path),
+            metadata_cache_path=str(tmp_path / ".cache" / "meta.sqlite"),
+        )
+        
+        first = loader._enrich_documents(
+            [Document(page_content="Test content", metadata={"source": str(test_file)})],
+            "text",
+        )
+        
+        with patch.object(loader, "_extract_metadata") as mock_extract:
+            second = loader._enrich_documents(
+                [Document(page_content="Test content", metadata={"source": str(test_file)})],
+                "text",
+            )
+            mock_extract.assert_not_called()
+        
+        assert second[0].metadata == first[0].metadata
+    
+    def test_scan_skips_symlinked_directories(self, tmp_path):
+        """Test that scanning does not follow symlinked directories."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "doc.txt").write_text("Test content")
+        try:
+            (tmp_path / "a" / "loop").symlink_to(tmp_path, target_is_directory=True)
+            (tmp_path / "link").symlink_to(tmp_path / "a", target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported")
+        
+        loader = DocumentLoader(data_dir=str(tmp_path))
+        files = loader._scan_data_directory()
+        
+        assert [path for path, _ in files[".txt"]] == [str(tmp_path / "a" / "doc.txt")]
+
+
+class TestDocumentMetadataCache:
+    """Tests for DocumentMetadataCache class."""
+    
+    def test_get_miss_when_file_changed(self, tmp_path):
+        """Test that a changed mtime or size invalidates the entry."""
+        cache = DocumentMetadataCache(str(tmp_path / "meta.sqlite"))
+        docs = [Document(page_content="abc", metadata={"source": "a.txt", "page": 0})]
+        
+        cache.put("a.txt", 1.0, 3, docs)
+        
+        hit = cache.get("a.txt", 1.0, 3)
+        assert hit is not None
+        assert hit[0].page_content == "abc"
+        assert hit[0].metadata == {"source": "a.txt", "page": 0}
+        assert cache.get("a.txt", 2.0, 3) is None
+        assert cache.get("a.txt", 1.0, 4) is None
+        assert cache.get("b.txt", 1.0, 3) is None
 
 
 class TestDocumentChunker:
@@ -7,9 +7,12 @@ This module tests the three enterprise features:
 - Feature 3: Knowledge Gap Detection
 """
 
+import gc
+import weakref
 import pytest
+from dataclasses import replace
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 from datetime import datetime
 
 from langchain_core.documents import Document
@@ -25,6 +28,7 @@ from knowledge.decision_parser import (
     DecisionParser,
     DecisionMetadata,
     parse_decision_document,
+    parse_decision_documents,
 )
 from knowledge.gap_detector import (
     KnowledgeGapDetector,
@@ -139,6 +143,66 @@ class TestKnowledgeClassifier:
         )
         
         assert is_decision is True
+    
+    def test_classify_query_matches_separate_checks(self):
+        """classify_query should combine is_tacit_query and is_decision_query."""
+        query = "Why did we decide to avoid RabbitMQ? Any lessons?"
+        
+        result = self.classifier.classify_query(query)
+        
+        assert result == (
+            *self.classifier.is_tacit_query(query),
+            *self.classifier.is_decision_query(query),
+        )
+        assert result[0] is True and result[2] is True
+    
+    def test_skips_content_when_filename_is_decisive(self):
+        """Should skip content keywords when opted in and the filename decides."""
+        classifier = KnowledgeClassifier(skip_content_when_decisive=True)
+        
+        result = classifier.classify(
+            filename="ADR-001.md",
+            content="A common pitfall and mistake to avoid...",
+        )
+        
+        assert result.knowledge_type == KnowledgeType.DECISION
+        assert result.tacit_indicators == []
+    
+    def test_classify_cached_matches_classify(self):
+        """Cached classification should match classify and not share state."""
+        kwargs = dict(
+            filename="postmortem_incident_2024.txt",
+            filepath="/docs/postmortems/postmortem_incident_2024.txt",
+            content="Root cause analysis and lessons...",
+        )
+        
+        first = self.classifier.classify_cached(**kwargs)
+        first.tacit_indicators.clear()
+        second = self.classifier.classify_cached(**kwargs)
+        
+        assert second == self.classifier.classify(**kwargs)
+        assert second.tacit_indicators
+    
+    def test_classify_filename_only_matches_classify(self):
+        """Filename-only classification should match classify by filename."""
+        for filename in ["ADR-001-use-redis.md", "Exit_Interview.txt", "api_guide.md"]:
+            assert self.classifier.classify_filename_only(filename) == (
+                self.classifier.classify(filename=filename)
+            )
+    
+    def test_classify_batch(self):
+        """Batch classification should match classifying one at a time."""
+        filenames = ["ADR-001-use-redis.md", "notes.txt", "api_guide.md"]
+        contents = [None, "Lessons learned: avoid this mistake, never again", None]
+        
+        results = self.classifier.classify_batch(filenames, contents=contents)
+        
+        assert results == [
+            self.classifier.classify(filename=f, content=c)
+            for f, c in zip(filenames, contents)
+        ]
+        with pytest.raises(ValueError):
+            self.classifier.classify_batch(filenames, contents=contents[:1])
 
 
 # =============================================================================
@@ -170,6 +234,20 @@ class TestDecisionParser:
         
         assert "Redis" in result.decision_title or "Caching" in result.decision_title
     
+    def test_title_patterns_keep_priority_order(self):
+        """A higher-priority title pattern should win even if it matches later."""
+        result = self.parser.parse(
+            content="## Decision\nWe decided to use Postgres.\n# ADR-007: Use Postgres for storage\n",
+            filename="adr.md"
+        )
+        assert result.decision_title == "We decided to use Postgres."
+        
+        result = self.parser.parse(
+            content="## Decision:\nGo.\nDecision 5 here\n",
+            filename="adr.md"
+        )
+        assert result.decision_title is None
+    
     def test_extracts_author(self):
         """Should extract author information."""
         result = self.parser.parse(
@@ -258,6 +336,23 @@ class TestDecisionParser:
         
         assert len(result.tradeoffs) >= 1
     
+    def test_section_ends_at_next_header(self):
+        """Section content should stop at the next header of any level."""
+        result = self.parser.parse(
+            content="""
+            # Decision
+            
+            ## Context
+            The team needed a cache.
+            
+            ### Details
+            Not part of the context.
+            """,
+            filename="adr.md"
+        )
+        
+        assert result.context == "The team needed a cache."
+    
     def test_to_metadata_returns_dict(self):
         """Metadata should be convertible to dictionary."""
         result = self.parser.parse(
@@ -357,6 +452,78 @@ class TestKnowledgeGapDetector:
         
         assert result.tacit_coverage is True
         assert result.decision_coverage is True
+    
+    def test_evaluate_batch(self):
+        """Should evaluate each query's results independently."""
+        doc = Document(page_content="Relevant content", metadata={"knowledge_type": "explicit"})
+        
+        results = self.detector.evaluate_batch(
+            queries=["Covered question", "Unknown topic"],
+            results=[[(doc, 0.9), (doc, 0.7)], []],
+            log_gap=False,
+        )
+        
+        assert [r.query for r in results] == ["Covered question", "Unknown topic"]
+        assert results[0].gap_detected is False
+        assert results[0].avg_similarity_score == pytest.approx(0.8)
+        assert results[0].min_similarity_score == 0.7
+        assert results[1].gap_detected is True
+    
+    def test_cached_evaluations_do_not_keep_detector_alive(self, tmp_path):
+        """Should free the detector as soon as the last reference goes."""
+        detector = KnowledgeGapDetector(gap_logger=KnowledgeGapLogger(log_dir=str(tmp_path)))
+        doc = Document(page_content="Relevant content", metadata={"knowledge_type": "explicit"})
+        first = detector.evaluate("Covered question", [(doc, 0.9)], log_gap=False)
+        assert detector.evaluate("Covered question", [(doc, 0.9)], log_gap=False) == replace(
+            first, timestamp=ANY
+        )
+        
+        ref = weakref.ref(detector)
+        gc.disable()
+        try:
+            del detector
+            assert ref() is None
+        finally:
+            gc.enable()
+    
+    def test_short_queries_relax_similarity_threshold(self):
+        """Should count near-threshold documents as relevant for short queries."""
+        docs_with_scores = [
+            (Document(page_content="Related content", metadata={}), score)
+            for score in (0.45, 0.4, 0.1)
+        ]
+        
+        short = self.detector.evaluate("vacation policy", docs_with_scores, log_gap=False)
+        long = self.detector.evaluate(
+            "how many vacation days do new employees get per year",
+            docs_with_scores,
+            log_gap=False,
+        )
+        
+        assert short.num_relevant_documents == 2
+        assert short.filtered_count == 1
+        assert long.num_relevant_documents == 0
+        assert long.filtered_count == 3
+    
+    def test_normalizes_unbounded_scores(self):
+        """Should min-max normalize scores when enabled, keeping raw statistics."""
+        detector = KnowledgeGapDetector(
+            confidence_threshold=0.6,
+            min_relevant_docs=2,
+            similarity_threshold=0.5,
+            normalize_scores=True,
+        )
+        doc = Document(page_content="Relevant content", metadata={"knowledge_type": "explicit"})
+        
+        result = detector.evaluate(
+            query="What is our deployment process?",
+            documents_with_scores=[(doc, 12.0), (doc, 9.0), (doc, 3.0)],
+            log_gap=False,
+        )
+        
+        assert result.num_relevant_documents == 2
+        assert result.max_similarity_score == 12.0
+        assert 0.0 <= result.confidence_score <= 1.0
 
 
 class TestKnowledgeGapLogger:
@@ -383,6 +550,8 @@ class TestKnowledgeGapLogger:
         gaps = logger.get_recent_gaps(limit=10)
         assert len(gaps) == 1
         assert gaps[0]["query"] == "Test query"
+        assert gaps[0]["gap_severity"] == "high"
+        assert f"{gap_result.to_dict()['gap_severity']}" == "high"
     
     def test_does_not_log_non_gaps(self, tmp_path):
         """Should not log when no gap detected."""
@@ -399,6 +568,92 @@ class TestKnowledgeGapLogger:
         
         gaps = logger.get_recent_gaps(limit=10)
         assert len(gaps) == 0
+    
+    def test_gap_statistics(self, tmp_path):
+        """Should aggregate gap statistics across the whole log."""
+        logger = KnowledgeGapLogger(log_dir=str(tmp_path))
+        
+        for i, severity in enumerate([GapSeverity.HIGH, GapSeverity.LOW, GapSeverity.HIGH]):
+            logger.log(GapDetectionResult(
+                has_sufficient_knowledge=False,
+                confidence_score=0.2,
+                gap_detected=True,
+                gap_severity=severity,
+                query=f"Query {i}",
+                timestamp=f"2024-01-0{i + 1}T00:00:00",
+                department="engineering" if i == 0 else None,
+            ))
+        
+        stats = logger.get_gap_statistics()
+        
+        assert stats["total_gaps"] == 3
+        assert stats["by_severity"] == {"high": 2, "low": 1}
+        assert stats["by_department"] == {"engineering": 1, "unknown": 2}
+        assert stats["avg_confidence"] == 0.2
+        assert stats["earliest"] == "2024-01-01T00:00:00"
+        assert stats["latest"] == "2024-01-03T00:00:00"
+    
+    def test_recent_gaps_newest_first(self, tmp_path):
+        """Should return the most recent matching gaps first."""
+        logger = KnowledgeGapLogger(log_dir=str(tmp_path))
+        
+        for i in range(5):
+            logger.log(GapDetectionResult(
+                has_sufficient_knowledge=False,
+                confidence_score=0.2,
+                gap_detected=True,
+                gap_severity=GapSeverity.HIGH if i % 2 == 0 else GapSeverity.LOW,
+                query=f"Query {i}",
+            ))
+        
+        gaps = logger.get_recent_gaps(limit=2, severity=GapSeverity.HIGH)
+        
+        assert [g["query"] for g in gaps] == ["Query 4", "Query 2"]
+    
+    def test_clear_old_logs(self, tmp_path):
+        """Should remove only entries older than the retention window."""
+        logger = KnowledgeGapLogger(log_dir=str(tmp_path))
+        
+        for query, timestamp in [
+            ("Old query", "2000-01-01T00:00:00"),
+            ("New query", datetime.now().isoformat()),
+        ]:
+            logger.log(GapDetectionResult(
+                has_sufficient_knowledge=False,
+                confidence_score=0.2,
+                gap_detected=True,
+                query=query,
+                timestamp=timestamp,
+            ))
+        
+        assert logger.clear_old_logs(days=30) == 1
+        assert [g["query"] for g in logger.get_recent_gaps()] == ["New query"]
+    
+    def test_rotates_log_by_size(self, tmp_path):
+        """Should rotate into segments and read across them newest first."""
+        logger = KnowledgeGapLogger(log_dir=str(tmp_path), max_bytes=500)
+        
+        # Queue every entry before the writer starts, so it writes one batch
+        with patch.object(logger, "_ensure_writer"):
+            for i in range(10):
+                logger.log(GapDetectionResult(
+                    has_sufficient_knowledge=False,
+                    confidence_score=0.2,
+                    gap_detected=True,
+                    query=f"Query {i}",
+                ))
+        logger._ensure_writer()
+        
+        gaps = logger.get_recent_gaps(limit=20)
+        
+        segments = list(tmp_path.glob("knowledge_gaps.*.jsonl"))
+        assert len(segments) > 1
+        # Rotation is checked per entry, not per batch
+        for segment in segments:
+            data = segment.read_bytes()
+            assert len(data) - len(data.splitlines(True)[-1]) < 500
+        assert [g["query"] for g in gaps] == [f"Query {i}" for i in reversed(range(10))]
+        assert logger.get_gap_statistics()["total_gaps"] == 10
 
 
 # =============================================================================
@@ -464,6 +719,52 @@ class TestKnowledgeValidator:
         )
         
         assert result.response_guidance is not None
+    
+    def test_fails_fast_on_critical_gap(self):
+        """Should fail with the gap's safe response when nothing was retrieved."""
+        result = self.validator.validate(
+            query="What mistakes should I avoid?",
+            documents_with_scores=[],
+        )
+        
+        assert result.status == ValidationStatus.FAILED_GAP
+        assert result.can_proceed is False
+        assert result.safe_response == result.gap_result.safe_response
+    
+    def test_validate_batch(self):
+        """Batch validation should match validating one query at a time."""
+        tacit_doc = Document(
+            page_content="Lesson learned: avoid overcomplicating",
+            metadata={"knowledge_type": "tacit", "source": "lessons.md"}
+        )
+        decision_doc = Document(
+            page_content="Decision: Use Redis. Rationale: Performance.",
+            metadata={"knowledge_type": "decision", "source": "ADR-001.md"}
+        )
+        queries = ["What mistakes should I avoid?", "Why did we choose Redis?"]
+        results = [[(tacit_doc, 0.8)], [(decision_doc, 0.9), (tacit_doc, 0.6)]]
+        
+        batch = self.validator.validate_batch(queries, results)
+        
+        assert [r.to_dict() for r in batch] == [
+            self.validator.validate(q, docs).to_dict()
+            for q, docs in zip(queries, results)
+        ]
+        with pytest.raises(ValueError):
+            self.validator.validate_batch(queries, results[:1])
+    
+    def test_validate_batch_repeated_queries(self):
+        """Repeated queries in a batch should get independent, equal results."""
+        doc = Document(
+            page_content="Lesson learned: avoid overcomplicating",
+            metadata={"knowledge_type": "tacit", "source": "lessons.md"}
+        )
+        query = "What mistakes should I avoid?"
+        
+        first, second = self.validator.validate_batch([query, query], [[(doc, 0.8)], [(doc, 0.8)]])
+        
+        assert first.to_dict() == second.to_dict() == self.validator.validate(query, [(doc, 0.8)]).to_dict()
+        assert first.query_indicators is not second.query_indicators
 
 
 # =============================================================================
@@ -491,6 +792,18 @@ class TestConvenienceFunctions:
         )
         
         assert isinstance(result, DecisionMetadata)
+    
+    def test_parse_decision_documents_function(self):
+        """Batch parsing should match single parsing, in input order."""
+        documents = [
+            (f"# ADR-00{i}: Use Redis\nAuthor: John Smith", f"ADR-00{i}.md")
+            for i in range(1, 5)
+        ]
+        
+        results = parse_decision_documents(documents, max_workers=2, chunksize=1)
+        
+        assert [r.decision_id for r in results] == ["ADR-001", "ADR-002", "ADR-003", "ADR-004"]
+        assert results[0].author == parse_decision_document(*documents[0]).author
 
 
 if __name__ == "__main__":
@@ -0,0 +1,318 @@
+"""
+Tests for the conversation memory module.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from memory.conversation_memory import ConversationMemoryManager
+
+
+class KeywordEmbeddings(Embeddings):
+    """Deterministic embeddings counting a few keywords."""
+    
+    KEYWORDS = ("redis", "kafka", "deploy", "python")
+    
+    def __init__(self):
+        self.embedded = 0
+    
+    def embed_documents(self, texts):
+        self.embedded += len(texts)
+        return [self.embed_query(text) for text in texts]
+    
+    def embed_query(self, text):
+        words = text.lower().split()
+        return [float(sum(word.startswith(k) for word in words)) + 0.01 for k in self.KEYWORDS]
+
+
+class TestConversationMemoryManager:
+    """Tests for ConversationMemoryManager history reads."""
+    
+    def test_history_reflects_new_turns(self):
+        """Repeated reads should be equal, and change once a turn is added."""
+        manager = ConversationMemoryManager(max_turns=3)
+        manager.add_exchange("s1", "first", "one")
+        
+        history = manager.get_history("s1")
+        history.append({"human": "injected"})
+        assert manager.get_history("s1") == manager.get_history("s1")
+        assert len(manager.get_history("s1")) == 1
+        
+        manager.add_exchange("s1", "second", "two")
+        assert [turn["human"] for turn in manager.get_history("s1")] == ["first", "second"]
+        assert [turn["human"] for turn in manager.get_history("s1", max_turns=1)] == ["second"]
+        
+        manager.clear_history("s1")
+        assert manager.get_history("s1") == []
+    
+    def test_relevant_history(self, tmp_path):
+        """Relevance reads should pick matching turns, in conversation order."""
+        path = tmp_path / "sessions.jsonl"
+        embeddings = KeywordEmbeddings()
+        manager = ConversationMemoryManager(persist_path=str(path), embeddings=embeddings)
+        manager.add_exchange("s1", "Why redis?", "Redis was fastest")
+        manager.add_exchange("s1", "How do we deploy?", "Deploy with the pipeline")
+        manager.add_exchange("s1", "Kafka or redis streams?", "Kafka")
+        manager.add_exchange("s1", "Which python version?", "Python 3.11")
+        manager.close()
+        
+        relevant = manager.get_relevant_history("s1", "tell me about redis", k=2)
+        
+        assert [turn["human"] for turn in relevant] == ["Why redis?", "Kafka or redis streams?"]
+        assert embeddings.embedded == 4
+        
+        # Restored turns are embedded in one batch on first use
+        reloaded = ConversationMemoryManager(persist_path=str(path), embeddings=embeddings)
+        assert reloaded.get_relevant_history("s1", "how to deploy", k=1)[0]["human"] == "How do we deploy?"
+        assert embeddings.embedded == 8
+        
+        with pytest.raises(ValueError):
+            ConversationMemoryManager().get_relevant_history("s1", "redis")
+    
+    def test_relevant_history_embeds_without_session_lock(self, tmp_path):
+        """Restored turns should be embedded without blocking the session."""
+        path = tmp_path / "sessions.jsonl"
+        manager = ConversationMemoryManager(persist_path=str(path))
+        for i in range(4):
+            manager.add_exchange("s1", f"question {i}", f"answer {i}")
+        manager.close()
+        
+        class LockCheckingEmbeddings(KeywordEmbeddings):
+            def embed_documents(self, texts):
+                locked.append(reloaded._session_locks["s1"].locked())
+                return super().embed_documents(texts)
+        
+        locked = []
+        reloaded = ConversationMemoryManager(
+            persist_path=str(path), embeddings=LockCheckingEmbeddings()
+        )
+        reloaded.get_relevant_history("s1", "question", k=1)
+        
+        assert locked == [False]
+    
+    def test_format_history_as_string(self):
+        """Formatted history should keep only the most recent turns."""
+        manager = ConversationMemoryManager(max_turns=2)
+        assert manager.format_history_as_string("s1") == ""
+        for i in range(3):
+            manager.add_exchange("s1", f"question {i}", f"answer {i}")
+        
+        assert manager.format_history_as_string("s1") == (
+            "Human: question 1\nAssistant: answer 1\n"
+            "Human: question 2\nAssistant: answer 2"
+        )
+        assert manager.format_history_as_string("s1", max_turns=1) == (
+            "Human: question 2\nAssistant: answer 2"
+        )
+    
+    def test_summarizes_evicted_turns(self, tmp_path):
+        """Evicted turns should be folded into a summary that survives reloads."""
+        def summarizer(turns, summary):
+            return " ".join(filter(None, [summary] + [turn.human_message for turn in turns]))
+        
+        path = tmp_path / "sessions.jsonl"
+        manager = ConversationMemoryManager(
+            max_turns=1, persist_path=str(path), summarizer=summarizer
+        )
+        for i in range(3):
+            manager.add_exchange("s1", f"question {i}", f"answer {i}")
+        manager.close()
+        
+        expected = (
+            "Summary of earlier conversation: question 0 question 1\n"
+            "Human: question 2\nAssistant: answer 2"
+        )
+        assert manager.format_history_as_string("s1") == expected
+        reloaded = ConversationMemoryManager(max_turns=1, persist_path=str(path))
+        assert reloaded.format_history_as_string("s1") == expected
+
+
+class TestConversationMemoryPersistence:
+    """Tests for ConversationMemoryManager persistence."""
+    
+    def test_reload_replays_log(self, tmp_path):
+        """A new manager should see the same sessions as the one that wrote them."""
+        path = tmp_path / "sessions.jsonl"
+        manager = ConversationMemoryManager(max_turns=2, persist_path=str(path))
+        for i in range(3):
+            manager.add_exchange("s1", f"question {i}", f"answer {i}")
+        manager.add_exchange("s2", "hello", "hi")
+        manager.add_exchange("s3", "bye", "goodbye")
+        manager.clear_history("s2")
+        manager.delete_session("s3")
+        manager.close()
+        
+        reloaded = ConversationMemoryManager(max_turns=2, persist_path=str(path))
+        
+        assert reloaded.list_sessions() == ["s1", "s2"]
+        assert reloaded.get_history("s1") == manager.get_history("s1")
+        assert [turn["human"] for turn in reloaded.get_history("s1")] == ["question 1", "question 2"]
+        assert reloaded.get_history("s2") == []
+    
+    def test_appends_one_line_per_exchange(self, tmp_path):
+        """Each exchange should append to the log rather than rewrite it."""
+        path = tmp_path / "sessions.jsonl"
+        manager = ConversationMemoryManager(persist_path=str(path))
+        manager.add_exchange("s1", "first", "one")
+        manager.flush()
+        size = path.stat().st_size
+        
+        manager.add_exchange("s1", "second", "two")
+        manager.flush()
+        
+        lines = path.read_bytes().splitlines()
+        assert len(lines) == 3  # session record and two turns
+        assert path.read_bytes()[:size] == b"\n".join(lines[:2]) + b"\n"
+        assert json.loads(lines[-1])["turn"]["human"] == "second"
+    
+    def test_flushes_buffered_appends(self, tmp_path):
+        """Buffered appends should reach the log within the flush interval."""
+        path = tmp_path / "sessions.jsonl"
+        manager = ConversationMemoryManager(persist_path=str(path), flush_interval=0.05)
+        manager.add_exchange("s1", "first", "one")
+        
+        deadline = time.monotonic() + 5
+        while len(path.read_bytes().splitlines()) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(path.read_bytes().splitlines()) == 2
+    
+    def test_durable_appends_are_written_immediately(self, tmp_path):
+        """Durable managers should not buffer appends."""
+        path = tmp_path / "sessions.jsonl"
+        manager = ConversationMemoryManager(persist_path=str(path), durable=True, flush_interval=60)
+        manager.add_exchange("s1", "first", "one")
+        
+        assert len(path.read_bytes().splitlines()) == 2
+    
+    def test_compacts_log(self, tmp_path):
+        """The log should be rewritten once it is mostly superseded records."""
+        path = tmp_path / "sessions.jsonl"
+        manager = ConversationMemoryManager(max_turns=1, persist_path=str(path))
+        manager.COMPACT_MIN_RECORDS = 10
+        manager._compact_at = 10
+        for i in range(50):
+            manager.add_exchange("s1", f"question {i}", f"answer {i}")
+            # Let each compaction finish so the log size does not depend on timing
+            if manager._compactor is not None:
+                manager._compactor.join()
+        manager.close()
+        
+        assert len(path.read_bytes().splitlines()) < 20
+        reloaded = ConversationMemoryManager(max_turns=1, persist_path=str(path))
+        assert reloaded.get_history("s1") == manager.get_history("s1")
+    
+    def test_compact_during_background_compaction(self, tmp_path):
+        """An explicit compaction should not clobber a background one."""
+        path = tmp_path / "sessions.jsonl"
+        manager = ConversationMemoryManager(max_turns=1, persist_path=str(path))
+        manager.add_exchange("idle", "hello", "hi")
+        
+        write_snapshot = manager._write_snapshot
+        def slow_write_snapshot(data):
+            time.sleep(0.2)
+            return write_snapshot(data)
+        manager._write_snapshot = slow_write_snapshot
+        
+        manager.COMPACT_MIN_RECORDS = 10
+        manager._compact_at = 10
+        for i in range(50):
+            manager.add_exchange("s1", f"question {i}", f"answer {i}")
+        assert manager._compactor is not None
+        manager.compact()
+        manager.close()
+        
+        reloaded = ConversationMemoryManager(max_turns=1, persist_path=str(path))
+        assert sorted(reloaded.list_sessions()) == ["idle", "s1"]
+        assert reloaded.get_history("idle") == manager.get_history("idle")
+        assert reloaded.get_history("s1") == manager.get_history("s1")
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["sessions.jsonl"]
+    
+    def test_loads_legacy_json(self, tmp_path):
+        """Sessions saved as one JSON object should load and be converted."""
+        path = tmp_path / "sessions.json"
+        path.write_text(json.dumps({
+            "s1": {
+                "session_id": "s1",
+                "turns": [{"human": "hello", "ai": "hi", "timestamp": "2024-01-01T00:00:00"}],
+            },
+        }, indent=2))
+        
+        manager = ConversationMemoryManager(persist_path=str(path))
+        
+        assert manager.get_history("s1")[0]["human"] == "hello"
+        assert manager.get_history("s1")[0]["timestamp"] == "2024-01-01T00:00:00"
+        manager.close()
+        assert json.loads(path.read_bytes().splitlines()[0])["sid"] == "s1"
+        assert ConversationMemoryManager(persist_path=str(path)).get_history("s1") == manager.get_history("s1")
+    
+    def test_skips_truncated_record(self, tmp_path):
+        """A line cut short by a crash should not lose the rest of the log."""
+        path = tmp_path / "sessions.jsonl"
+        manager = ConversationMemoryManager(persist_path=str(path))
+        manager.add_exchange("s1", "hello", "hi")
+        manager.close()
+        with open(path, "ab") as f:
+            f.write(b'{"sid":"s1","turn":{"hu')
+        
+        reloaded = ConversationMemoryManager(persist_path=str(path))
+        reloaded.add_exchange("s1", "again", "hello again")
+        reloaded.close()
+        
+        assert reloaded.get_history("s1")[0] == manager.get_history("s1")[0]
+        assert ConversationMemoryManager(persist_path=str(path)).get_history("s1") == reloaded.get_history("s1")
+    
+    def test_concurrent_exchanges(self, tmp_path):
+        """Exchanges from many threads should all be kept and logged in order."""
+        path = tmp_path / "sessions.jsonl"
+        manager = ConversationMemoryManager(max_turns=100, persist_path=str(path))
+        
+        def worker(n):
+            for i in range(50):
+                manager.add_exchange(f"s{n % 4}", f"question {n}-{i}", "answer")
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        manager.close()
+        
+        reloaded = ConversationMemoryManager(max_turns=100, persist_path=str(path))
+        assert sorted(reloaded.list_sessions()) == ["s0", "s1", "s2", "s3"]
+        for session_id in manager.list_sessions():
+            assert len(manager.get_history(session_id)) == 100
+            assert reloaded.get_history(session_id) == manager.get_history(session_id)
+    
+    def test_session_logged_before_first_turn(self, tmp_path):
+        """A turn added while its session is being created should survive a reload."""
+        path = tmp_path / "sessions.jsonl"
+        manager = ConversationMemoryManager(persist_path=str(path))
+        racer = threading.Thread(target=manager.add_exchange, args=("s1", "second", "two"))
+        
+        class RacingLock:
+            """Log lock racing a second exchange against the first write."""
+            
+            def __init__(self, lock):
+                self.lock = lock
+            
+            def __enter__(self):
+                if racer.ident is None:
+                    racer.start()
+                    racer.join(timeout=0.5)
+                return self.lock.__enter__()
+            
+            def __exit__(self, *exc):
+                return self.lock.__exit__(*exc)
+        
+        manager._persist_lock = RacingLock(manager._persist_lock)
+        manager.add_exchange("s1", "creator", "one")
+        racer.join()
+        manager.close()
+        
+        reloaded = ConversationMemoryManager(persist_path=str(path))
+        assert len(manager.get_history("s1")) == 2
+        assert reloaded.get_history("s1") == manager.get_history("s1")